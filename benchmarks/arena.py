@@ -0,0 +1,66 @@
+"""
+Measure the cost of temporary native memory taken from an Arena.
+
+Each case allocates an out-parameter cell and a C string, as done around
+a foreign call, and is compared to creating the same objects with plain
+ctypes, and as C instances.
+"""
+import ctypes
+import timeit
+
+from multitools.external import Arena, Int, Str
+
+
+NUMBER = 20_000
+REPEAT = 5
+
+arena = Arena()
+
+
+def plain_ctypes():
+    return ctypes.c_int(), ctypes.create_string_buffer(b"key")
+
+
+def arena_ctypes():
+    with arena:
+        return arena.alloc(ctypes.c_int), arena.buffer(4)
+
+
+def arena_rollback():
+    start = arena.mark()
+    cells = arena.alloc(ctypes.c_int), arena.buffer(4)
+    arena.rollback(start)
+    return cells
+
+
+def plain_ctype():
+    return Int(0), Str("key")
+
+
+def arena_ctype():
+    with arena:
+        return arena.alloc(Int), arena.string("key", "utf-8")
+
+
+def measure(func):
+    """
+    Return the time taken by one call of func in microseconds.
+    """
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main():
+    cases = [
+        ("plain ctypes", plain_ctypes),
+        ("arena ctypes", arena_ctypes),
+        ("arena rollback", arena_rollback),
+        ("C instances", plain_ctype),
+        ("arena C instances", arena_ctype),
+    ]
+
+    for case, func in cases:
+        print(f"{case:>18}: {measure(func):6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Measure the memory held by C instances, using tracemalloc.
+
+The overhead reported is what a C instance costs on top
+of the bare ctypes object it wraps.
+"""
+import ctypes
+import gc
+import tracemalloc
+
+from multitools.external import Int, Double
+
+
+COUNT = 100_000
+
+
+def measure(factory, count=COUNT):
+    """
+    Return the average number of bytes allocated per object
+    created by factory(i).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = [None] * count
+        start = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            objects[i] = factory(i)
+        end = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (end - start) / count
+
+
+def main():
+    for name, ctype, factory in (
+        ("int", ctypes.c_int, Int),
+        ("double", ctypes.c_double, lambda i: Double(float(i))),
+    ):
+        bare = measure(lambda i: ctype(i))
+        wrapped = measure(factory)
+        print(f"{name:>8}: {wrapped:8.1f} bytes/object, {wrapped - bare:8.1f} bytes of overhead")
+
+
+if __name__ == "__main__":
+    main()
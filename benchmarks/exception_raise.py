@@ -0,0 +1,44 @@
+"""
+Measure the raise/catch throughput of multitools exceptions.
+
+Each exception is compared to raising its plain builtin base,
+and the number of distinct exception classes created during
+the run is reported.
+"""
+import time
+
+from multitools.errors import AccessViolationError, NullReferenceError
+
+
+COUNT = 200_000
+
+
+def measure(error_type, count=COUNT):
+    """
+    Return the number of exceptions raised and caught per second,
+    and the set of the types of the exceptions caught.
+    """
+    types = set()
+    start = time.perf_counter()
+    for _ in range(count):
+        try:
+            raise error_type("NULL reference.")
+        except error_type as e:
+            types.add(type(e))
+    elapsed = time.perf_counter() - start
+    return count / elapsed, types
+
+
+def main():
+    for name, error_type, builtin in (
+        ("NullReferenceError", NullReferenceError, ReferenceError),
+        ("AccessViolationError", AccessViolationError, OSError),
+    ):
+        rate, types = measure(error_type)
+        bare, _ = measure(builtin)
+        print(f"{name:>20}: {rate:12,.0f} raises/s ({rate / bare:5.2f}x the builtin), "
+              f"{len(types)} class(es) created")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Measure the time taken to import the multitools packages.
+
+Each statement is run in a fresh interpreter with '-X importtime', and
+the cumulative time of the imports it triggers is compared to a budget.
+Some statements must also leave heavy modules unloaded, as short-lived
+programs only needing multitools.io shouldn't pay for the FFI types.
+Exits with status 1 if a budget is exceeded.
+"""
+import os
+import subprocess
+import sys
+
+
+REPEAT = 5
+
+CASES = (
+    # (statement, budget in ms, modules that must not be imported)
+    ("import multitools", 5, ("multitools._meta", "multitools._type_check")),
+    ("import multitools.io", 60, ("multitools.external", "multitools.system")),
+    ("from multitools.io import print; print('')", 60, ("multitools.external", "multitools.system")),
+    ("import multitools.system", 10, ("multitools._meta", "multitools.system._external")),
+    ("import multitools.functional", 60, ("multitools.system", "multitools.functional._adminfunc")),
+    ("import multitools.external", 60, ("multitools.external._types", "multitools.external._library")),
+    ("import multitools.external; multitools.external.Int", 60, ("multitools.external._process",)),
+    ("from multitools.external import *", 150, ()),
+)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env():
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (_ROOT, os.environ.get('PYTHONPATH')))))
+
+
+def _run(statement):
+    """
+    Run statement in a fresh interpreter, and return the cumulative import
+    times of the top-level modules it imported, in microseconds, by name.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, env=_env(), check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):  # top-level imports only
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(statement, startup, repeat=REPEAT):
+    """
+    Return the best import time of statement in milliseconds, not counting
+    the modules imported at startup, and the names of the modules it imported.
+    """
+    best = None
+    modules = set()
+    for _ in range(repeat):
+        times = _run(statement)
+        modules.update(times)
+        elapsed = sum(cumulative for name, cumulative in times.items() if name not in startup) / 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, modules
+
+
+def imported(statement):
+    """
+    Return the names of all the modules loaded after running statement.
+    """
+    code = f"{statement}\nimport sys; print(*sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=_env(), check=True)
+    return set(result.stdout.split())
+
+
+def main():
+    startup = set(_run("pass"))
+    failed = False
+    for statement, budget, forbidden in CASES:
+        elapsed, _ = measure(statement, startup)
+        loaded = sorted(imported(statement).intersection(forbidden))
+        ok = elapsed <= budget and not loaded
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':>4} {elapsed:7.1f} ms (budget {budget:>3} ms)  {statement}")
+        if loaded:
+            print(f"{'':>5}unexpectedly imported: {', '.join(loaded)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
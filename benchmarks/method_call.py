@@ -0,0 +1,62 @@
+"""
+Measure the cost of calling methods of MultiMeta classes.
+
+Overrides of abstract methods are compared to the same methods
+of plain classes, and calls through the io buffers are reported.
+"""
+import timeit
+
+from multitools._meta import MultiMeta, AbstractMethodDescriptor as abstractmethod
+from multitools.io import BytesBuffer
+
+
+NUMBER = 1_000_000
+
+
+class AbstractBase(metaclass=MultiMeta):
+    @abstractmethod
+    def run(self, value): ...
+
+
+class Concrete(AbstractBase, metaclass=MultiMeta):
+    def run(self, value):
+        return value
+
+
+class Sibling(AbstractBase, metaclass=MultiMeta):
+    def run(self, value):
+        return -value
+
+
+class PlainBase:
+    def run(self, value):
+        raise NotImplementedError
+
+
+class Plain(PlainBase):
+    def run(self, value):
+        return value
+
+
+def measure(stmt, namespace, number=NUMBER):
+    """
+    Return the time taken by a single execution of stmt, in nanoseconds.
+    """
+    return min(timeit.repeat(stmt, globals=namespace, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    namespace = {'concrete': Concrete(), 'sibling': Sibling(), 'plain': Plain(), 'buffer': BytesBuffer()}
+    plain = measure("plain.run(1)", namespace)
+    for name, stmt in (
+        ("abstract override", "concrete.run(1)"),
+        ("sibling override", "sibling.run(1)"),
+        ("plain class", "plain.run(1)"),
+        ("BytesBuffer.write", "buffer.write(b'')"),
+    ):
+        elapsed = measure(stmt, namespace)
+        print(f"{name:>18}: {elapsed:7.1f} ns/call ({elapsed / plain:5.2f}x plain)")
+
+
+if __name__ == "__main__":
+    main()
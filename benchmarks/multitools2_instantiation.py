@@ -0,0 +1,68 @@
+"""
+Measure the instantiation throughput of multitools2 classes.
+
+Classes with a few fields and an __init__ are compared to the
+same classes written as plain python classes.
+"""
+import timeit
+
+from multitools2 import MultiMeta
+
+
+NUMBER = 500_000
+
+
+class Record(metaclass=MultiMeta):
+    __fields__ = ["name", "value", "tags"]
+    value = 0
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Child(Record, metaclass=MultiMeta):
+    __fields__ = ["parent"]
+
+
+class Empty(metaclass=MultiMeta):
+    pass
+
+
+class PlainRecord:
+    def __init__(self, name):
+        self.name = name
+        self.value = 0
+        self.tags = None
+
+
+class PlainChild(PlainRecord):
+    def __init__(self, name):
+        super().__init__(name)
+        self.parent = None
+
+
+class PlainEmpty:
+    pass
+
+
+def measure(stmt, namespace, number=NUMBER):
+    """
+    Return the number of executions of stmt per second.
+    """
+    return number / min(timeit.repeat(stmt, globals=namespace, number=number, repeat=5))
+
+
+def main():
+    namespace = globals()
+    for name, stmt, plain_stmt in (
+        ("empty class", "Empty()", "PlainEmpty()"),
+        ("fields + __init__", "Record('a')", "PlainRecord('a')"),
+        ("inherited fields", "Child('a')", "PlainChild('a')"),
+    ):
+        rate = measure(stmt, namespace)
+        plain = measure(plain_stmt, namespace)
+        print(f"{name:>18}: {rate:12,.0f} instances/s ({rate / plain:5.2f}x plain)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure the size and speed of pickling C instances and multitools2 instances.
+
+Lists of instances are pickled and unpickled as they would be when sent
+to process pool workers, and compared to the same values as raw ctypes
+objects and plain python classes.
+"""
+import ctypes
+import pickle
+import timeit
+
+from multitools.external import Int, Double, Struct
+from multitools2 import MultiMeta
+
+
+COUNT = 10_000
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+Point = Struct[('x', Int), ('y', Double)]
+
+
+class Record(metaclass=MultiMeta):
+    __fields__ = ["name", "value", "tags"]
+    value = 0
+
+    def __init__(self, name):
+        self.name = name
+
+
+class SlottedRecord(metaclass=MultiMeta, slots=True):
+    __fields__ = ["name", "value", "tags"]
+    value = 0
+
+    def __init__(self, name):
+        self.name = name
+
+
+class PlainRecord:
+    def __init__(self, name):
+        self.name = name
+        self.value = 0
+        self.tags = None
+
+
+def measure(values):
+    """
+    Return the payload size per value in bytes, and the time taken
+    to pickle and unpickle one value in microseconds.
+    """
+    data = pickle.dumps(values, PROTOCOL)
+    elapsed = min(timeit.repeat(lambda: pickle.loads(pickle.dumps(values, PROTOCOL)), number=1, repeat=5))
+    return len(data) / len(values), elapsed / len(values) * 1e6
+
+
+def main():
+    for name, values in (
+        ("Int", [Int(i) for i in range(COUNT)]),
+        ("ctypes.c_int", [ctypes.c_int(i) for i in range(COUNT)]),
+        ("Int[False, 'big']", [Int[False, 'big'](i) for i in range(COUNT)]),
+        ("Struct", [Point(i, i / 2) for i in range(COUNT)]),
+        ("Record", [Record(str(i)) for i in range(COUNT)]),
+        ("slotted Record", [SlottedRecord(str(i)) for i in range(COUNT)]),
+        ("plain Record", [PlainRecord(str(i)) for i in range(COUNT)]),
+    ):
+        size, elapsed = measure(values)
+        print(f"{name:>18}: {size:6.1f} bytes/value, {elapsed:6.2f} us/value")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+
+__version__ = "1.0.9"
+
+from ._lazy import lazy_attributes as _lazy_attributes
+
+# subpackages and type check settings are loaded on first access:
+__getattr__, __dir__ = _lazy_attributes(__name__, globals(), {
+    "classes": (".classes", None),
+    "errors": (".errors", None),
+    "external": (".external", None),
+    "external2": (".external2", None),
+    "functional": (".functional", None),
+    "io": (".io", None),
+    "system": (".system", None),
+    "set_typecheck_policy": ("._type_check", "set_policy"),
+    "get_typecheck_policy": ("._type_check", "get_policy"),
+    "typecheck_stats": ("._type_check", "check_stats"),
+})
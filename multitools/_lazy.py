@@ -0,0 +1,28 @@
+import importlib
+
+
+def lazy_attributes(package, namespace, attributes):
+    """
+    Return the __getattr__ and __dir__ functions of a package whose attributes
+    are loaded on first access, as described in PEP 562.
+
+    'attributes' maps the public names of the package to (module, name) pairs,
+    'module' being relative to the package. If 'name' is None, the module itself
+    is the attribute. Loaded attributes are stored in the namespace of the package,
+    so that __getattr__ is only called once per name.
+    """
+    def __getattr__(name):
+        try:
+            module, attribute = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
+        value = importlib.import_module(module, package)
+        if attribute is not None:
+            value = getattr(value, attribute)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace).union(attributes))
+
+    return __getattr__, __dir__
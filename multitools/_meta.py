@@ -1,8 +1,6 @@
 import sys
 if sys.version_info.major != 3:
     raise NotImplementedError("This library only supports python 3.")
-if sys.platform != "win32":
-    raise NotImplementedError("This library only supports the Windows platform.")
 
 
 if sys.version_info.minor >= 10:
@@ -10,6 +10,7 @@ class ClassData:
     abstract: bool
     cls_dict: dict[str, Any]
     superclass: type
+    abstract_methods: frozenset[str] = ...
 
     def __repr__(self) -> str: ...
 
@@ -38,6 +39,8 @@ class MultiMeta(type):
     def __init__(cls, name: str, bases: tuple[type], dct: dict[str, Any]) -> None:
         cls.__data__: ClassData = ...
     def __repr__(cls) -> str: ...
+    def __setattr__(cls, key: str, value: Any) -> None: ...
+    def __delattr__(cls, item: str) -> None: ...
     def __instancecheck__(cls, instance: object) -> bool: ...
     def __subclasscheck__(cls, subclass: type) -> bool: ...
 
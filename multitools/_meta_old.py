@@ -90,13 +90,41 @@ class AbstractMethodDescriptor:
     __kwdefaults__ = property(lambda self: self._function.__kwdefaults__ if hasattr(self._function, "__kwdefaults__") else {})
 
 
+_version = 0
+"""Incremented whenever a MultiMeta class is created or mutated."""
+_checks = {}
+"""The cached results of isinstance() and issubclass() on MultiMeta classes."""
+_checks_version = 0
+_CHECKS_SIZE = 4096
+
+
+def _check(cls, hook, other, key):
+    """
+    Internal function computing the result of cls.<hook>(other)
+    and caching it by key, until a MultiMeta class is created or mutated.
+    """
+    global _checks_version
+    if _checks_version != _version or len(_checks) >= _CHECKS_SIZE:
+        _checks.clear()
+        _checks_version = _version
+    result = getattr(cls, hook)(other) if hasattr(cls, hook) else False
+    try:
+        _checks[key] = result
+    except TypeError:  # unhashable, can't be cached
+        pass
+    return result
+
+
 @dataclass
 class ClassData:
     name: str
     bases: tuple[type]
     abstract: bool
     cls_dict: dict[str, Any]
+    """The class' own entries. Inherited ones are resolved through the MRO."""
     superclass: type
+    abstract_methods: frozenset[str] = frozenset()
+    """The names of the abstract methods left to override by child classes."""
 
     def __repr__(self):
         return f"<data descriptor of class '{self.name}'>"
@@ -110,7 +138,7 @@ class MultiMeta(type):
 
     Changes::
     - access to abstract method functionality
-    - all attributes inherited from parent classes are directly copied to the class __dict__
+    - class data describing the class' own attributes and pending abstract methods
 
     Abstract method functionality::
 
@@ -129,41 +157,42 @@ class MultiMeta(type):
     def __init__(cls, name, bases, dct):
         """
         Create a new class and manage attributes.
-        Copy attributes from parent classes while managing whether the class
-        is abstract or not. Also manage abstract methods and their overriding.
+        Inherited attributes are left to the MRO, only the abstract methods
+        left to override are tracked. Also manage abstract methods and their overriding.
         """
+        global _version
+        _version += 1
         cls_name = name
         cls_bases = bases if len(bases) > 0 else (object,)
         cls_super = bases[0] if len(bases) > 0 else object
-        cls_is_abstract = False
         cls_dict = dct
-        bases_dict = {}
 
-        # merge all dictionaries from the class bases:
+        # collect the abstract methods the bases leave to override:
+        inherited_abstract = set()
         for base in bases:
-            bases_dict = {**bases_dict, **base.__dict__}
+            data = getattr(base, '__data__', None)
+            if isinstance(data, ClassData):
+                inherited_abstract.update(data.abstract_methods)
+            else:
+                inherited_abstract.update(key for key, item in vars(base).items()
+                                          if isinstance(item, AbstractMethodDescriptor))
 
-        # resolve abstract methods:
+        # resolve abstract methods. Overrides stay in the class' own namespace,
+        # so that calls reach them directly and the descriptors of the bases are
+        # never modified:
+        own_abstract = set()
         for key, item in cls_dict.items():
-            if key in bases_dict:
-                if isinstance(bases_dict[key], AbstractMethodDescriptor):
-                    temp = bases_dict[key]
-                    temp.override(item)
-                    cls_dict[key] = temp
-            else:
-                if isinstance(item, AbstractMethodDescriptor):
-                    cls_is_abstract = True
+            if isinstance(item, AbstractMethodDescriptor):
+                own_abstract.add(key)
+        cls_is_abstract = len(own_abstract) > 0
 
-        # merge bases dictionaries with actual class dictionary:
-        for key, item in bases_dict.items():
-            if key not in cls_dict:
-                if isinstance(item, AbstractMethodDescriptor):
-                    if not cls_is_abstract:
-                        raise ValueError(f"Abstract method '{key}' missing override.")
-                cls_dict[key] = item
+        missing = inherited_abstract.difference(cls_dict)
+        if missing and not cls_is_abstract:
+            raise ValueError(f"Abstract method '{min(missing)}' missing override.")
 
         # store the data & type.__init__():
-        cls.__data__ = ClassData(cls_name, cls_bases, cls_is_abstract, cls_dict, cls_super)
+        cls.__data__ = ClassData(cls_name, cls_bases, cls_is_abstract, cls_dict, cls_super,
+                                 frozenset(own_abstract | missing))
         super().__init__(cls_name, cls_bases, cls_dict)
         # if class is abstract, forbid usage of __init__, using a wrapper:
         if cls_is_abstract:
@@ -191,13 +220,30 @@ class MultiMeta(type):
             return cls.__class_getitem__(item)
         return cls
 
+    def __setattr__(cls, key, value):
+        global _version
+        _version += 1
+        super().__setattr__(key, value)
+
+    def __delattr__(cls, item):
+        global _version
+        _version += 1
+        super().__delattr__(item)
+
     def __instancecheck__(cls, instance):
-        if hasattr(cls, "__class_instancecheck__"):
-            return cls.__class_instancecheck__(instance)
-        return False
+        # results only depend on the type of the instance, so they are cached by type:
+        key = (cls, type(instance))
+        result = _checks.get(key) if _checks_version == _version else None
+        if result is None:
+            result = _check(cls, "__class_instancecheck__", instance, key)
+        return result
 
     def __subclasscheck__(cls, subclass):
-        if hasattr(cls, "__class_subclasscheck__"):
-            return cls.__class_subclasscheck__(subclass)
-        return False
-
+        key = (cls, subclass, None)
+        try:
+            result = _checks.get(key) if _checks_version == _version else None
+        except TypeError:  # unhashable, can't be cached
+            result = None
+        if result is None:
+            result = _check(cls, "__class_subclasscheck__", subclass, key)
+        return result
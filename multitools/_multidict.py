@@ -7,3 +7,79 @@ class MultiDict(dict):
     def __setattr__(self, key, value):
         self[key] = value
 
+
+
+_MISSING = object()
+
+
+class SlotTable:
+    """
+    A fixed-layout view over a list of values, with
+    the same access rules as MultiDict.
+
+    The keys are declared once by the owner type and are
+    shared by every table, so only the values are stored
+    per object. Missing values raise KeyError.
+    """
+    __slots__ = ('_keys', '_values')
+
+    def __init__(self, keys, values):
+        object.__setattr__(self, '_keys', keys)
+        object.__setattr__(self, '_values', values)
+
+    @staticmethod
+    def new_values(keys):
+        """
+        Return the storage a table over the given keys needs.
+        """
+        if len(keys) == 0:
+            return ()
+        return [_MISSING] * len(keys)
+
+    def _index(self, key):
+        try:
+            return self._keys.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __getitem__(self, key):
+        value = self._values[self._index(key)]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._values[self._index(key)] = value
+
+    def __delitem__(self, key):
+        self._values[self._index(key)] = _MISSING
+
+    def __getattr__(self, item):
+        return self[item]
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+    def __contains__(self, key):
+        return (key in self._keys) and (self._values[self._keys.index(key)] is not _MISSING)
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [key for key, value in zip(self._keys, self._values) if value is not _MISSING]
+
+    def items(self):
+        return [(key, value) for key, value in zip(self._keys, self._values) if value is not _MISSING]
+
+    def __repr__(self):
+        return f"SlotTable({dict(self.items())})"
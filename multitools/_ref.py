@@ -1,40 +1,82 @@
 from ._meta import *
 from ._type_check import typecheck
+import functools
+import operator
 
 
-def reference(target_name, default, writable=True):
+@functools.lru_cache(maxsize=None)
+def _compile_getter(target_name):
     """
-    A reference to another attribute of the current instance.
+    Internal function compiling a dotted attribute path into a getter.
+    """
+    return operator.attrgetter(target_name)
 
-    Will act as an instance attribute or a class attribute
-    depending on the context. Custom getters and setters are
-    triggered properly.
 
-    In case it fails, return default.
+@functools.lru_cache(maxsize=None)
+def _compile_setter(target_name):
     """
-    typecheck(target_name, (str,), target_name="target_name")
+    Internal function compiling a dotted attribute path into a setter.
+    Intermediate objects are assigned back to their owner once the
+    target is set, in case they are copies.
+    """
+    *path, last = target_name.split('.')
+    if not path:
+        def setter(obj, value):
+            setattr(obj, last, value)
+        return setter
+
+    getters = tuple(operator.attrgetter(name) for name in path)
+
+    def setter(obj, value):
+        chain = [obj]
+        for getter in getters:
+            chain.append(getter(chain[-1]))
+        setattr(chain[-1], last, value)
+        for index in range(len(path) - 1, -1, -1):
+            setattr(chain[index], path[index], chain[index + 1])
+    return setter
+
+
+_classes = {}
+"""reference classes, by base type."""
+
+
+def _reference_class(base):
+    """
+    Internal function returning the reference class inheriting from
+    base, creating it on first use. Types that can't be inherited
+    from, or instantiated without arguments, fall back to object.
+    """
+    cls = _classes.get(base)
+    if cls is not None:
+        return cls
 
-    # make sure we can inherit from type(default):
-    base = type(default)
     try:
-        class test(base):
-            pass
-        test()
+        cls = _make_class(base)
+        cls()
     except TypeError:
-        # if not, we will inherit from plain object:
-        base = object
+        cls = _classes.get(object) or _make_class(object)
+        _classes[object] = cls
+    _classes[base] = cls
+    return cls
 
-    # create the true 'reference' class as in the stub, with dynamic inheritance:
 
+def _make_class(base):
+    """
+    Internal function creating the true 'reference' class as in the
+    stub, with dynamic inheritance.
+    """
     # noinspection PyShadowingNames
     class reference(base, metaclass=MultiMeta):
         def __init__(self, *args, **kwargs):
             """
-            Initialize a new reference object with given target and default return value
+            Initialize a new reference object. Its target is bound by reference().
             """
-            self._target = target_name
-            self._default = default
-            self._writable = writable
+            self._target = ""
+            self._default = None
+            self._writable = True
+            self._getter = None
+            self._setter = None
 
         def __get__(self, instance, owner):
             """
@@ -42,50 +84,16 @@ def reference(target_name, default, writable=True):
             """
             if instance is None:
                 try:
-                    res = self._get_target(owner)
+                    res = self._getter(owner)
                     typecheck(res, (type(self._default),), target_name="default",
                               expected_type_name=type(res).__name__)
                     return res
-                except AttributeError:
-                    return self._default
-                except KeyError:
+                except (AttributeError, KeyError):
                     return self._default
             try:
-                res = self._get_target(instance)
-                # typecheck(res, (type(self._default),), target_name="default",
-                          # expected_type_name=type(res).__name__)
-                return res
-            except AttributeError:
+                return self._getter(instance)
+            except (AttributeError, KeyError):
                 return self._default
-            except KeyError:
-                return self._default
-
-        def _get_target(self, obj):
-            """
-            Internal method for reading dotted format
-            and referencing the right attribute.
-            """
-            name = self._target
-            if ('.' in name) and len(name.split('.')) == 2:
-                path = name.split('.')
-                owner = getattr(obj, path[0])
-                result = getattr(owner, path[1])
-                return result
-            return getattr(obj, name)
-
-        def _set_target(self, obj, value):
-            """
-            Internal method for reading dotted format of name
-            and assigning the right attribute to value.
-            """
-            name = self._target
-            if ('.' in name) and len(name.split('.')) == 2:
-                path = name.split('.')
-                temp = getattr(obj, path[0])
-                setattr(temp, path[1], value)
-                setattr(obj, path[0], temp)
-                return
-            setattr(obj, name, value)
 
         def __set__(self, instance, value):
             """
@@ -93,7 +101,7 @@ def reference(target_name, default, writable=True):
             """
             if self._writable:
                 try:
-                    self._set_target(instance, value)
+                    self._setter(instance, value)
                 except AttributeError:
                     pass
                 return
@@ -105,5 +113,25 @@ def reference(target_name, default, writable=True):
             """
             return f"<reference on '{self._target}' attribute at {str(hex(id(self)))}>"
 
-    return reference()
+    return reference
+
+
+def reference(target_name, default, writable=True):
+    """
+    A reference to another attribute of the current instance.
+
+    Will act as an instance attribute or a class attribute
+    depending on the context. Custom getters and setters are
+    triggered properly. Dotted targets of any depth are supported.
+
+    In case it fails, return default.
+    """
+    typecheck(target_name, (str,), target_name="target_name")
 
+    self = _reference_class(type(default))()
+    self._target = target_name
+    self._default = default
+    self._writable = writable
+    self._getter = _compile_getter(target_name)
+    self._setter = _compile_setter(target_name)
+    return self
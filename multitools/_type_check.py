@@ -1,48 +1,525 @@
+import array
+import ctypes
+import functools
+import itertools
+import os
+import sys
+import threading
+import types
+import typing
 
 
-def typecheck(target, expected_types=(object,), target_name=None, expected_type_name=None, check_func=None):
+__all__ = [
+    "typecheck",
+    "typecheck_many",
+    "typechecked",
+    "Checker",
+    "set_policy",
+    "get_policy",
+    "check_stats",
+    "reset_check_stats",
+    "FULL",
+    "SAMPLED",
+    "OFF",
+]
 
-    def default_check():
-        result = False
-        for tp in expected_types:
-            if not isinstance(tp, type):
-                raise TypeError(f"'expected_types': expected type 'tuple[type]', got 'tuple[{type(tp).__name__}]' instead.")
-            if isinstance(target, tp):
 
-                result = True
-                break
+FULL = 'full'
+"""Perform every type check."""
+SAMPLED = 'sampled'
+"""Perform one type check in N, per call site."""
+OFF = 'off'
+"""Perform no type check."""
+
+ENVIRON_KEY = "MULTITOOLS_TYPECHECK"
+"""
+The environment variable setting the initial policy, as comma-separated
+entries: a global mode, and module overrides of the form 'module=mode'.
+Sampled modes may give their rate, as in 'sampled:100'.
+"""
+DEFAULT_SAMPLE_RATE = 100
+
+_MODES = (FULL, SAMPLED, OFF)
+
+_ALL_FULL = 0
+_ALL_OFF = 1
+_MIXED = 2
+
+
+class _Policy:
+    """
+    Internal class holding the process-wide type check policy.
+    Its version changes with the policy, so that call sites know
+    when to resolve their own mode again.
+    """
+    def __init__(self):
+        self.mode = FULL
+        self.rate = DEFAULT_SAMPLE_RATE
+        self.overrides = {}
+        self.version = 0
+        self.state = _ALL_FULL
+        """Whether the same mode applies everywhere, for fast paths."""
+        self.lock = threading.Lock()
+
+    def resolve(self, module):
+        """
+        Return the (mode, rate) applying to module, using the override
+        of its closest package if any.
+        """
+        name = module or ''
+        while True:
+            override = self.overrides.get(name)
+            if override is not None:
+                return override
+            if '.' not in name:
+                return self.mode, self.rate
+            name = name.rpartition('.')[0]
+
+    def changed(self):
+        self.version += 1
+        modes = {self.mode} | {mode for mode, _ in self.overrides.values()}
+        if modes == {FULL}:
+            self.state = _ALL_FULL
+        elif modes == {OFF}:
+            self.state = _ALL_OFF
+        else:
+            self.state = _MIXED
+
+
+_policy = _Policy()
+_counters = [0, 0]
+"""The number of type checks performed and skipped."""
+
+
+def _parse_mode(text):
+    mode, _, rate = text.strip().partition(':')
+    mode = mode.strip().lower()
+    if mode not in _MODES:
+        raise ValueError(f"Unknown type check mode '{mode}', expected one of {list(_MODES)}.")
+    return mode, int(rate) if rate else DEFAULT_SAMPLE_RATE
+
+
+def set_policy(mode, sample_rate=None, module=None):
+    """
+    Set the type check mode of multitools: FULL, SAMPLED or OFF.
+    Sampled checks are performed once every sample_rate calls of
+    each call site. If module is given, the mode only applies to
+    it and its submodules, overriding the global mode; a mode of
+    None then removes the override.
+    """
+    if not isinstance(mode, (str, type(None))):
+        raise TypeError(f"'mode': expected type 'str', got '{type(mode).__name__}' instead.")
+    if not isinstance(sample_rate, (int, type(None))):
+        raise TypeError(f"'sample_rate': expected type 'int', got '{type(sample_rate).__name__}' instead.")
+    if not isinstance(module, (str, types.ModuleType, type(None))):
+        raise TypeError(f"'module': expected type 'str', got '{type(module).__name__}' instead.")
+    if isinstance(module, types.ModuleType):
+        module = module.__name__
+    if (mode is not None) and (mode not in _MODES):
+        raise ValueError(f"Unknown type check mode '{mode}', expected one of {list(_MODES)}.")
+    if (mode is None) and (module is None):
+        raise ValueError("The global type check mode can't be removed.")
+    if sample_rate is None:
+        sample_rate = DEFAULT_SAMPLE_RATE
+    if sample_rate <= 0:
+        raise ValueError("'sample_rate': Expected a positive rate.")
+
+    with _policy.lock:
+        if module is None:
+            _policy.mode, _policy.rate = mode, sample_rate
+        elif mode is None:
+            _policy.overrides.pop(module, None)
+        else:
+            _policy.overrides[module] = (mode, sample_rate)
+        _policy.changed()
+
+
+def get_policy(module=None):
+    """
+    Return the (mode, sample_rate) applying to the given module, or
+    the global ones.
+    """
+    if isinstance(module, types.ModuleType):
+        module = module.__name__
+    if module is None:
+        return _policy.mode, _policy.rate
+    return _policy.resolve(module)
+
+
+def check_stats():
+    """
+    Return the number of type checks performed and skipped so far.
+    """
+    return {'performed': _counters[0], 'skipped': _counters[1]}
+
+
+def reset_check_stats():
+    """
+    Reset the counters of check_stats().
+    """
+    _counters[0] = _counters[1] = 0
 
-        return result
 
+def _load_environ():
+    for entry in os.environ.get(ENVIRON_KEY, '').split(','):
+        if not entry.strip():
+            continue
+        module, _, mode = entry.rpartition('=')
+        mode, rate = _parse_mode(mode)
+        set_policy(mode, rate, module.strip() or None)
+
+
+_load_environ()
+
+
+class _Site:
+    """
+    Internal class tracking the policy of a call site of typecheck().
+    """
+    __slots__ = ('module', 'mode', 'rate', 'countdown', 'version')
+
+    def __init__(self, module):
+        self.module = module
+        self.version = -1
+
+    def skip(self):
+        """
+        Return whether the check of this call site can be skipped.
+        """
+        if self.version != _policy.version:
+            self.mode, self.rate = _policy.resolve(self.module)
+            self.countdown = 1
+            self.version = _policy.version
+        mode = self.mode
+        if mode == FULL:
+            _counters[0] += 1
+            return False
+        if mode == OFF:
+            _counters[1] += 1
+            return True
+        self.countdown -= 1
+        if self.countdown > 0:
+            _counters[1] += 1
+            return True
+        self.countdown = self.rate
+        _counters[0] += 1
+        return False
+
+
+_sites = {}
+
+
+def _expected_name(expected_types):
+    if len(expected_types) == 1:
+        return expected_types[0].__name__
+    typenames = str(list(expected_types))
+    return f"Union{typenames}"
+
+
+def _failure(target, expected_types, target_name, expected_type_name):
+    """
+    Internal function formatting the message of a failed type check.
+    """
+    if expected_type_name is None:
+        expected_type_name = _expected_name(expected_types)
+
+    target_txt = f"'{target_name}': "
+    if target_name is None:
+        target_txt = ""
+
+    return f"{target_txt}Expected type '{expected_type_name}', got '{type(target).__name__}' instead."
+
+
+def _check_spec(expected_types, expected_type_name):
+    """
+    Internal function validating the arguments describing a type check,
+    returning the expected types to check against.
+    """
     if not isinstance(expected_types, tuple):
         raise TypeError(f"'expected_types': expected type 'tuple[type]', got '{type(expected_types).__name__}' instead.")
-
-    if not isinstance(target_name, str):
-        raise TypeError(f"'target_name': expected type 'str', got '{type(target_name).__name__}' instead.")
+    for tp in expected_types:
+        if not isinstance(tp, type):
+            raise TypeError(f"'expected_types': expected type 'tuple[type]', got 'tuple[{type(tp).__name__}]' instead.")
 
     if not isinstance(expected_type_name, (str, type(None))):
         raise TypeError(f"'expected_type_name': expected type 'str', got '{type(expected_type_name).__name__}' instead.")
 
-    if not (isinstance(check_func, type(None)) or callable(check_func)):
-        raise TypeError(f"'check_func': expected type 'Optional[Callable]', got '{type(check_func).__name__}' instead.")
-
     if len(expected_types) == 0:
         expected_types = (object,)
+    return expected_types
+
+
+def typecheck(target, expected_types=(object,), target_name=None, expected_type_name=None, check_func=None):
+    state = _policy.state
+    if state == _ALL_FULL:
+        _counters[0] += 1
+    elif state == _ALL_OFF:
+        _counters[1] += 1
+        return
+    else:
+        frame = sys._getframe(1)
+        key = (frame.f_code, frame.f_lineno)
+        site = _sites.get(key)
+        if site is None:
+            site = _sites[key] = _Site(frame.f_globals.get('__name__'))
+        if site.skip():
+            return
+
+    if (check_func is None) and (type(expected_types) is tuple) and (type(target_name) is str) \
+            and expected_types and isinstance(target, expected_types):
+        return  # fast path, for valid arguments that pass the check
+
+    expected_types = _check_spec(expected_types, expected_type_name)
+
+    if not isinstance(target_name, str):
+        raise TypeError(f"'target_name': expected type 'str', got '{type(target_name).__name__}' instead.")
+
+    if not (isinstance(check_func, type(None)) or callable(check_func)):
+        raise TypeError(f"'check_func': expected type 'Optional[Callable]', got '{type(check_func).__name__}' instead.")
 
     if check_func is None:
-        check_func = default_check
+        passed = isinstance(target, expected_types)
+    else:
+        passed = check_func()
+
+    if not passed:
+        raise TypeError(_failure(target, expected_types, target_name, expected_type_name))
+
+
+_CODE_TYPES = {}
+for _codes, _tp in (('bBhHiIlLqQnNP', int), ('efd', float), ('?', bool), ('c', bytes), ('u', str)):
+    _CODE_TYPES.update(dict.fromkeys(_codes, _tp))
+del _codes, _tp
+"""The python type of the items of arrays, memoryviews and ctypes arrays, by format code."""
+
+
+def _element_type(iterable):
+    """
+    Internal function returning the type of every item of a homogeneous
+    container, or None if it isn't known without iterating.
+    """
+    if isinstance(iterable, (bytes, bytearray, range)):
+        return int
+    if isinstance(iterable, str):
+        return str
+    if isinstance(iterable, array.array):
+        return _CODE_TYPES.get(iterable.typecode)
+    if isinstance(iterable, memoryview):
+        if iterable.ndim != 1:
+            return None
+        return _CODE_TYPES.get(iterable.format.lstrip('@=<>!'))
+    if isinstance(iterable, ctypes.Array):
+        code = getattr(iterable._type_, '_type_', None)
+        if code in ('z', 'Z'):
+            return None  # char* items may be NULL
+        return _CODE_TYPES.get(code) if isinstance(code, str) else None
+    return None
+
+
+def typecheck_many(iterable, expected_types=(object,), target_name=None, expected_type_name=None):
+    """
+    Check that every item of iterable has one of the expected types,
+    raising TypeError naming the index of the first one that doesn't.
+
+    Homogeneous containers (array.array, memoryview, bytes, ctypes
+    arrays...) are checked from their element type only. Other
+    iterables are checked in a single loop, which consumes iterators.
+    """
+    state = _policy.state
+    if state == _ALL_FULL:
+        _counters[0] += 1
+    elif state == _ALL_OFF:
+        _counters[1] += 1
+        return
+    else:
+        frame = sys._getframe(1)
+        key = (frame.f_code, frame.f_lineno)
+        site = _sites.get(key)
+        if site is None:
+            site = _sites[key] = _Site(frame.f_globals.get('__name__'))
+        if site.skip():
+            return
+
+    expected_types = _check_spec(expected_types, expected_type_name)
+    if not isinstance(target_name, str):
+        raise TypeError(f"'target_name': expected type 'str', got '{type(target_name).__name__}' instead.")
+
+    element_type = _element_type(iterable)
+    if element_type is not None:
+        if (len(iterable) == 0) or issubclass(element_type, expected_types):
+            return
+        raise TypeError(_failure(iterable[0], expected_types, f"{target_name}[0]", expected_type_name))
+
+    if isinstance(iterable, (list, tuple)):
+        # check at C speed first, then look for the culprit if any:
+        if all(map(isinstance, iterable, itertools.repeat(expected_types))):
+            return
+    for index, item in enumerate(iterable):
+        if not isinstance(item, expected_types):
+            raise TypeError(_failure(item, expected_types, f"{target_name}[{index}]", expected_type_name))
+
+
+class Checker:
+    """
+    A precompiled type check, validated once and reusable:
+
+    _check_size = Checker((int,), "size")
+
+    def read(self, size):
+        _check_size(size)
+
+    Calling it raises the same TypeError as typecheck() would, whose
+    message is only formatted when the check fails.
+    """
+    __slots__ = ('expected_types', 'name', 'expected_type_name', 'module', '_sites')
+
+    def __init__(self, expected_types=(object,), name=None, expected_type_name=None, module=None):
+        """
+        Compile a check of the given types. module is the module the
+        check belongs to, for the type check policy. By default, the
+        policy of the module calling the checker applies, so that
+        checkers can be shared between modules.
+        """
+        if not isinstance(name, (str, type(None))):
+            raise TypeError(f"'name': expected type 'str', got '{type(name).__name__}' instead.")
+        if not isinstance(module, (str, type(None))):
+            raise TypeError(f"'module': expected type 'str', got '{type(module).__name__}' instead.")
+        self.expected_types = _check_spec(expected_types, expected_type_name)
+        self.name = name
+        self.expected_type_name = expected_type_name
+        self.module = module
+        self._sites = {}
+
+    def __call__(self, target):
+        """
+        Raise TypeError if target doesn't have one of the expected types.
+        The check may be skipped, depending on the type check policy.
+        """
+        state = _policy.state
+        if state == _ALL_FULL:
+            _counters[0] += 1
+        elif state == _ALL_OFF:
+            _counters[1] += 1
+            return
+        else:
+            module = self.module
+            if module is None:
+                module = sys._getframe(1).f_globals.get('__name__')
+            site = self._sites.get(module)
+            if site is None:
+                site = self._sites[module] = _Site(module)
+            if site.skip():
+                return
+        if not isinstance(target, self.expected_types):
+            raise TypeError(_failure(target, self.expected_types, self.name, self.expected_type_name))
+
+    def check(self, target):
+        """
+        Return whether target has one of the expected types.
+        """
+        return isinstance(target, self.expected_types)
+
+    def __repr__(self):
+        return f"<type checker of '{self.name}' for {self.expected_type_name or _expected_name(self.expected_types)}>"
+
+
+def _annotation_types(annotation):
+    """
+    Internal function converting an annotation to the tuple of
+    types it accepts, or None if it can't be checked at runtime.
+    """
+    if annotation is None:
+        return (type(None),)
+    if isinstance(annotation, tuple):
+        return annotation
+    if annotation is typing.Any:
+        return None
+    if isinstance(annotation, type) and not isinstance(annotation, types.GenericAlias):
+        return (annotation,)
+
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        result = ()
+        for arg in typing.get_args(annotation):
+            arg_types = _annotation_types(arg)
+            if arg_types is None:
+                return None
+            result += arg_types
+        return result
+    if isinstance(origin, type):  # list[int] is checked as list
+        return (origin,)
+    return None
+
+
+def typechecked(func=None, /, **spec):
+    """
+    Decorator compiling type checks for the arguments of a function,
+    once, from its annotations:
+
+    @typechecked
+    def load(path: str, flags: int = 0): ...
+
+    or from an explicit spec of expected types, by argument name:
+
+    @typechecked(path=(str,), flags=(int, bytes))
+    def load(path, flags=0): ...
+
+    Annotations that can't be checked at runtime are ignored. The
+    errors raised are the same as typecheck's.
+    """
+    if func is None:
+        return lambda function: _compile(function, spec)
+    return _compile(func, spec)
+
 
-    if not check_func():
-        if expected_type_name is None:
-            if len(expected_types) == 1:
-                expected_type_name = expected_types[0].__name__
-            else:
-                typenames = str(list(expected_types))
-                expected_type_name = f"Union{typenames}"
+def _compile(func, spec):
+    """
+    Internal function wrapping func with the checks it needs.
+    """
+    import inspect
+    signature = inspect.signature(func)
+    positional = []
+    keywords = {}
+    for index, (name, param) in enumerate(signature.parameters.items()):
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        if name in spec:
+            expected = spec[name]
+            if isinstance(expected, type):
+                expected = (expected,)
+        else:
+            annotation = param.annotation
+            if isinstance(annotation, str):
+                annotation = typing.get_type_hints(func).get(name, param.empty)
+            if annotation is param.empty:
+                continue
+            expected = _annotation_types(annotation)
+            if expected is None:
+                continue
 
-        target_txt = f"'{target_name}': "
-        if target_name is None:
-            target_txt = ""
+        checker = Checker(expected, name, module=func.__module__)
+        if param.kind != param.KEYWORD_ONLY:
+            positional.append((index, checker))
+        if param.kind != param.POSITIONAL_ONLY:
+            keywords[name] = checker
 
-        raise TypeError(f"{target_txt}Expected type '{expected_type_name}', got '{type(target).__name__}' instead.")
+    unknown = set(spec) - {name for name in signature.parameters}
+    if unknown:
+        raise TypeError(f"'{func.__name__}' has no argument named '{unknown.pop()}'.")
+    if not keywords and not positional:
+        return func
+    positional = tuple(positional)
 
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        count = len(args)
+        for index, checker in positional:
+            if index < count:
+                checker(args[index])
+        if kwargs:
+            for name, value in kwargs.items():
+                checker = keywords.get(name)
+                if checker is not None:
+                    checker(value)
+        return func(*args, **kwargs)
+    return wrapper
@@ -1,17 +1,25 @@
 import types
 
 
+_classes = {}
+"""Concrete exception classes, by (exception, base, module)."""
+
+
 class CustomException(BaseException):
     def __new__(cls, module, base, *args, **kwargs):
         if (not issubclass(base, BaseException)) and (base is not BaseException):
             return BaseException("<no details>")
-        error = type(cls.__name__, (base,), {})
         if isinstance(module, str):
-            error.__module__ = module
+            module_name = module
         elif isinstance(module, types.ModuleType):
-            error.__module__ = module.__name__
+            module_name = module.__name__
         else:
-            error.__module__ = '<unreachable>'
+            module_name = '<unreachable>'
 
-        return error(*args, **kwargs)
+        key = (cls, base, module_name)
+        error = _classes.get(key)
+        if error is None:
+            # created once, and deriving from cls so that 'except cls' catches it:
+            error = _classes[key] = type(cls.__name__, (base, cls), {'__module__': module_name})
 
+        return error(*args, **kwargs)
@@ -1,11 +1,4 @@
-from ._library import ExternalFunction, Library, NULL
-from ._types import CType, CInstanceType
-from ._types import Int, Long, Short, Size_t, SSize_t
-from ._types import Float, Double
-from ._types import Bool
-from ._types import Str, Char, Bytes
-from ._types import Null as NULL_t
-from ._types import Ptr as Pointer, Array
+from .._lazy import lazy_attributes as _lazy_attributes
 from .. import _decorator
 
 from types import FunctionType as _FuncType
@@ -28,14 +21,46 @@ __all__ = [
     "Bytes",
     "Pointer",
     "Array",
+    "Struct",
     "ExternalFunction",
     "Library",
+    "VTable",
+    "Arena",
+    "ProcessBoundLibrary",
     "ctype",
     "DllImport",
 ]
 
 
-def ctype(instance: CInstanceType) -> CType:
+# the type system and the libraries are loaded on first access:
+__getattr__, __dir__ = _lazy_attributes(__name__, globals(), {
+    "ExternalFunction": ("._library", "ExternalFunction"),
+    "Library": ("._library", "Library"),
+    "VTable": ("._library", "VTable"),
+    "NULL": ("._library", "NULL"),
+    "Arena": ("._arena", "Arena"),
+    "ProcessBoundLibrary": ("._process", "ProcessBoundLibrary"),
+    "CType": ("._types", "CType"),
+    "CInstanceType": ("._types", "CInstanceType"),
+    "Int": ("._types", "Int"),
+    "Long": ("._types", "Long"),
+    "Short": ("._types", "Short"),
+    "Size_t": ("._types", "Size_t"),
+    "SSize_t": ("._types", "SSize_t"),
+    "Float": ("._types", "Float"),
+    "Double": ("._types", "Double"),
+    "Bool": ("._types", "Bool"),
+    "Str": ("._types", "Str"),
+    "Char": ("._types", "Char"),
+    "Bytes": ("._types", "Bytes"),
+    "NULL_t": ("._types", "Null"),
+    "Pointer": ("._types", "Ptr"),
+    "Array": ("._types", "Array"),
+    "Struct": ("._types", "Struct"),
+})
+
+
+def ctype(instance: "CInstanceType") -> "CType":
     return instance.ctype
 
 
@@ -48,7 +73,7 @@ def DllImport(func: _FuncType, dll: str, flags=0, funcflags=0):
     Errors are raised if invalid types are used.
     Custom flags can be given for both library loading and function loading.
     """
-    lib = Library.load(dll, flags=flags)
+    lib = __getattr__("Library").load(dll, flags=flags)
     argtypes = []
     restype = None
     for k, v in func.__annotations__.items():
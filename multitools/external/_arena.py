@@ -0,0 +1,266 @@
+from .._meta import *
+from .._type_check import typecheck
+from ._types import CType, Array, Str, _encode, _from_handle
+import ctypes as _ctype
+import threading
+
+
+_local = threading.local()
+_layouts = {}
+"""The (ctypes type, size, alignment, CType or None) of allocations, by (type, count)."""
+_MAX_CACHED = 1024
+"""The number of layouts, and of views per arena, kept before the caches are emptied."""
+
+
+def _layout(tp, count):
+    """
+    Internal function validating an allocation of count values of tp,
+    and returning its ctypes type, size, alignment and CType if any.
+    """
+    typecheck(count, (int,), target_name='count')
+    if count < 1:
+        raise ValueError("'count': Expected a positive number of values.")
+
+    if isinstance(tp, MultiMeta) and issubclass(tp, CType):
+        if count > 1:
+            tp = Array[tp, count]
+        c_type = tp.__c_origin__
+    else:
+        typecheck(tp, (type,), target_name='tp')
+        c_type = tp * count if count > 1 else tp
+        tp = None
+    return c_type, _ctype.sizeof(c_type), _ctype.alignment(c_type), tp
+
+
+class Arena(metaclass=MultiMeta):
+    """
+    A scratch arena for temporary native memory.
+
+    Temporaries such as string buffers, out-parameter cells and
+    small arrays are carved out of one reusable block instead of
+    being allocated one by one, and are released all at once when
+    leaving the 'with' block they were allocated in:
+
+    with Arena.local() as arena:
+        count = arena.alloc(Int)
+        name = arena.string("key")
+        func(name, Pointer.addressof(count))
+
+    Outside of 'with' blocks, mark() and rollback() release what was
+    allocated since a given point:
+
+    start = arena.mark()
+    ...
+    arena.rollback(start)
+
+    Memory released by an arena is reused by its next allocations,
+    so objects allocated from it must not be used once released.
+    Allocations are only checked the first time a type is used, and
+    the ctypes objects viewing the memory are reused from a cycle to
+    the next.
+    """
+    DEFAULT_SIZE = 4096
+
+    def __init__(self, size=DEFAULT_SIZE):
+        """
+        Create a new arena, whose first block holds size bytes.
+        The arena grows by adding blocks when it runs out of memory.
+        """
+        typecheck(size, (int,), target_name='size')
+        if size <= 0:
+            raise ValueError("'size': Arena size must be positive.")
+        self._blocks = []
+        self._addresses = []
+        self._memory = []
+        self._views = {}
+        self._add_block(size)
+        self._block = 0
+        self._offset = 0
+        self._marks = []
+
+    @staticmethod
+    def local():
+        """
+        Return the arena of the current thread, creating it if needed.
+        Nested 'with' blocks on the same arena only release what they
+        allocated themselves.
+        """
+        try:
+            return _local.arena
+        except AttributeError:
+            arena = _local.arena = Arena()
+            return arena
+
+    def _add_block(self, size):
+        """
+        Internal method adding a zeroed block of size bytes.
+        """
+        block = _ctype.create_string_buffer(size)
+        self._blocks.append(block)
+        self._addresses.append(_ctype.addressof(block))
+        # copying through memoryviews is much cheaper than calling memmove or memset:
+        self._memory.append(memoryview(block).cast('B'))
+
+    def _carve(self, size, alignment):
+        """
+        Internal method reserving size bytes aligned on alignment,
+        returning the block index and offset of the reserved memory.
+        """
+        offset = (self._offset + alignment - 1) & -alignment  # ctypes alignments are powers of two
+        if offset + size <= len(self._memory[self._block]):
+            self._offset = offset + size
+            return self._block, offset
+
+        while True:
+            # move to the next block, adding a bigger one if needed:
+            self._block += 1
+            self._offset = 0
+            if self._block == len(self._blocks):
+                self._add_block(max(size + alignment, 2 * len(self._blocks[-1])))
+            if size <= len(self._memory[self._block]):
+                self._offset = size
+                return self._block, 0
+
+    def _view(self, c_type, size, alignment):
+        """
+        Internal method allocating a ctypes object of c_type, reusing
+        the object viewing the same memory in earlier cycles if any.
+        """
+        block = self._block
+        offset = (self._offset + alignment - 1) & -alignment
+        if offset + size <= len(self._memory[block]):
+            self._offset = offset + size
+        else:
+            block, offset = self._carve(size, alignment)
+        self._memory[block][offset:offset + size] = bytes(size)
+        key = (c_type, block, offset)
+        try:
+            return self._views[key]
+        except KeyError:
+            pass
+        if len(self._views) >= _MAX_CACHED:
+            self._views.clear()
+        view = self._views[key] = c_type.from_buffer(self._blocks[block], offset)
+        return view
+
+    def alloc(self, tp, count=1):
+        """
+        Allocate a zeroed value of the given C type, or an array of
+        count such values if count is greater than 1.
+        CTypes give C instances, ctypes types give ctypes objects.
+        """
+        try:
+            c_type, size, alignment, ctype = _layouts[tp, count]
+        except KeyError:
+            if len(_layouts) >= _MAX_CACHED:
+                _layouts.clear()
+            c_type, size, alignment, ctype = _layouts[tp, count] = _layout(tp, count)
+        except TypeError:  # unhashable arguments can't be valid
+            c_type, size, alignment, ctype = _layout(tp, count)
+
+        c_instance = self._view(c_type, size, alignment)
+        if ctype is not None:
+            return _from_handle(ctype, c_instance)
+        return c_instance
+
+    def buffer(self, size):
+        """
+        Allocate a zeroed char buffer of the given size.
+        """
+        typecheck(size, (int,), target_name='size')
+        if size <= 0:
+            raise ValueError("'size': Buffer size must be positive.")
+        return self.alloc(_ctype.c_char * size)
+
+    def string(self, value, encoding=None):
+        """
+        Copy a string into the arena and return it as a null-terminated
+        C string. Bytes are copied as is.
+        """
+        if isinstance(value, str):
+            if encoding is not None:
+                typecheck(encoding, (str,), target_name='encoding')
+            value = _encode(value, Str.encoding if encoding is None else encoding)
+        else:
+            typecheck(value, (str, bytes), target_name='value')
+        return _from_handle(Str, self._string(value))
+
+    def _string(self, data):
+        """
+        Internal method copying bytes into the arena, and returning
+        the C 'char*' pointing to them.
+        """
+        size = len(data) + 1
+        block, offset = self._block, self._offset
+        if offset + size <= len(self._memory[block]):
+            self._offset = offset + size
+        else:
+            block, offset = self._carve(size, 1)
+        memory = self._memory[block]
+        memory[offset:offset + size - 1] = data
+        memory[offset + size - 1] = 0
+        return _ctype.c_char_p(self._addresses[block] + offset)
+
+    def mark(self):
+        """
+        Return the current position of the arena, to be given
+        to rollback() to release what is allocated afterwards.
+        """
+        return self._block, self._offset
+
+    def rollback(self, mark):
+        """
+        Release everything allocated since mark() returned mark.
+        """
+        if (type(mark) is not tuple) or (len(mark) != 2):
+            raise TypeError(f"'mark': Expected a position returned by 'Arena.mark()', got '{type(mark).__name__}' instead.")
+        if mark > (self._block, self._offset):
+            raise ValueError("'mark': The arena was already released past this position.")
+        self._release(*mark)
+
+    def reset(self):
+        """
+        Release everything allocated from the arena.
+        """
+        self._marks.clear()
+        self._release(0, 0)
+
+    def _release(self, block, offset):
+        """
+        Internal method releasing everything allocated after the
+        given position.
+        """
+        self._block = block
+        self._offset = offset
+        if (block, offset) == (0, 0) and (len(self._blocks) > 1):
+            # merge the blocks, so that the next cycle fits in a single one:
+            size = self.size
+            self._blocks.clear()
+            self._addresses.clear()
+            self._memory.clear()
+            self._views.clear()
+            self._add_block(size)
+
+    def __enter__(self):
+        self._marks.append(self.mark())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._release(*self._marks.pop())
+
+    @property
+    def size(self):
+        """
+        The number of bytes the arena currently holds.
+        """
+        return sum(len(block) for block in self._blocks)
+
+    @property
+    def used(self):
+        """
+        The number of bytes currently allocated from the arena.
+        """
+        return sum(len(block) for block in self._blocks[:self._block]) + self._offset
+
+    def __repr__(self):
+        return f"<arena of {self.size} bytes, {self.used} used at {hex(id(self))}>"
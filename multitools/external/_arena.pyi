@@ -0,0 +1,29 @@
+from .._meta import *
+from ._types import CType, CInstanceType, CStrInstance
+from ..system import SecretCtypes
+from typing import Optional, Union, overload
+from types import TracebackType
+
+
+class Arena(metaclass=MultiMeta):
+    DEFAULT_SIZE: int = ...
+
+    def __init__(self, size: int = ...) -> None: ...
+    @staticmethod
+    def local() -> Arena: ...
+    @overload
+    def alloc(self, tp: type[CType], count: int = ...) -> CInstanceType: ...
+    @overload
+    def alloc(self, tp: type[SecretCtypes.CData], count: int = ...) -> SecretCtypes.CData: ...
+    def buffer(self, size: int) -> SecretCtypes.CData: ...
+    def string(self, value: Union[str, bytes], encoding: Optional[str] = ...) -> CStrInstance: ...
+    def mark(self) -> tuple[int, int]: ...
+    def rollback(self, mark: tuple[int, int]) -> None: ...
+    def reset(self) -> None: ...
+    def __enter__(self) -> Arena: ...
+    def __exit__(self, exc_type: type[Exception], exc_val: Exception, exc_tb: TracebackType) -> None: ...
+    @property
+    def size(self) -> int: ...
+    @property
+    def used(self) -> int: ...
+    def __repr__(self) -> str: ...
@@ -0,0 +1,281 @@
+from ._types import *
+import dataclasses
+import functools
+import re
+import sys
+
+
+_TOKEN = re.compile(r"[A-Za-z_]\w*|\.\.\.|[*\[\]()]|\d+|\S")
+_COMMENT = re.compile(r"/\*.*?\*/|//[^\n]*", re.DOTALL)
+_PREPROCESSOR = re.compile(r"^\s*#.*$", re.MULTILINE)
+
+_IGNORED = frozenset((
+    'const', 'volatile', 'restrict', '__restrict', '__restrict__', 'extern',
+    'static', 'inline', '__inline', 'register', '__cdecl', '__stdcall',
+    'WINAPI', '__declspec', '__attribute__',
+))
+"""Qualifiers and specifiers that don't change how a value is passed."""
+_BASE_WORDS = frozenset((
+    'void', 'char', 'short', 'int', 'long', 'float', 'double',
+    'signed', 'unsigned', '_Bool', 'bool',
+))
+"""Keywords that make up the spelling of builtin C types."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Typedef:
+    """
+    A parsed 'typedef <type> <name>' declaration.
+    """
+    name: str
+    spelling: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Prototype:
+    """
+    A parsed function prototype, with the normalized spellings
+    of its return type and argument types.
+    """
+    name: str
+    restype: str
+    argtypes: tuple[str, ...]
+
+
+def _builtin_types():
+    """
+    Internal function returning the C types known by name to cdef.
+    """
+    native = sys.byteorder
+    long_long = Long[True, native, True]
+    u_long_long = Long[False, native, True]
+    return {
+        'char': Char,
+        'signed char': Bytes,
+        'unsigned char': Bytes[False],
+        'short': Short,
+        'unsigned short': Short[False, native],
+        'int': Int,
+        'unsigned int': Int[False, native],
+        'long': Long,
+        'unsigned long': Long[False, native, False],
+        'long long': long_long,
+        'unsigned long long': u_long_long,
+        'float': Float,
+        'double': Double,
+        'long double': Double[True],
+        '_Bool': Bool,
+        'bool': Bool,
+        'size_t': Size_t,
+        'ssize_t': SSize_t,
+        'int8_t': Bytes,
+        'uint8_t': Bytes[False],
+        'int16_t': Short,
+        'uint16_t': Short[False, native],
+        'int32_t': Int,
+        'uint32_t': Int[False, native],
+        'int64_t': long_long,
+        'uint64_t': u_long_long,
+        'intptr_t': SSize_t,
+        'uintptr_t': Size_t,
+        'ptrdiff_t': SSize_t,
+    }
+
+
+_BUILTINS = _builtin_types()
+_MUTABLE_STR = Str[Str.encoding, False]
+"""The type of 'char*', whose strings C functions may modify."""
+
+
+def _split(source):
+    """
+    Internal function splitting a source into declarations,
+    without comments nor preprocessor directives.
+    """
+    source = _COMMENT.sub(" ", source)
+    source = _PREPROCESSOR.sub("", source)
+    return [decl.strip() for decl in source.split(';') if decl.strip()]
+
+
+def _spelling(tokens, decl):
+    """
+    Internal function returning the normalized spelling of a type
+    given as tokens, such as 'unsigned int*'.
+    """
+    stars = tokens.count('*')
+    words = [token for token in tokens if token != '*']
+    if stars and any(token != '*' for token in tokens[tokens.index('*'):]):
+        raise ValueError(f"Unsupported C type in declaration '{decl}'.")
+    if words[:1] in (['struct'], ['union']) and len(words) == 2:
+        # opaque structures can only be handled through pointers:
+        if not stars:
+            raise ValueError(f"Structures can't be passed by value in declaration '{decl}'.")
+        return 'void' + '*' * stars
+    if words[:1] == ['enum'] and len(words) == 2:
+        words = ['int']
+
+    if not all(word in _BASE_WORDS for word in words):
+        if len(words) != 1:
+            raise ValueError(f"Unknown C type '{' '.join(words)}' in declaration '{decl}'.")
+        return words[0] + '*' * stars  # typedef name
+
+    unsigned = 'unsigned' in words
+    words = [word for word in words if word not in ('signed', 'unsigned')]
+    if len(words) > 1 and 'int' in words:
+        words.remove('int')  # 'short int', 'long long int'...
+    if not words:
+        words = ['int']
+    base = ' '.join(words)
+    if unsigned:
+        base = 'unsigned ' + base
+    elif base == 'char' and 'signed' in tokens:
+        base = 'signed char'
+    return base + '*' * stars
+
+
+def _type_tokens(tokens, decl, named):
+    """
+    Internal function removing qualifiers from a type, and its name
+    if it is named. Array declarators are read as pointers.
+    Constant strings are spelled 'const char*', as they can be shared.
+    """
+    const = 'const' in tokens[:tokens.index('*') if '*' in tokens else len(tokens)]
+    tokens = [token for token in tokens if token not in _IGNORED]
+    dimensions = 0
+    while tokens[-1:] == [']']:
+        # 'int values[]' or 'int values[16]' are passed as pointers:
+        tokens = tokens[:len(tokens) - tokens[::-1].index('[') - 1]
+        dimensions += 1
+    if not tokens:
+        raise ValueError(f"Missing C type in declaration '{decl}'.")
+
+    name = None
+    if named:
+        if not re.fullmatch(r"[A-Za-z_]\w*", tokens[-1]) or len(tokens) < 2:
+            raise ValueError(f"Missing name in declaration '{decl}'.")
+        name = tokens.pop()
+    elif len(tokens) > 1 and re.fullmatch(r"[A-Za-z_]\w*", tokens[-1]) and \
+            tokens[-1] not in _BASE_WORDS and tokens[-2] not in ('struct', 'union', 'enum'):
+        # optional parameter name:
+        name = tokens.pop()
+    tokens += ['*'] * dimensions
+    if '*' in tokens:
+        # 'char* a' and 'char *a' alike:
+        first = tokens.index('*')
+        tokens = tokens[:first] + [t for t in tokens[first:] if t == '*']
+    spelling = _spelling(tokens, decl)
+    if const and spelling == 'char*':
+        spelling = 'const char*'
+    return spelling, name
+
+
+def _parse_declaration(decl):
+    """
+    Internal function parsing a single declaration.
+    """
+    tokens = _TOKEN.findall(decl)
+    if tokens[:1] == ['typedef']:
+        if '(' in tokens:
+            raise ValueError(f"Function pointer typedefs are not supported: '{decl}'.")
+        spelling, name = _type_tokens(tokens[1:], decl, named=True)
+        return Typedef(name, spelling)
+
+    if '(' not in tokens or tokens[-1] != ')':
+        raise ValueError(f"Expected a function prototype, got '{decl}'.")
+    start = tokens.index('(')
+    if '(' in tokens[start + 1:]:
+        raise ValueError(f"Function pointers are not supported: '{decl}'.")
+    restype, name = _type_tokens(tokens[:start], decl, named=True)
+
+    params = tokens[start + 1:-1]
+    if params in ([], ['void']):
+        return Prototype(name, restype, ())
+    if '...' in params:
+        raise ValueError(f"Variadic functions are not supported: '{decl}'.")
+
+    argtypes = []
+    current = []
+    for token in params + [',']:
+        if token != ',':
+            current.append(token)
+            continue
+        if not current:
+            raise ValueError(f"Missing parameter type in declaration '{decl}'.")
+        argtypes.append(_type_tokens(current, decl, named=False)[0])
+        current = []
+    return Prototype(name, restype, tuple(argtypes))
+
+
+@functools.lru_cache(maxsize=64)
+def parse(source):
+    """
+    Parse C typedefs and function prototypes from source, returning
+    a tuple of Typedef and Prototype objects in declaration order.
+    Results are cached by source text, so that binding the same
+    declarations again doesn't parse them again.
+    """
+    return tuple(_parse_declaration(decl) for decl in _split(source))
+
+
+def resolve(spelling, typedefs):
+    """
+    Return the CType for a normalized C type spelling, or None for
+    'void'. typedefs maps typedef names to their own spelling.
+    'const char*' resolves to Str, 'char*' to a Str that isn't const,
+    and other pointers to Ptr[...].
+    """
+    stars = len(spelling) - len(spelling.rstrip('*'))
+    base = spelling[:len(spelling) - stars]
+    seen = set()
+    while base in typedefs:
+        if base in seen:
+            raise ValueError(f"Recursive typedef '{base}'.")
+        seen.add(base)
+        target = typedefs[base]
+        target_stars = len(target) - len(target.rstrip('*'))
+        base = target[:len(target) - target_stars]
+        stars += target_stars
+
+    if base == 'void':
+        if stars == 0:
+            return None
+        result = Ptr
+        stars -= 1
+    elif base == 'const char' and stars:
+        result = Str
+        stars -= 1
+    elif base == 'char' and stars:
+        result = _MUTABLE_STR
+        stars -= 1
+    elif base in _BUILTINS:
+        result = _BUILTINS[base]
+    else:
+        raise ValueError(f"Unknown C type '{base}'.")
+
+    for _ in range(stars):
+        result = Ptr[result]
+    return result
+
+
+def signatures(decls, typedefs):
+    """
+    Return the (name, restype, argtypes) signatures of the prototypes
+    in decls, resolved to CTypes. Typedefs found in decls are added
+    to the typedefs dictionary.
+    """
+    prototypes = []
+    for decl in decls:
+        if isinstance(decl, Typedef):
+            resolve(decl.spelling, typedefs)  # fail early on unknown types
+            typedefs[decl.name] = decl.spelling
+            continue
+        prototypes.append(decl)
+
+    result = []
+    for proto in prototypes:
+        restype = resolve(proto.restype, typedefs)
+        argtypes = tuple(resolve(argtype, typedefs) for argtype in proto.argtypes)
+        if None in argtypes:
+            raise ValueError(f"'{proto.name}': Arguments can't be of type void.")
+        result.append((proto.name, restype, argtypes))
+    return result
@@ -0,0 +1,21 @@
+from ._types import CType
+from typing import Optional
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class Typedef:
+    name: str
+    spelling: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Prototype:
+    name: str
+    restype: str
+    argtypes: tuple[str, ...]
+
+
+def parse(source: str) -> tuple[Typedef | Prototype, ...]: ...
+def resolve(spelling: str, typedefs: dict[str, str]) -> Optional[type[CType]]: ...
+def signatures(decls: tuple[Typedef | Prototype, ...], typedefs: dict[str, str]) -> list[tuple[str, Optional[type[CType]], tuple[type[CType], ...]]]: ...
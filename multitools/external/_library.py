@@ -3,11 +3,20 @@ from .. import system
 from .._ref import *
 from .._type_check import *
 from ._types import *
+from ._types import _encode
+from . import _cdef
 from ..errors import AccessViolationError, NullReferenceError
 import ctypes as _ctype
 import os
 import _ctypes
 
+
+_check_name_or_ordinal = Checker((int, str,), 'name | ordinal')
+_check_argtypes = Checker((tuple,), 'argtypes')
+_check_restype = Checker((type, type(None)), 'restype')
+_check_flags = Checker((int,), 'flags')
+_check_attribute = Checker((str,), 'item')
+
 NULL = Null()
 """
 The C NULL constant.
@@ -22,14 +31,46 @@ will raise NullReferenceError.
 """
 
 
+_CHAR, _CONST_STR, _STR = range(3)
+"""How text arguments are passed: by value, as 'const char*' or as 'char*'."""
+
+
+def _text_argument(argtype):
+    """
+    Return the encoding of text arguments of the given type and how
+    they are passed, or None if the type doesn't take text.
+    """
+    if argtype is str:
+        return Str.encoding, _STR
+    if isinstance(argtype, MultiMeta):
+        # issubclass() accepts any CType here, the variants of Char and Str are found in the mro:
+        if Char in argtype.__mro__:
+            return argtype.encoding, _CHAR
+        if Str in argtype.__mro__:
+            return argtype.encoding, _CONST_STR if argtype.const else _STR
+    return None
+
+
+def _char_buffer(data):
+    """
+    Return a C char array sharing the memory of a bytearray, if it
+    is null-terminated. Otherwise, return a null-terminated copy.
+    """
+    if data.endswith(b"\x00"):
+        return (_ctype.c_char * len(data)).from_buffer(data)
+    return _ctype.create_string_buffer(bytes(data))
+
+
 class ExternalFunction(metaclass=MultiMeta):
     def __init__(self, funcptr, argtypes, restype):
         typecheck(funcptr, (_ctypes.CFuncPtr,), target_name='funcptr')
-        typecheck(argtypes, (tuple,), target_name='argtypes')
-        typecheck(restype, (type, type(None)), target_name='restype')
+        _check_argtypes(argtypes)
+        _check_restype(restype)
         self._handle = funcptr
         self._restype = None
         self._argtypes = ()
+        self._texts = ()
+        self._checkers = ()
         self.set_restype(restype)
         self.set_argtypes(argtypes)
         self.__name__ = '<undefined>'
@@ -46,32 +87,6 @@ class ExternalFunction(metaclass=MultiMeta):
 
         return e
 
-    @staticmethod
-    def _manage_builtins(arg):
-        if isinstance(arg, str):
-            return Str(arg)
-        if isinstance(arg, int):
-            if arg.bit_length() <= 4:
-                return Int(arg)
-            if arg.bit_length() <= 8:
-                return Long(arg)
-            return Long[True, True](arg)
-
-        if isinstance(arg, float):
-            int1, int2 = arg.as_integer_ratio()
-            length = int1.bit_length() + int2.bit_length()
-            del int1, int2
-            if length <= 8:
-                return Float(arg)
-            if length <= 16:
-                return Double(arg)
-            return Double[True](arg)
-
-        if isinstance(arg, bool):
-            return Bool(arg)
-
-        return arg
-
     def _manage_args(self, args):
         cargs = []
         argno = -1
@@ -81,9 +96,26 @@ class ExternalFunction(metaclass=MultiMeta):
                 cargs.append(None)  # ctypes uses None as a NULL reference
                 continue
 
-            arg = self._manage_builtins(arg)
+            text = self._texts[argno]
+            if text is not None:  # text argument, passed without creating a C instance
+                encoding, kind = text
+                if isinstance(arg, str):
+                    if kind == _STR:  # C may modify it, so it gets its own copy
+                        cargs.append(_ctype.create_string_buffer(bytes(arg, encoding=encoding)))
+                    else:
+                        cargs.append(_encode(arg, encoding))
+                    continue
+                if isinstance(arg, bytes):
+                    cargs.append(_ctype.create_string_buffer(arg) if kind == _STR else arg)
+                    continue
+                if isinstance(arg, bytearray):
+                    cargs.append(bytes(arg) if kind == _CHAR else _char_buffer(arg))
+                    continue
 
             if issubclass(self._argtypes[argno], CType):  # argument must be a c type
+                if isinstance(arg, (int, float, str)):  # python value, convert it to the expected type
+                    arg = self._argtypes[argno](arg)
+
                 if isinstance(arg, CInstanceType):  # argument is a c instance
 
                     if isinstance(arg, self._argtypes[argno].__instance_type__):  # c argument of the right type
@@ -102,8 +134,7 @@ class ExternalFunction(metaclass=MultiMeta):
                     f"'{type(arg).__name__}' instead."
                 )
             # no c argument required
-            typecheck(arg, (self._argtypes[argno],),
-                      target_name=f"arg {argno + 1}")
+            self._checkers[argno](arg)
             cargs.append(arg)
             continue
         return cargs
@@ -119,6 +150,9 @@ class ExternalFunction(metaclass=MultiMeta):
         if issubclass(self._restype, CType):  # c type required
             if isinstance(result, self._restype.__c_origin__):  # right ctypes type found
                 return self._restype(result)
+            if issubclass(self._restype.__c_origin__, _ctypes._SimpleCData):
+                # ctypes already converted the result to a python value, char* results stay encoded
+                return self._restype(result)
             # wrong ctype or not a c type
             raise TypeError(
                 f"Returned unexpected data: "
@@ -153,18 +187,22 @@ class ExternalFunction(metaclass=MultiMeta):
 
     def set_argtypes(self, argtypes):
         typecheck(argtypes, (tuple,), target_name='argtypes')
+        typecheck_many(argtypes, (type,), target_name='argtypes', expected_type_name='type')
         _builtin_valid = {
             int: int,
             bytes: bytes,
-            str: Str,
+            str: Str.__c_origin__,
             float: Float,
             type(None): type(None),
         }
         self._argtypes = []
+        self._texts = []
+        self._checkers = []
         cargtypes = []
         for argtp in argtypes:
-            typecheck(argtp, (type,), target_name='argtypes', expected_type_name='tuple[type, ...]')
             self._argtypes.append(argtp)
+            self._texts.append(_text_argument(argtp))
+            self._checkers.append(Checker((argtp,), f"arg {len(self._checkers) + 1}"))
             if issubclass(argtp, CType):
                 cargtypes.append(argtp.__c_origin__)
             elif argtp in _builtin_valid:
@@ -175,6 +213,47 @@ class ExternalFunction(metaclass=MultiMeta):
         self._handle.argtypes = tuple(cargtypes)
 
 
+class VTable(metaclass=MultiMeta):
+    """
+    A table of function pointers bound at once, whose functions
+    can be called as attributes:
+
+    api = lib.bind_vtable("get_api", "int open(const char*); void close(int);")
+    handle = api.open("file")
+
+    Null entries of the table are bound to NULL, which raises
+    NullReferenceError when called.
+    """
+    def __init__(self, address, functions):
+        typecheck(address, (int,), target_name='address')
+        typecheck(functions, (dict,), target_name='functions')
+        self.__dict__.update(functions)
+        self._vtable_address = address
+        self._vtable_names = tuple(functions)
+
+    def __getitem__(self, item):
+        typecheck(item, (str,), target_name='item')
+        if item not in self._vtable_names:
+            raise KeyError(item)
+        return self.__dict__[item]
+
+    def __iter__(self):
+        return iter(self._vtable_names)
+
+    def __len__(self):
+        return len(self._vtable_names)
+
+    @property
+    def address(self):
+        """
+        The address of the table in memory.
+        """
+        return self._vtable_address
+
+    def __repr__(self):
+        return f"<vtable of {len(self._vtable_names)} functions at {hex(self._vtable_address)}>"
+
+
 class Library(metaclass=MultiMeta):
     # library loading flags:
     DONT_RESOLVE_DLL_REFERENCES = 0x00000001
@@ -190,6 +269,12 @@ class Library(metaclass=MultiMeta):
     LOAD_WITH_ALTERED_SEARCH_PATH = 0x00000008
     LOAD_LIBRARY_REQUIRE_SIGNED_TARGET = 0x00000080
     LOAD_LIBRARY_SAFE_CURRENT_DIRS = 0x00002000
+    # dlopen flags, on platforms other than Windows:
+    RTLD_LAZY = system.Library.RTLD_LAZY
+    RTLD_NOW = system.Library.RTLD_NOW
+    RTLD_GLOBAL = system.Library.RTLD_GLOBAL
+    RTLD_LOCAL = system.Library.RTLD_LOCAL
+    RTLD_NODELETE = system.Library.RTLD_NODELETE
 
     # function loading flags:
     cdecl = 0x00000001
@@ -202,20 +287,24 @@ class Library(metaclass=MultiMeta):
     def __init__(self, library):
         typecheck(library, (system.Library,), target_name='library')
         self._handle = library
+        self._typedefs = {}
+        self._bound = {}
 
     def __getattr__(self, item):
-        typecheck(item, (str,))
+        _check_attribute(item)
+        if item in self._bound:
+            return self._bound[item]
         return self.load_function(item)
 
     def __getitem__(self, item):
-        typecheck(item, (int,))
+        typecheck(item, (int,), target_name='item')
         return self.load_function(item)
 
     def load_function(self, name_or_ordinal, argtypes=(), restype=None, flags=0):
-        typecheck(name_or_ordinal, (int, str,), target_name='name | ordinal')
-        typecheck(argtypes, (tuple,), target_name='argtypes')
-        typecheck(restype, (type, type(None)), target_name='restype')
-        typecheck(flags, (int,), target_name='flags')
+        _check_name_or_ordinal(name_or_ordinal)
+        _check_argtypes(argtypes)
+        _check_restype(restype)
+        _check_flags(flags)
 
         funcptr = self._handle.getfunc(name_or_ordinal, flags=flags)
         ext_func = ExternalFunction(funcptr, argtypes, restype)
@@ -223,6 +312,93 @@ class Library(metaclass=MultiMeta):
             ext_func.__name__ = name_or_ordinal
         return ext_func
 
+    def cdef(self, source, flags=0):
+        """
+        Bind the functions declared by C prototypes in source, such as
+        "double cos(double); size_t strlen(const char*);", and return
+        them in a dictionary mapping names to external functions.
+
+        Typedefs are remembered by the library, so that later calls
+        can use them. Bound functions can then be accessed as
+        attributes of the library, with their signature.
+        Variadic functions and function pointers are not supported.
+        """
+        typecheck(source, (str,), target_name='source')
+        typecheck(flags, (int,), target_name='flags')
+
+        result = {}
+        for name, restype, argtypes in _cdef.signatures(_cdef.parse(source), self._typedefs):
+            result[name] = self.load_function(name, argtypes=argtypes, restype=restype, flags=flags)
+        self._bound.update(result)
+        return result
+
+    def bind_vtable(self, table, layout, flags=0):
+        """
+        Bind a table of function pointers exported by the library,
+        such as the structure returned by 'const struct api* get_api()'.
+
+        table is either the name of the exported table, a function of
+        the library returning the address of the table, or its address.
+        layout gives the entries of the table in order, either as C
+        prototypes like for cdef, or as (name, restype, argtypes) tuples.
+
+        The whole table is read in a single copy and all of its
+        functions are bound without looking up any other symbol.
+        Entries can't be named like attributes of VTable, such as
+        'address', as they couldn't be accessed.
+        """
+        typecheck(table, (str, ExternalFunction, int), target_name='table')
+        typecheck(layout, (str, tuple, list), target_name='layout')
+        typecheck(flags, (int,), target_name='flags')
+
+        if isinstance(layout, str):
+            signatures = _cdef.signatures(_cdef.parse(layout), self._typedefs)
+        else:
+            signatures = []
+            for entry in layout:
+                typecheck(entry, (tuple,), target_name='layout', expected_type_name='tuple[str, type, tuple[type, ...]]')
+                if len(entry) != 3:
+                    raise ValueError("'layout': Expected (name, restype, argtypes) entries.")
+                signatures.append(entry)
+        if not signatures:
+            raise ValueError("'layout': Expected at least one function.")
+        names = set()
+        for name, _, _ in signatures:
+            typecheck(name, (str,), target_name='name')
+            if name in names:
+                raise ValueError(f"'layout': The function '{name}' is declared twice.")
+            if name.startswith('_vtable_') or any(name in vars(base) for base in VTable.__mro__):
+                # the entry would be hidden by an attribute of the table:
+                raise ValueError(f"'layout': The name '{name}' is reserved by VTable.")
+            names.add(name)
+
+        if isinstance(table, str):
+            address = _ctype.addressof(_ctype.c_char.in_dll(self._handle, table))
+        elif isinstance(table, ExternalFunction):
+            # call it as 'void* get_api(void)', whatever its declared signature:
+            getter = _ctype.cast(table._handle, _ctype.CFUNCTYPE(_ctype.c_void_p))
+            address = getter()
+        else:
+            address = table
+        if not address:
+            raise NullReferenceError("The function table is NULL.")
+
+        entries = (_ctype.c_void_p * len(signatures))()
+        _ctype.memmove(entries, address, _ctype.sizeof(entries))
+
+        class Entry(_ctypes.CFuncPtr):
+            _flags_ = flags
+
+        functions = {}
+        for (name, restype, argtypes), pointer in zip(signatures, entries):
+            if not pointer:
+                functions[name] = NULL
+                continue
+            func = ExternalFunction(Entry(pointer), tuple(argtypes), restype)
+            func.__name__ = name
+            functions[name] = func
+        return VTable(address, functions)
+
     @staticmethod
     def load(library, flags=0):
         typecheck(library, (str,), target_name='library')
@@ -1,6 +1,6 @@
 from ._types import *
 import _ctypes
-from typing import Optional, Any, TypeVar, overload
+from typing import Optional, Any, TypeVar, Iterator, overload
 from ..system import Library as _Library
 
 
@@ -19,6 +19,17 @@ class ExternalFunction(metaclass=MultiMeta):
     def set_restype(self, restype: type[CValidType]) -> None: ...
 
 
+class VTable(metaclass=MultiMeta):
+    def __init__(self, address: int, functions: dict[str, ExternalFunction]) -> None: ...
+    def __getattr__(self, item: str) -> ExternalFunction: ...
+    def __getitem__(self, item: str) -> ExternalFunction: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+    @property
+    def address(self) -> int: ...
+    def __repr__(self) -> str: ...
+
+
 class Library(metaclass=MultiMeta):
     # library loading flags:
     DONT_RESOLVE_DLL_REFERENCES: Flag = ...
@@ -34,6 +45,12 @@ class Library(metaclass=MultiMeta):
     LOAD_WITH_ALTERED_SEARCH_PATH: Flag = ...
     LOAD_LIBRARY_REQUIRE_SIGNED_TARGET: Flag = ...
     LOAD_LIBRARY_SAFE_CURRENT_DIRS: Flag = ...
+    # dlopen flags, on platforms other than Windows:
+    RTLD_LAZY: Flag = ...
+    RTLD_NOW: Flag = ...
+    RTLD_GLOBAL: Flag = ...
+    RTLD_LOCAL: Flag = ...
+    RTLD_NODELETE: Flag = ...
     # function loading flags:
     cdecl: Flag = ...
     FUNCFLAG_HRESULT: Flag = ...
@@ -49,6 +66,8 @@ class Library(metaclass=MultiMeta):
     def load_function(self, name: str, argtypes: tuple[type] = ..., restype: Optional[type] = ..., flags: Flag = ...) -> ExternalFunction: ...
     @overload
     def load_function(self, ordinal: int, argtypes: tuple[type] = ..., restype: Optional[type] = ..., flags: Flag = ...) -> ExternalFunction: ...
+    def cdef(self, source: str, flags: Flag = ...) -> dict[str, ExternalFunction]: ...
+    def bind_vtable(self, table: str | ExternalFunction | int, layout: str | tuple[tuple[str, Optional[type], tuple[type, ...]], ...], flags: Flag = ...) -> VTable: ...
     @staticmethod
     def load(library: str, flags: Flag = ...) -> Library: ...
     def __repr__(self) -> str: ...
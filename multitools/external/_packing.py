@@ -0,0 +1,140 @@
+import ctypes
+import functools
+import re
+import struct
+import sys
+
+
+_INT_CODES = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+"""struct integer codes by size, using standard sizes."""
+_SIGNED_CODES = 'bhilq'
+_UNSIGNED_CODES = 'BHILQNP'
+_SAME_CODES = 'fd?c'
+"""ctypes codes that mean the same in struct with standard sizes."""
+_SINGLE_CODE = re.compile(r"(\d*)(\D)")
+"""A struct format body made of a single code, with its repeat count."""
+
+
+def c_byteorder(c_type):
+    """
+    Return the byteorder used by a simple ctypes type, or None
+    if it doesn't have one.
+    """
+    if ctypes.sizeof(c_type) == 1:
+        return None
+    if getattr(c_type, '__ctype_be__', None) is c_type:
+        return 'big'
+    if getattr(c_type, '__ctype_le__', None) is c_type:
+        return 'little'
+    return sys.byteorder
+
+
+def _simple_code(c_type):
+    """
+    Return the struct code of a simple ctypes type, using
+    standard sizes, or None if struct can't represent it.
+    """
+    if issubclass(c_type, ctypes._Pointer):
+        code = 'P'
+    else:
+        code = getattr(c_type, '_type_', None)
+    if not isinstance(code, str):
+        return None
+
+    size = ctypes.sizeof(c_type)
+    if code in _SAME_CODES:
+        return code if struct.calcsize('=' + code) == size else None
+    if code in _SIGNED_CODES:
+        return _INT_CODES.get(size)
+    if code in _UNSIGNED_CODES:
+        code = _INT_CODES.get(size)
+        return code.upper() if code is not None else None
+    return None
+
+
+def _body(c_type, byteorders):
+    """
+    Return the struct format of c_type without byteorder prefix,
+    adding the byteorders it uses to byteorders.
+    Return None if struct can't represent c_type.
+    """
+    if not isinstance(c_type, type):
+        return None
+
+    if issubclass(c_type, ctypes.Array):
+        element = getattr(c_type, '_type_', None)
+        if element is None:
+            return None
+        body = _body(element, byteorders)
+        if body is None:
+            return None
+        if len(body) == 1:
+            return f"{c_type._length_}{body}"
+        return body * c_type._length_
+
+    if issubclass(c_type, ctypes.Structure):
+        body = ""
+        position = 0
+        for field in getattr(c_type, '_fields_', ()):
+            if len(field) != 2:  # bit fields
+                return None
+            name, field_type = field
+            offset = getattr(c_type, name).offset
+            if offset > position:
+                body += f"{offset - position}x"
+            field_body = _body(field_type, byteorders)
+            if field_body is None:
+                return None
+            body += field_body
+            position = offset + ctypes.sizeof(field_type)
+        if ctypes.sizeof(c_type) > position:
+            body += f"{ctypes.sizeof(c_type) - position}x"
+        return body
+
+    if issubclass(c_type, (ctypes._SimpleCData, ctypes._Pointer)):
+        code = _simple_code(c_type)
+        if code is None:
+            return None
+        byteorder = c_byteorder(c_type)
+        if byteorder is not None:
+            byteorders.add(byteorder)
+        return code
+    return None
+
+
+def struct_format(c_type):
+    """
+    Return the struct format describing one item of c_type, or
+    None if the struct module can't represent it.
+
+    Formats use standard sizes and an explicit byteorder, and
+    the padding of structures is spelled out from their ctypes
+    layout. Types mixing byteorders can't be represented.
+    """
+    byteorders = set()
+    body = _body(c_type, byteorders)
+    if (body is None) or (len(byteorders) > 1):
+        return None
+    byteorder = byteorders.pop() if byteorders else sys.byteorder
+    return ('>' if byteorder == 'big' else '<') + body
+
+
+def repeat_format(fmt, count):
+    """
+    Return the struct format of count consecutive items of fmt, which must
+    be made of a single struct code, so that the result stays as short.
+    """
+    if count == 1:
+        return fmt
+    match = _SINGLE_CODE.fullmatch(fmt, 1)
+    if match is None:
+        raise ValueError(f"Struct format '{fmt}' is made of several codes.")
+    return f"{fmt[0]}{int(match.group(1) or 1) * count}{match.group(2)}"
+
+
+@functools.lru_cache(maxsize=256)
+def compile_struct(fmt):
+    """
+    Return a compiled struct.Struct for fmt, cached by format.
+    """
+    return struct.Struct(fmt)
@@ -0,0 +1,433 @@
+from .._meta import *
+from .._type_check import typecheck
+from ._types import CType, CInstanceType, Null
+from . import _cdef
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+import _ctypes
+import ctypes
+import itertools
+import multiprocessing
+import os
+import queue
+import struct
+import threading
+
+
+# Wire format:
+#
+# batch    := count:u32 call*
+# call     := call_id:u32 function:u16 argc:u8 value*
+# replies  := count:u32 reply*
+# reply    := call_id:u32 status:u8 value
+# value    := tag:u8 payload
+#
+# Values are scalars, bytes and text, so no pickling is ever involved.
+# An empty batch asks the worker to exit.
+
+_COUNT = struct.Struct('<I')
+_CALL = struct.Struct('<IHB')
+_REPLY = struct.Struct('<IB')
+_INT64 = struct.Struct('<q')
+_UINT64 = struct.Struct('<Q')
+_DOUBLE = struct.Struct('<d')
+_LENGTH = struct.Struct('<I')
+
+_NONE = 0
+_INT = 1
+_UINT = 2
+_FLOAT = 3
+_BYTES = 4
+_TEXT = 5
+_TRUE = 6
+_FALSE = 7
+
+_OK = 0
+_ERROR = 1
+
+_READY = b"\x00"
+
+_DEFAULT_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+"""
+The start method of worker processes. Workers are started while the sender threads
+of other workers run, so forking the calling process could deadlock.
+"""
+
+
+def _encode_value(out, value):
+    """
+    Internal function appending the encoding of a value to out.
+    """
+    if value is None or isinstance(value, Null.__instance_type__):
+        out.append(_NONE)
+    elif value is True or value is False:
+        out.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            out.append(_INT)
+            out += _INT64.pack(value)
+        else:
+            out.append(_UINT)
+            out += _UINT64.pack(value)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = memoryview(value).cast('B')
+        out.append(_BYTES)
+        out += _LENGTH.pack(len(data))
+        out += data
+    elif isinstance(value, str):
+        data = value.encode('utf-8', 'surrogatepass')
+        out.append(_TEXT)
+        out += _LENGTH.pack(len(data))
+        out += data
+    elif isinstance(value, CInstanceType) and isinstance(value.handle, _ctypes._SimpleCData) \
+            and not isinstance(value.handle, ctypes.c_void_p):  # addresses are meaningless in other processes
+        _encode_value(out, value.handle.value)
+    else:
+        raise TypeError(f"Values of type '{type(value).__name__}' can't be passed to another process.")
+
+
+def _decode_value(data, offset):
+    """
+    Internal function decoding the value at offset in data,
+    returning it and the offset following it.
+    """
+    tag = data[offset]
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE or tag == _FALSE:
+        return tag == _TRUE, offset
+    if tag == _INT:
+        return _INT64.unpack_from(data, offset)[0], offset + 8
+    if tag == _UINT:
+        return _UINT64.unpack_from(data, offset)[0], offset + 8
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, offset)[0], offset + 8
+    if tag == _BYTES or tag == _TEXT:
+        length = _LENGTH.unpack_from(data, offset)[0]
+        offset += 4
+        value = bytes(data[offset:offset + length])
+        if tag == _TEXT:
+            value = value.decode('utf-8', 'surrogatepass')
+        return value, offset + length
+    raise ValueError(f"Invalid value tag {tag}.")
+
+
+def _worker_main(conn, path, source, flags):
+    """
+    Internal function running in worker processes: load the library,
+    bind its functions and answer batches of calls until told to stop.
+    """
+    from ._library import Library
+    try:
+        functions = list(Library.load(path, flags=flags).cdef(source).values())
+    except BaseException as e:
+        conn.send_bytes(f"{type(e).__name__}: {e}".encode('utf-8', 'replace'))
+        return
+    conn.send_bytes(_READY)
+
+    while True:
+        try:
+            data = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+        count = _COUNT.unpack_from(data)[0]
+        if count == 0:
+            return
+
+        offset = _COUNT.size
+        out = bytearray(_COUNT.pack(count))
+        for _ in range(count):
+            call_id, index, argc = _CALL.unpack_from(data, offset)
+            offset += _CALL.size
+            args = []
+            for _ in range(argc):
+                value, offset = _decode_value(data, offset)
+                args.append(value)
+            try:
+                result = functions[index](*args)
+                if isinstance(result, CInstanceType):
+                    result = result.handle.value
+                elif isinstance(result, Null.__instance_type__):
+                    result = None
+                reply = bytearray()
+                _encode_value(reply, result)
+                out += _REPLY.pack(call_id, _OK)
+            except Exception as e:
+                reply = bytearray()
+                _encode_value(reply, f"{type(e).__name__}: {e}")
+                out += _REPLY.pack(call_id, _ERROR)
+            out += reply
+        conn.send_bytes(out)
+
+
+class _Worker:
+    """
+    Internal class managing a worker process and the thread that
+    sends it batches of calls.
+    """
+    def __init__(self, owner):
+        self.owner = owner
+        self.calls = queue.SimpleQueue()
+        self.failure = None
+        self.process = None
+        self.conn = None
+        self.start()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def start(self):
+        context = multiprocessing.get_context(self.owner.start_method or _DEFAULT_START_METHOD)
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child, self.owner.path, self.owner.source, self.owner.flags),
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        try:
+            answer = self.conn.recv_bytes()
+        except EOFError:
+            answer = b"the worker exited while loading the library."
+        if answer != _READY:
+            self.process.join()
+            raise OSError(f"Failed to load '{self.owner.path}' in a worker process: {answer.decode('utf-8', 'replace')}")
+
+    def run(self):
+        while True:
+            first = self.calls.get()
+            if first is None:
+                self.stop()
+                return
+            batch = [first]
+            stop = False
+            while len(batch) < self.owner.batch_size:
+                try:
+                    call = self.calls.get_nowait()
+                except queue.Empty:
+                    break
+                if call is None:
+                    stop = True
+                    break
+                batch.append(call)
+            self.send(batch)
+            if stop:
+                self.stop()
+                return
+
+    def send(self, batch):
+        if self.failure is not None:
+            for future, _, _, _ in batch:
+                future.set_exception(self.failure)
+            return
+        out = bytearray(_COUNT.pack(len(batch)))
+        for call_id, (future, index, argc, args) in enumerate(batch):
+            out += _CALL.pack(call_id, index, argc)
+            out += args
+        try:
+            self.conn.send_bytes(out)
+            data = self.conn.recv_bytes()
+        except (EOFError, OSError):
+            # the worker crashed, maybe because of one of the calls:
+            self.process.join()
+            error = BrokenProcessPool(f"A worker process of '{self.owner.path}' exited abruptly, "
+                                      f"with exit code {self.process.exitcode}.")
+            for future, _, _, _ in batch:
+                future.set_exception(error)
+            self.restart()
+            return
+
+        offset = _COUNT.size
+        for _ in range(_COUNT.unpack_from(data)[0]):
+            call_id, status = _REPLY.unpack_from(data, offset)
+            value, offset = _decode_value(data, offset + _REPLY.size)
+            future, index, _, _ = batch[call_id]
+            if status == _OK:
+                future.set_result(self.owner._wrap_result(index, value))
+            else:
+                future.set_exception(OSError(value))
+
+    def restart(self):
+        self.process.join()
+        self.conn.close()
+        try:
+            self.start()
+        except OSError as e:
+            # the worker can't come back, later calls will fail:
+            self.failure = e
+
+    def stop(self):
+        try:
+            self.conn.send_bytes(_COUNT.pack(0))
+        except OSError:
+            pass
+        self.process.join()
+        self.conn.close()
+
+
+class ProcessBoundLibrary(metaclass=MultiMeta):
+    """
+    A library loaded in each worker of a pool of processes.
+
+    Calls are forwarded to the workers through pipes, so that
+    libraries that are not thread-safe, or that may crash, can be
+    used from several threads and cores without risking the
+    calling process:
+
+    lib = ProcessBoundLibrary("libfoo.so", "double compute(double, int);")
+    lib.compute(1.5, 3)
+
+    Arguments and results are limited to scalars, bytes and text,
+    which are sent without pickling. Queued calls are sent to
+    workers in batches, and calls sharing an affinity key always
+    run in the same worker. Workers are started with the
+    'forkserver' method where available, and 'spawn' otherwise,
+    so scripts creating them need an "if __name__ == '__main__'"
+    guard. Functions returning pointers are rejected.
+    """
+    DEFAULT_BATCH_SIZE = 64
+
+    def __init__(self, path, source, workers=None, flags=0, batch_size=DEFAULT_BATCH_SIZE, start_method=None):
+        """
+        Start workers processes, each of them loading the library at
+        path and binding the functions declared by source, like
+        Library.cdef does. By default, there is a worker per CPU.
+        """
+        typecheck(path, (str,), target_name='path')
+        typecheck(source, (str,), target_name='source')
+        typecheck(workers, (int, type(None)), target_name='workers')
+        typecheck(flags, (int,), target_name='flags')
+        typecheck(batch_size, (int,), target_name='batch_size')
+        typecheck(start_method, (str, type(None)), target_name='start_method')
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError("'workers': Expected a positive number of workers.")
+        if batch_size <= 0:
+            raise ValueError("'batch_size': Expected a positive batch size.")
+
+        self.path = path
+        self.source = source
+        self.flags = flags
+        self.batch_size = batch_size
+        self.start_method = start_method
+
+        self._signatures = _cdef.signatures(_cdef.parse(source), {})
+        for name, restype, _ in self._signatures:
+            if (restype is not None) and issubclass(restype.__c_origin__, (ctypes.c_void_p, ctypes._Pointer, _ctypes.CFuncPtr)):
+                # addresses are meaningless in other processes:
+                raise TypeError(f"'{name}' returns a pointer, which can't be passed to another process.")
+        self._indices = {name: index for index, (name, _, _) in enumerate(self._signatures)}
+        self._next = itertools.count()
+        self._closed = False
+        self._workers = []
+        try:
+            for _ in range(workers):
+                self._workers.append(_Worker(self))
+        except BaseException:
+            self.close()
+            raise
+
+    def _wrap_result(self, index, value):
+        """
+        Internal method converting a result received from a worker to the return type
+        of the function at index.
+        """
+        restype = self._signatures[index][1]
+        if restype is None:
+            return None
+        if value is None:
+            from ._library import NULL
+            return NULL
+        return restype(value)
+
+    def submit(self, name, *args, affinity=None):
+        """
+        Queue a call to the function of the given name and return a
+        future for its result. Calls with the same affinity key are
+        run by the same worker, in order. Other calls are spread over
+        the workers.
+        """
+        typecheck(name, (str,), target_name='name')
+        if self._closed:
+            raise RuntimeError("Can't call functions of a closed library.")
+        index = self._indices.get(name)
+        if index is None:
+            raise NameError(f"'{name}' was not declared for '{self.path}'.")
+        argtypes = self._signatures[index][2]
+        if len(args) != len(argtypes):
+            raise TypeError(f"'{name}' takes {len(argtypes)} arguments, got {len(args)}.")
+
+        encoded = bytearray()
+        for arg in args:
+            _encode_value(encoded, arg)
+
+        if affinity is None:
+            worker = self._workers[next(self._next) % len(self._workers)]
+        else:
+            worker = self._workers[hash(affinity) % len(self._workers)]
+        if worker.failure is not None:
+            raise worker.failure
+        future = Future()
+        worker.calls.put((future, index, len(args), encoded))
+        return future
+
+    def call(self, name, *args, affinity=None):
+        """
+        Call the function of the given name in a worker and wait for
+        its result.
+        """
+        return self.submit(name, *args, affinity=affinity).result()
+
+    def map(self, name, args_list, affinity=None):
+        """
+        Call the function of the given name once per argument tuple
+        of args_list and return the results in order. Calls are sent
+        to the workers in batches.
+        """
+        futures = [self.submit(name, *args, affinity=affinity) for args in args_list]
+        return [future.result() for future in futures]
+
+    def __getattr__(self, item):
+        typecheck(item, (str,), target_name='item')
+        if item.startswith('_') or item not in self.__dict__.get('_indices', ()):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'.")
+
+        def function(*args, affinity=None):
+            return self.call(item, *args, affinity=affinity)
+
+        function.__name__ = item
+        return function
+
+    def close(self):
+        """
+        Stop the worker processes, once the calls already queued are done.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for worker in self._workers:
+            worker.calls.put(None)
+        for worker in self._workers:
+            worker.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def workers(self):
+        """
+        The number of worker processes.
+        """
+        return len(self._workers)
+
+    def __repr__(self):
+        return f"<process bound library '{self.path}' ({len(self._workers)} workers) at {hex(id(self))}>"
+
@@ -0,0 +1,26 @@
+from .._meta import *
+from ._types import CInstanceType
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+
+class ProcessBoundLibrary(metaclass=MultiMeta):
+    DEFAULT_BATCH_SIZE: int = ...
+    path: str
+    source: str
+    flags: int
+    batch_size: int
+    start_method: Optional[str]
+
+    def __init__(self, path: str, source: str, workers: Optional[int] = ..., flags: int = ...,
+                 batch_size: int = ..., start_method: Optional[str] = ...) -> None: ...
+    def submit(self, name: str, *args: Any, affinity: Optional[Hashable] = ...) -> Future: ...
+    def call(self, name: str, *args: Any, affinity: Optional[Hashable] = ...) -> CInstanceType | None: ...
+    def map(self, name: str, args_list: Iterable[tuple], affinity: Optional[Hashable] = ...) -> list[CInstanceType | None]: ...
+    def __getattr__(self, item: str) -> Callable[..., CInstanceType | None]: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> ProcessBoundLibrary: ...
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None: ...
+    @property
+    def workers(self) -> int: ...
+    def __repr__(self) -> str: ...
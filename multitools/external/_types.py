@@ -1,11 +1,41 @@
+import array
 import ctypes
 import _ctypes
+import functools
+import operator
+import struct
 from .._meta import *
 from .._ref import reference
 from .._type_check import *
 import sys
 from .._multidict import *
 from ..errors import *
+from . import _packing
+
+
+class _CField:
+    """
+    Direct, read-only access to a value held by a C instance.
+
+    Unlike 'reference', the dotted path is compiled once into
+    an accessor, so reading the field costs a single call.
+    """
+    __slots__ = ('_getter', '_default')
+
+    def __init__(self, path, default):
+        self._getter = operator.attrgetter(path)
+        self._default = default
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self._default
+        try:
+            return self._getter(instance)
+        except AttributeError:
+            return self._default
+
+    def __set__(self, instance, value):
+        raise AttributeError("Read-only attribute.")
 
 
 class CInstanceType(metaclass=MultiMeta):
@@ -17,16 +47,23 @@ class CInstanceType(metaclass=MultiMeta):
     C instances and C types are stored and managed independantly.
 
     C instances store various data, organized as following:
+    - '_handle': the underlying ctypes object
+    - '_type': the CType the instance was created from
+    - '_extra': the values of the extra data declared in '__extra_keys__'
 
+    Instances only use slots, so subclasses must declare
+    '__slots__' as well to keep the compact layout.
     """
-    value = reference('_handle.value', b"", writable=False)
+    __slots__ = ('_handle', '_type', '_extra')
+
+    value = _CField('_handle.value', b"")
     """The value contained by the instance."""
-    handle = reference('_handle', None, writable=False)
+    handle = _CField('_handle', None)
     """The underlying ctypes._CData instance associated to the C object."""
-    ctype = reference("_type", None, writable=False)
+    ctype = _CField('_type', None)
     """The CType associated with this instance."""
-    __extra__ = MultiDict({})
-    """extra data that can be stored inside the instance."""
+    __extra_keys__ = ()
+    """The names of the extra data that can be stored inside the instance."""
 
     @classmethod
     def __new__(cls, *args, **kwargs):
@@ -35,9 +72,19 @@ class CInstanceType(metaclass=MultiMeta):
         Add all keyword arguments to the extra values stored into the instance.
         """
         instance = super().__new__(cls)
-        instance.__extra__ = MultiDict(kwargs)
+        instance._extra = SlotTable.new_values(cls.__extra_keys__)
+        extra = instance.__extra__
+        for key, value in kwargs.items():
+            if key not in cls.__extra_keys__:
+                raise TypeError(f"'{key}': '{cls.__name__}' objects store no such extra data.")
+            extra[key] = value
         return instance
 
+    @property
+    def __extra__(self):
+        """extra data that can be stored inside the instance."""
+        return SlotTable(self.__extra_keys__, self._extra)
+
     def __init__(self, handle):
         """
         Create a new C object.
@@ -60,14 +107,187 @@ class CInstanceType(metaclass=MultiMeta):
     def __class_subclasscheck__(cls, subclass):
         return cls in subclass.__bases__
 
+    def __reduce__(self):
+        """
+        Implement pickling: instances are saved as a reference to their
+        CType and the value returned by its '__dump__' method.
+        """
+        ctype = self._type
+        return _unpickle, (_type_ref(ctype), ctype.__dump__(self))
+
+    def __reduce_ex__(self, protocol):
+        return self.__reduce__()
+
     def __repr__(self):
         """
         Implement repr(self)
         """
-        name = ' '.join(self.ctype.__tpwords__)
+        if '__tpwords__' in vars(self.ctype):
+            name = ' '.join(self.ctype.__tpwords__)
+        else:  # words are only set on types created by cls[...]
+            name = self.ctype.__tpname__
         return f"<C '{name}' object>"
 
 
+_variants = {}
+"""The types created by CType.__class_getitem__, by (base, details)."""
+_variant_keys = {}
+"""The (base, details) each type created by CType.__class_getitem__ was created from."""
+_type_refs = {}
+"""The object pickled in place of each CType, by type."""
+_structs = {}
+"""The compiled struct.Struct of each CType, by type."""
+
+
+class _TypeRef:
+    """
+    Stand-in pickled for the types created by CType.__class_getitem__,
+    which can't be pickled by name: they are created again from their
+    base and details when unpickled.
+    """
+    __slots__ = ('base', 'details')
+
+    def __init__(self, base, details):
+        self.base = base
+        self.details = details
+
+    def __reduce__(self):
+        return _variant, (self.base, self.details)
+
+
+def _type_ref(cls):
+    """
+    Return the object to pickle in place of a CType, interned by type
+    so that instances of the same type share it in a pickle stream.
+    """
+    try:
+        return _type_refs[cls]
+    except KeyError:
+        pass
+    if cls in _variant_keys:
+        base, details = _variant_keys[cls]
+        ref = _TypeRef(_type_ref(base), _details_ref(details))
+    else:
+        ref = cls  # pickled by name
+    _type_refs[cls] = ref
+    return ref
+
+
+def _details_ref(details):
+    if isinstance(details, tuple):
+        return tuple(_details_ref(detail) for detail in details)
+    if isinstance(details, type):
+        return _type_ref(details)
+    return details
+
+
+def _variant(base, details):
+    return base[details]
+
+
+def _unpickle(ctype, data):
+    return ctype.__load__(data)
+
+
+def _from_handle(ctype, handle):
+    """
+    Create an instance of ctype around a ctypes object of the right type,
+    skipping the checks and conversions done by ctype.__wrap__.
+    """
+    instance_type = ctype.__instance_type__
+    instance = object.__new__(instance_type)
+    instance._handle = handle
+    instance._type = ctype
+    instance._extra = SlotTable.new_values(instance_type.__extra_keys__)
+    return instance
+
+
+_AGGREGATES = (ctypes.Array, ctypes.Structure, ctypes.Union)
+"""The ctypes types whose values are packed from sequences of elements or fields."""
+_POINTER_CODES = frozenset('zZPO')
+"""The '_type_' codes of the simple ctypes types holding a pointer."""
+
+
+@functools.lru_cache(maxsize=None)
+def _has_pointers(c_type):
+    """
+    Tell whether values of a ctypes type hold pointers, whose raw
+    bytes are meaningless in another process.
+    """
+    if issubclass(c_type, ctypes.Array):
+        return _has_pointers(c_type._type_)
+    if issubclass(c_type, (ctypes.Structure, ctypes.Union)):
+        return any(_has_pointers(field[1]) for field in getattr(c_type, '_fields_', ()))
+    if issubclass(c_type, _ctypes._SimpleCData):
+        return c_type._type_ in _POINTER_CODES
+    return True  # pointers, function pointers, and anything unknown
+
+
+class _TypeProperty:
+    """
+    A read-only attribute computed from the type it is read on.
+    """
+    __slots__ = ('_getter',)
+
+    def __init__(self, getter):
+        self._getter = getter
+
+    def __get__(self, instance, owner):
+        return self._getter(owner)
+
+
+def _struct_format(cls):
+    try:
+        return cls.__struct__().format
+    except TypeError:
+        return None
+
+
+def _c_size(cls):
+    try:
+        return ctypes.sizeof(cls.__c_origin__)
+    except TypeError:
+        return None
+
+
+def _with_byteorder(c_type, byteorder):
+    """
+    Return the variant of a simple ctypes type that stores
+    its value using the given byteorder.
+    """
+    if byteorder not in ('big', 'little'):
+        raise ValueError(f"'byteorder': Expected 'big' or 'little', got {repr(byteorder)} instead.")
+    # single-byte types have no byteorder, hence no variants:
+    if byteorder == 'big':
+        return getattr(c_type, '__ctype_be__', c_type)
+    return getattr(c_type, '__ctype_le__', c_type)
+
+
+def _byteswap(c_type, data):
+    """
+    Return a copy of data where every item of type c_type has
+    its bytes reversed. The whole buffer is swapped at once.
+    """
+    size = ctypes.sizeof(c_type)
+    if size == 1:
+        return bytes(data)
+    if len(data) % size != 0:
+        raise BufferError(f"Buffer size must be a multiple of {size}.")
+
+    code = getattr(c_type, '_type_', None)
+    if (code in array.typecodes) and (array.array(code).itemsize == size):
+        items = array.array(code, bytes(data))
+        items.byteswap()
+        return items.tobytes()
+
+    # no matching array typecode, swap using one slice per byte of an item:
+    data = memoryview(data).cast('B')
+    result = bytearray(len(data))
+    for i in range(size):
+        result[i::size] = data[size - 1 - i::size]
+    return bytes(result)
+
+
 class CType(metaclass=MultiMeta):
     __c_origin__ = ctypes.py_object
     """The ctypes type the CType corresponds and should be converted to"""
@@ -81,6 +301,10 @@ class CType(metaclass=MultiMeta):
     """The words used to represent the type"""
     __extra__ = MultiDict({})
     """Extra data that are to be stored in the class and the instance."""
+    __struct_format__ = _TypeProperty(_struct_format)
+    """The struct format of one value of the type, None if it can't be packed."""
+    __c_size__ = _TypeProperty(_c_size)
+    """The size in bytes of one value of the type, None if it has no fixed size."""
 
     @classmethod
     def __new__(cls, *args, **kwargs):
@@ -90,7 +314,6 @@ class CType(metaclass=MultiMeta):
         args = list(args)
         while (len(args) > 0) and isinstance(args[0], type):
             args.pop(0)
-        print(args)
         instance = cls.__instance_type__.__new__(cls.__instance_type__, *args, **kwargs)
         setattr(instance, "_type", cls)
         instance.__init__(*args, **kwargs)
@@ -117,13 +340,7 @@ class CType(metaclass=MultiMeta):
         """
         if subclass is None:
             return False
-
-        if CType in subclass.__bases__ or subclass is CType:
-            return True
-        for base in subclass.__bases__:
-            if CType in base.__bases__:
-                return True
-        return False
+        return CType in getattr(subclass, '__mro__', ())
 
     @classmethod
     def __class_getitem__(cls, item):
@@ -134,14 +351,26 @@ class CType(metaclass=MultiMeta):
         if not isinstance(item, (tuple, list)):
             item = (item,)
 
-        cls.__tpwords__ = [cls.__tpname__]
-
         if item[0] == "pytype":
             return cls.__py_origin__
         elif item[0] == "ctype":
             return cls.__c_origin__
-        result = cls.__detail__(*item)
-        setattr(result.__instance_type__, '_type', result.__c_origin__)
+
+        # details are applied to a subclass, so that cls itself is never modified:
+        key = (cls, tuple(item))
+        try:
+            return _variants[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable details can't be cached
+            key = None
+
+        variant = type(cls)(cls.__name__, (cls,), {'__module__': cls.__module__, '__qualname__': cls.__qualname__})
+        variant.__tpwords__ = [variant.__tpname__]
+        result = variant.__detail__(*item)
+        if key is not None:
+            _variants[key] = result
+        _variant_keys[result] = (cls, tuple(item))
         return result
 
     @classmethod
@@ -152,6 +381,17 @@ class CType(metaclass=MultiMeta):
         """
         return cls
 
+    @classmethod
+    def __wrap__(cls, c_instance):
+        """
+        Create an instance of cls around an existing ctypes object,
+        without converting or copying it.
+        """
+        instance = cls.__instance_type__.__new__(cls.__instance_type__)
+        instance._type = cls
+        CInstanceType.__init__(instance, c_instance)
+        return instance
+
     @classmethod
     def __to_c__(cls, instance):
         """
@@ -174,6 +414,107 @@ class CType(metaclass=MultiMeta):
         typecheck(c_instance, (cls.__c_origin__,), target_name='c_instance')
         return cls(c_instance.value)
 
+    @classmethod
+    def __dump__(cls, instance):
+        """
+        Return the data instance is pickled as: the raw bytes of its
+        C value by default.
+        """
+        handle = instance.handle
+        if handle is None:
+            return None
+        if _has_pointers(type(handle)):
+            raise ValueError(f"C type '{cls.__tpname__}' holds pointers and can't be pickled.")
+        return bytes(handle)
+
+    @classmethod
+    def __load__(cls, data):
+        """
+        Create an instance of cls from the data returned by '__dump__'.
+        """
+        if data is None:
+            return cls.__wrap__(None)
+        return _from_handle(cls, cls.__c_origin__.from_buffer_copy(data))
+
+    @classmethod
+    def __struct__(cls):
+        """
+        Return the compiled struct.Struct packing one value of cls.
+        Compiled structs are cached by type.
+        """
+        try:
+            return _structs[cls]
+        except KeyError:
+            pass
+        fmt = _packing.struct_format(cls.__c_origin__)
+        if fmt is None:
+            raise TypeError(f"C type '{cls.__tpname__}' can't be packed.")
+        result = _structs[cls] = _packing.compile_struct(fmt)
+        return result
+
+    @classmethod
+    def pack(cls, values, buffer=None, offset=0):
+        """
+        Pack a sequence of values of cls into their C representation.
+        Values of arrays and structs are sequences of their elements
+        or fields, packed one by one using the compiled struct of cls.
+        If buffer is given, the values are packed into it at offset
+        and the number of bytes written is returned. Otherwise, the
+        packed bytes are returned.
+        """
+        item = cls.__struct__()
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        size = item.size * len(values)
+        if not issubclass(cls.__c_origin__, _AGGREGATES):
+            # a single struct code with a repeat count packs them all at once:
+            fmt = _packing.repeat_format(item.format, len(values))
+            if buffer is None:
+                return struct.pack(fmt, *values)
+            struct.pack_into(fmt, buffer, offset, *values)
+            return size
+
+        result = buffer is None
+        if result:
+            buffer = bytearray(size)
+            offset = 0
+        pack_into = item.pack_into
+        for value in values:
+            pack_into(buffer, offset, *value)
+            offset += item.size
+        return bytes(buffer) if result else size
+
+    @classmethod
+    def unpack(cls, buffer, offset=0, count=None):
+        """
+        Unpack values of cls from their C representation in buffer,
+        starting at offset.
+        Read count values, or as many as the buffer holds if None.
+        Values of arrays and structs are returned as tuples.
+        """
+        item = cls.__struct__()
+        if count is None:
+            count = (memoryview(buffer).nbytes - offset) // item.size
+        if not issubclass(cls.__c_origin__, _AGGREGATES):
+            return list(struct.unpack_from(_packing.repeat_format(item.format, count), buffer, offset))
+
+        data = memoryview(buffer).cast('B')[offset:offset + count * item.size]
+        if len(data) != count * item.size:
+            raise struct.error(f"unpack requires a buffer of at least {offset + count * item.size} bytes.")
+        return list(item.iter_unpack(data))
+
+    @classmethod
+    def iter_unpack(cls, buffer):
+        """
+        Iterate over the values of cls packed in buffer, whose
+        size must be a multiple of the size of cls.
+        Values of arrays and structs are returned as tuples.
+        """
+        item = cls.__struct__()
+        if not issubclass(cls.__c_origin__, _AGGREGATES):
+            return map(operator.itemgetter(0), item.iter_unpack(buffer))
+        return item.iter_unpack(buffer)
+
 
 CType.from_param = classmethod(lambda cls: cls.__c_origin__)
 CInstanceType.from_param = lambda self: self._handle
@@ -184,20 +525,20 @@ class _WithSign(metaclass=MultiMeta):
 
 
 class _WithByteOrder(metaclass=MultiMeta):
-    byteorder = reference('__extra__.byteorder', 'big', writable=False)
+    byteorder = reference('__extra__.byteorder', sys.byteorder, writable=False)
 
 
 class CIntInstance(CInstanceType, metaclass=MultiMeta):
-    signed = reference('ctype.signed', True)
+    __slots__ = ()
+    signed = _CField('_type.signed', True)
     """Whether this instance is signed or not."""
-    byteorder = reference('ctype.byteorder', 'big')
+    byteorder = _CField('_type.byteorder', sys.byteorder)
     """The byteorder used to interpret this instance."""
 
     def __init__(self, value):
         """
         Initialize a C integer instance.
         """
-        print(self.ctype)
         super().__init__(self.ctype.__c_origin__(value))
 
 
@@ -206,6 +547,8 @@ class Int(CType, _WithSign, _WithByteOrder, metaclass=MultiMeta):
     __py_origin__ = int
     __instance_type__ = CIntInstance
     __tpname__ = "int"
+    __c_signs__ = (ctypes.c_int, ctypes.c_uint)
+    """The signed and unsigned ctypes types Int[...] picks from."""
 
     @classmethod
     def __detail__(cls, *args):
@@ -219,7 +562,7 @@ class Int(CType, _WithSign, _WithByteOrder, metaclass=MultiMeta):
         if args[0] is False:
             result.__tpwords__ = ["unsigned", *result.__tpwords__]
         result.byteorder = args[1]
-        result.__c_origin__ = ctypes.c_int if result.signed else ctypes.c_uint
+        result.__c_origin__ = _with_byteorder(cls.__c_signs__[0] if result.signed else cls.__c_signs__[1], result.byteorder)
         return result
 
 
@@ -228,11 +571,12 @@ class _WithLength(metaclass=MultiMeta):
 
 
 class CLongInstance(CInstanceType, metaclass=MultiMeta):
-    signed = reference('ctype.signed', True)
+    __slots__ = ()
+    signed = _CField('_type.signed', True)
     """Whether this instance is signed or not."""
-    byteorder = reference('ctype.byteorder', 'big')
+    byteorder = _CField('_type.byteorder', sys.byteorder)
     """The byteorder used to interpret this instance."""
-    long = reference('ctype.long', False)
+    long = _CField('_type.long', False)
     """Whether this instance is a C 'long long' or just a C 'long'."""
 
     def __init__(self, value):
@@ -260,17 +604,19 @@ class Long(Int, _WithLength, metaclass=MultiMeta):
         result.byteorder = args[1]
         result.long = args[2]
         if result.long:
-            result.__c_origin__ = ctypes.c_longlong if result.signed else ctypes.c_ulonglong
+            c_type = ctypes.c_longlong if result.signed else ctypes.c_ulonglong
         else:
-            result.__c_origin__ = ctypes.c_long if result.signed else ctypes.c_ulong
+            c_type = ctypes.c_long if result.signed else ctypes.c_ulong
+        result.__c_origin__ = _with_byteorder(c_type, result.byteorder)
 
         return result
 
 
 class CShortInstance(CInstanceType, metaclass=MultiMeta):
-    signed = reference('ctype.signed', True)
+    __slots__ = ()
+    signed = _CField('_type.signed', True)
     """Whether this instance is signed or not."""
-    byteorder = reference('ctype.byteorder', 'big')
+    byteorder = _CField('_type.byteorder', sys.byteorder)
     """The byteorder used to interpret this instance."""
 
     def __init__(self, value):
@@ -280,15 +626,17 @@ class CShortInstance(CInstanceType, metaclass=MultiMeta):
 class Short(Int, metaclass=MultiMeta):
     __tpname__ = 'short'
     __c_origin__ = ctypes.c_short
+    __c_signs__ = (ctypes.c_short, ctypes.c_ushort)
     __instance_type__ = CShortInstance
 
 
 class CSize_tInstance(CInstanceType, metaclass=MultiMeta):
+    __slots__ = ()
     def __init__(self, value):
         super().__init__(self.ctype.__c_origin__(value))
 
 
-class Size_t(Int[False, 'big'], metaclass=MultiMeta):
+class Size_t(Int[False, sys.byteorder], metaclass=MultiMeta):
     __c_origin__ = ctypes.c_size_t
     __instance_type__ = CSize_tInstance
     __tpname__ = 'size_t'
@@ -302,12 +650,13 @@ class Size_t(Int[False, 'big'], metaclass=MultiMeta):
 
 
 class CSsize_tInstance(CInstanceType, metaclass=MultiMeta):
+    __slots__ = ()
     def __init__(self, value):
         # noinspection PyArgumentList
         super().__init__(self.ctype.__c_origin__(value))
 
 
-class SSize_t(Int[True, 'big'], metaclass=MultiMeta):
+class SSize_t(Int[True, sys.byteorder], metaclass=MultiMeta):
     __c_origin__ = ctypes.c_ssize_t
     __instance_type__ = CSsize_tInstance
     __tpname__ = 'ssize_t'
@@ -321,6 +670,7 @@ class SSize_t(Int[True, 'big'], metaclass=MultiMeta):
 
 
 class CFloatInstance(CInstanceType, metaclass=MultiMeta):
+    __slots__ = ()
     def __init__(self, value):
         super().__init__(self.ctype.__c_origin__(value))
 
@@ -333,7 +683,8 @@ class Float(CType, metaclass=MultiMeta):
 
 
 class CDoubleInstance(CInstanceType, metaclass=MultiMeta):
-    long = reference('ctype.long', False)
+    __slots__ = ()
+    long = _CField('_type.long', False)
     """Whether this instance is a C 'long double' or just a 'double'."""
 
     def __init__(self, value):
@@ -360,6 +711,7 @@ class Double(Float, _WithLength, _WithSign, metaclass=MultiMeta):
 
 
 class CBoolInstance(CInstanceType, metaclass=MultiMeta):
+    __slots__ = ()
     def __init__(self, value):
         super().__init__(self.ctype.__c_origin__(value))
 
@@ -375,12 +727,49 @@ class _WithEncoding(metaclass=MultiMeta):
     encoding = reference('__extra__.encoding', sys.getdefaultencoding())
 
 
+_ENCODE_CACHE_SIZE = 4096
+"""The number of encoded strings kept for reuse by '_encode'."""
+_ENCODE_CACHE_MAX_LENGTH = 256
+"""Strings longer than this are always encoded again."""
+
+
+@functools.lru_cache(maxsize=_ENCODE_CACHE_SIZE)
+def _cached_encode(value, encoding):
+    return bytes(value, encoding=encoding)
+
+
+def _encode(value, encoding):
+    """
+    Return the C string of value in the given encoding.
+
+    Short strings are kept in a bounded LRU cache, so that repeated
+    arguments are only encoded once. The returned bytes are shared,
+    so they must only be passed as 'const char*'.
+    """
+    if len(value) > _ENCODE_CACHE_MAX_LENGTH:
+        return bytes(value, encoding=encoding)
+    return _cached_encode(value, encoding)
+
+
 class CStrInstance(CInstanceType, metaclass=MultiMeta):
+    __slots__ = ('_text',)
     encoding = reference('ctype.encoding', sys.getdefaultencoding())
     """The encoding used to understand this instance."""
 
     def __init__(self, value):
-        super().__init__(self.ctype.__c_origin__(bytes(value, encoding=self.encoding)))
+        """
+        Initialize a C string from either a python string or
+        already encoded bytes. Bytes are used as is and are only
+        decoded when the python value is read.
+        """
+        if isinstance(value, str):
+            self._text = value
+            # only strings that C can't modify share their encoded bytes:
+            value = _encode(value, self.encoding) if self.ctype.const else bytes(value, encoding=self.encoding)
+        super().__init__(self.ctype.__c_origin__(value))
+
+    def __str__(self):
+        return self.ctype.__to_py__(self)
 
 
 class Str(CType, _WithEncoding, metaclass=MultiMeta):
@@ -388,40 +777,62 @@ class Str(CType, _WithEncoding, metaclass=MultiMeta):
     __py_origin__ = str
     __instance_type__ = CStrInstance
     __tpname__ = 'const char*'
-
-    def __new__(cls, *args, **kwargs):
-        # noinspection PyTypeChecker
-        self = super().__new__(cls, *args, **kwargs)
-        self.encoding = cls.encoding
-        return self
+    const = True
+    """Whether C functions don't modify the string, so that it can be shared."""
 
     @classmethod
     def __detail__(cls, *args):
         """
-        Str[encoding: str] -> type[Str]
+        Str[encoding: str, const: bool = True] -> type[Str]
         """
-        if len(args) != 1:
+        if len(args) not in (1, 2):
             return cls
         result = cls
         typecheck(args[0], (str,), target_name='encoding')
         result.encoding = args[0]
+        if len(args) == 2:
+            typecheck(args[1], (bool,), target_name='const')
+            result.const = args[1]
+            if not result.const:
+                result.__tpname__ = 'char*'
+                result.__tpwords__ = [result.__tpname__]
         return result
 
     @classmethod
     def __to_py__(cls, instance):
-        return str(instance.value, encoding=cls.encoding)
+        # decode lazily, and only once per instance:
+        try:
+            return instance._text
+        except AttributeError:
+            pass
+        value = instance.value
+        if value is None:
+            return None
+        text = instance._text = str(value, encoding=cls.encoding)
+        return text
 
     @classmethod
     def __from_c__(cls, c_instance):
-        typecheck(c_instance, (cls.__c_origin__,))
-        return cls.__instance_type__(str(c_instance.value, encoding=cls.encoding))
+        typecheck(c_instance, (cls.__c_origin__,), target_name='c_instance')
+        return cls.__wrap__(c_instance)
+
+    @classmethod
+    def __dump__(cls, instance):
+        return instance.value  # the string rather than its address
+
+    @classmethod
+    def __load__(cls, data):
+        return cls(data)
 
 
 class CCharInstance(CInstanceType, metaclass=MultiMeta):
+    __slots__ = ()
     encoding = reference("ctype.encoding", sys.getdefaultencoding())
     """The encoding used to understand this instance."""
 
     def __init__(self, value):
+        if isinstance(value, str):
+            value = _encode(value, self.encoding)
         super().__init__(self.ctype.__c_origin__(value))
 
 
@@ -431,12 +842,6 @@ class Char(CType, _WithEncoding, metaclass=MultiMeta):
     __instance_type__ = CCharInstance
     __tpname__ = 'char'
 
-    def __new__(cls, *args, **kwargs):
-        # noinspection PyTypeChecker
-        instance = super().__new__(cls, *args, **kwargs)
-        instance.encoding = cls.encoding
-        return instance
-
     @classmethod
     def __detail__(cls, *args):
         """
@@ -446,7 +851,7 @@ class Char(CType, _WithEncoding, metaclass=MultiMeta):
             return cls
         result = cls
         typecheck(args[0], (str,), target_name='encoding')
-        result._encoding = args[0]
+        result.encoding = args[0]
         return result
 
     @classmethod
@@ -455,6 +860,7 @@ class Char(CType, _WithEncoding, metaclass=MultiMeta):
 
 
 class NullInstance(CInstanceType, metaclass=MultiMeta):
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         super().__init__(None)
 
@@ -580,7 +986,8 @@ class Null(CType, metaclass=MultiMeta):
 
 
 class CBytesInstance(CInstanceType, metaclass=MultiMeta):
-    signed = reference("ctype.signed", True)
+    __slots__ = ()
+    signed = _CField('_type.signed', True)
     """Whether this instance is signed or not."""
 
     def __init__(self, value):
@@ -609,7 +1016,9 @@ class Bytes(CType, _WithSign, metaclass=MultiMeta):
 
 
 class CPtrInstance(CInstanceType, metaclass=MultiMeta):
-    ptrtype = reference("ctype.ptrtype", None)
+    __slots__ = ()
+    __extra_keys__ = ('address',)
+    ptrtype = _CField('_type.ptrtype', None)
     """The type of data the pointer points to. None means void* pointer."""
 
     def __init__(self, address):
@@ -617,7 +1026,7 @@ class CPtrInstance(CInstanceType, metaclass=MultiMeta):
         Initialize a new pointer instance.
         """
         self.__extra__.address = address
-        super().__init__(self.ctype.__c_origin__(ctypes.cast(address, self.ctype.__c_origin__)))
+        super().__init__(ctypes.cast(address, self.ctype.__c_origin__))
 
     def contents(self):
         c_handle = self.handle.contents
@@ -625,19 +1034,13 @@ class CPtrInstance(CInstanceType, metaclass=MultiMeta):
 
 
 class Ptr(CType, metaclass=MultiMeta):
-    __c_origin__ = ctypes.pointer
+    __c_origin__ = ctypes.c_void_p
     __py_origin__ = reference('type.__py_origin__', object, writable=False)
     __instance_type__ = CPtrInstance
     __tpname__ = "void*"
 
     ptrtype = reference('__extra__.type', None)
 
-    @classmethod
-    def __new__(cls, *args, **kwargs):
-        self = super().__new__(cls, *args, **kwargs)
-        self.__extra__.address = 0
-        return self
-
     @classmethod
     def __detail__(cls, *args):
         """
@@ -650,9 +1053,10 @@ class Ptr(CType, metaclass=MultiMeta):
                   check_func=lambda: isinstance(args[0], (type, MultiMeta)) and issubclass(args[0], CType))
         result.ptrtype = args[0]
         result.__c_origin__ = ctypes.POINTER(args[0].__c_origin__)
-        result.__tpwords__ = cls.ptrtype.__tpwords__
-        result.__tpwords__[-1] = result.__tpwords__[-1] + "*"
-        result.__tpname__ = ' '.join(result.__tpwords__)
+        words = list(args[0].__tpwords__) if '__tpwords__' in vars(args[0]) else [args[0].__tpname__]
+        words[-1] = words[-1] + "*"
+        result.__tpwords__ = words
+        result.__tpname__ = ' '.join(words)
         return result
 
     @classmethod
@@ -673,35 +1077,55 @@ class Ptr(CType, metaclass=MultiMeta):
 
     @classmethod
     def __from_c__(cls, c_instance):
-        typecheck(c_instance, (cls.__c_origin__,))
+        typecheck(c_instance, (cls.__c_origin__,), target_name='c_instance')
         return cls.__instance_type__(c_instance.value)
 
+    @classmethod
+    def __dump__(cls, instance):
+        # addresses would dangle in another process, as for the C types holding pointers:
+        raise ValueError(f"C type '{cls.__tpname__}' holds pointers and can't be pickled.")
+
 
 class ArrayInstance(CInstanceType, metaclass=MultiMeta):
-    arrtype = reference("ctype.arrtype", None)
+    __slots__ = ()
+    arrtype = _CField('_type.arrtype', None)
 
     def __init__(self, *elements):
+        instance_type = self.arrtype.__instance_type__
+        typecheck_many(elements, (instance_type, type(None)), target_name='elements',
+                       expected_type_name=instance_type.__name__)
         celements = []
         for element in elements:
             if element is None:
                 celements.append(None)
                 continue
-            typecheck(element, (self.ctype.__instance_type__,))
             celements.append(element.ctype.__to_c__(element))
 
         if len(elements) != len(self):
             raise BufferError("Array initializer of the wrong size.")
-        Arr_tp = self.ctype.__c_origin__ * len(elements)
-        super().__init__(Arr_tp(*celements))
+        super().__init__(self.ctype.__c_origin__(*celements))
+
+    def __len__(self):
+        return self.ctype.arrlength
 
     def __iter__(self):
-        self._itercount = 0
-        return self
+        arrtype = self.arrtype
+        for value in self.handle:
+            yield arrtype(value)
 
-    def __next__(self):
-        result = self.handle[self._itercount]
-        self._itercount += 1
-        return self.arrtype.__from_c__(result)
+    def tobytes(self, byteorder=None):
+        """
+        Return the raw bytes of the array's elements, laid out using
+        the given byteorder, or the element type's own byteorder if
+        None. The whole buffer is swapped at once when needed.
+        """
+        typecheck(byteorder, (str, type(None)), target_name='byteorder')
+        data = bytes(self.handle)
+        own_byteorder = getattr(self.arrtype, 'byteorder', sys.byteorder)
+        if (byteorder is None) or (byteorder == own_byteorder):
+            return data
+        _with_byteorder(self.arrtype.__c_origin__, byteorder)  # validate byteorder
+        return _byteswap(self.arrtype.__c_origin__, data)
 
 
 class Array(CType, metaclass=MultiMeta):
@@ -715,12 +1139,6 @@ class Array(CType, metaclass=MultiMeta):
     arrlength = reference("__extra__.arrlength", 1)
     """The length the instances should consider reading up to."""
 
-    @classmethod
-    def __new__(cls, *args, **kwargs):
-        self = super().__new__(cls, *args, **kwargs)
-        setattr(self, '__len__', lambda s: cls.arrlength)
-        return self
-
     @classmethod
     def __detail__(cls, *args):
         """
@@ -739,15 +1157,100 @@ class Array(CType, metaclass=MultiMeta):
         result.__tpname__ = result.arrtype.__tpname__ + '*'
         return result
 
+    @classmethod
+    def from_bytes(cls, data, byteorder=None):
+        """
+        Create an array from the raw bytes of its elements, laid out
+        using the given byteorder, or the element type's own byteorder
+        if None.
+        Unlike converting element by element, the whole buffer is
+        swapped at once when the byteorders differ.
+        """
+        typecheck(data, (bytes, bytearray, memoryview), target_name='data')
+        typecheck(byteorder, (str, type(None)), target_name='byteorder')
+        own_byteorder = getattr(cls.arrtype, 'byteorder', sys.byteorder)
+        if (byteorder is not None) and (byteorder != own_byteorder):
+            _with_byteorder(cls.arrtype.__c_origin__, byteorder)  # validate byteorder
+            data = _byteswap(cls.arrtype.__c_origin__, data)
+        return cls.__wrap__(cls.__c_origin__.from_buffer_copy(data))
+
+    @classmethod
+    def convert(cls, instance):
+        """
+        Convert an array whose elements use another byteorder
+        to an array of cls, swapping the whole buffer at once.
+        """
+        typecheck(instance, (ArrayInstance,), target_name='instance')
+        return cls.from_bytes(bytes(instance.handle), getattr(instance.arrtype, 'byteorder', sys.byteorder))
+
     @classmethod
     def __to_py__(cls, instance):
-        result = []
-        for element in instance:
-            result.append(element.ctype.__to_py__(element))
+        return list(instance.handle)
+
+    @classmethod
+    def __from_c__(cls, c_instance):
+        typecheck(c_instance, (cls.__c_origin__,), target_name='c_instance')
+        return cls.__wrap__(c_instance)
+
+
+class StructInstance(CInstanceType, metaclass=MultiMeta):
+    __slots__ = ()
+    fields = _CField('_type.fields', ())
+    """The (name, type) pairs of the struct's fields."""
+
+    def __init__(self, *values):
+        """
+        Initialize a new struct instance from the values of its fields.
+        """
+        if len(values) > len(self.fields):
+            raise BufferError("Struct initializer of the wrong size.")
+        super().__init__(self.ctype.__c_origin__(*values))
+
+    def __getitem__(self, item):
+        typecheck(item, (str,), target_name='item')
+        return getattr(self.handle, item)
+
+
+class Struct(CType, metaclass=MultiMeta):
+    __py_origin__ = tuple
+    __c_origin__ = ctypes.Structure
+    __tpname__ = "struct"
+    __instance_type__ = StructInstance
+
+    fields = reference("__extra__.fields", ())
+    """The (name, type) pairs of the struct's fields."""
+
+    @classmethod
+    def __detail__(cls, *args):
+        """
+        Struct[(name: str, type: type[CType]), ...] -> type[Struct]
+        """
+        if (len(args) == 2) and isinstance(args[0], str):  # Struct[name, type] declares a single field
+            args = (args,)
+        if len(args) == 0:
+            return cls
+
+        c_fields = []
+        for field in args:
+            typecheck(field, (tuple,), target_name='field', expected_type_name='tuple[str, type[CType]]')
+            if len(field) != 2:
+                raise ValueError("Struct fields must be (name, type) pairs.")
+            name, tp = field
+            typecheck(name, (str,), target_name='name')
+            typecheck(tp, (type, MultiMeta), target_name='type',
+                      check_func=lambda: isinstance(tp, (type, MultiMeta)) and issubclass(tp, CType))
+            c_fields.append((name, tp.__c_origin__))
+
+        result = cls
+        result.fields = tuple(args)
+        result.__c_origin__ = type("struct", (ctypes.Structure,), {'_fields_': c_fields})
         return result
 
+    @classmethod
+    def __to_py__(cls, instance):
+        return tuple(getattr(instance.handle, name) for name, tp in cls.fields)
+
     @classmethod
     def __from_c__(cls, c_instance):
-        typecheck(c_instance, cls.__c_origin__)
-        celements = [cls.arrtype.__from_c__(elem) for elem in c_instance]
-        return cls(*celements)
+        typecheck(c_instance, (cls.__c_origin__,), target_name='c_instance')
+        return cls.__wrap__(c_instance)
@@ -1,23 +1,32 @@
 from .._meta import *
+from .._multidict import SlotTable
 from ..system import SecretCtypes
 
-from typing import Union, Literal, Optional, Any, TypeVar
+from typing import Union, Literal, Optional, Any, TypeVar, Iterator, Iterable, NoReturn
+from struct import Struct as Struct_
 
 
 ByteOrder = Literal['big', 'little']
+Buffer = Union[bytes, bytearray, memoryview]
 _T = TypeVar("_T")
 
 
 class CInstanceType(metaclass=MultiMeta):
+    __slots__ = ('_handle', '_type', '_extra')
+
     value: object = ...
     handle: SecretCtypes.CData = ...
     ctype: Optional[type[CType]] = ...
-    __extra__: dict = ...
+    __extra_keys__: tuple[str, ...] = ...
+    @property
+    def __extra__(self) -> SlotTable: ...
 
     @classmethod
     def __new__(cls, *args, **kwargs) -> CInstanceType: ...
     def __init__(self, handle: SecretCtypes.CData) -> None: ...
     def get(self) -> object: ...
+    def __reduce__(self) -> tuple[Any, ...]: ...
+    def __reduce_ex__(self, protocol: int) -> tuple[Any, ...]: ...
     def __repr__(self) -> str: ...
     @classmethod
     def __class_instancecheck__(cls, instance: object) -> bool: ...
@@ -32,6 +41,8 @@ class CType(metaclass=MultiMeta):
     __tpname__: str = ...
     __tpwords__: list[str] = ...
     __extra__: dict = ...
+    __struct_format__: Optional[str] = ...
+    __c_size__: Optional[int] = ...
 
     @classmethod
     def __new__(cls, *args, **kwargs) -> CInstanceType: ...
@@ -45,11 +56,25 @@ class CType(metaclass=MultiMeta):
     @classmethod
     def __detail__(cls, *args) -> type[CType]: ...
     @classmethod
+    def __wrap__(cls, c_instance: SecretCtypes.CData) -> CInstanceType: ...
+    @classmethod
     def __to_c__(cls, instance: CInstanceType) -> SecretCtypes.CData: ...
     @classmethod
     def __to_py__(cls, instance: CInstanceType) -> object: ...
     @classmethod
     def __from_c__(cls, c_instance: Optional[SecretCtypes.CData]) -> CInstanceType: ...
+    @classmethod
+    def __dump__(cls, instance: CInstanceType) -> Optional[bytes]: ...
+    @classmethod
+    def __load__(cls, data: Optional[bytes]) -> CInstanceType: ...
+    @classmethod
+    def __struct__(cls) -> Struct_: ...
+    @classmethod
+    def pack(cls, values: Iterable[Any], buffer: Optional[Buffer] = ..., offset: int = ...) -> Union[bytes, int]: ...
+    @classmethod
+    def unpack(cls, buffer: Buffer, offset: int = ..., count: Optional[int] = ...) -> list[Any]: ...
+    @classmethod
+    def iter_unpack(cls, buffer: Buffer) -> Iterator[Any]: ...
 
 
 class CIntInstance(CInstanceType, metaclass=MultiMeta):
@@ -63,6 +88,7 @@ class CIntInstance(CInstanceType, metaclass=MultiMeta):
 class Int(CType, metaclass=MultiMeta):
     signed: bool = ...
     byteorder: ByteOrder = ...
+    __c_signs__: tuple[type[SecretCtypes.CData], type[SecretCtypes.CData]] = ...
 
     __c_origin__: type[SecretCtypes.CData] = ...
     __py_origin__: type = ...
@@ -181,30 +207,35 @@ class CStrInstance(CInstanceType, metaclass=MultiMeta):
     encoding: str = ...
 
     # noinspection PyMissingConstructor
-    def __init__(self, value: str) -> None: ...
+    def __init__(self, value: Union[str, bytes]) -> None: ...
+    def __str__(self) -> str: ...
 
 
 class Str(CType, metaclass=MultiMeta):
     encoding: str = ...
+    const: bool = ...
 
     __c_origin__: type[SecretCtypes.CData] = ...
     __py_origin__: type = ...
     __instance_type__: type[CInstanceType] = ...
     __tpname__: str = ...
 
-    def __new__(cls, *args, **kwargs) -> CStrInstance: ...
     @classmethod
-    def __detail__(cls, encoding: str, *args) -> type[Str]: ...
+    def __detail__(cls, encoding: str, const: bool = True, *args) -> type[Str]: ...
     @classmethod
     def __to_py__(cls, instance: CInstanceType) -> str: ...
     @classmethod
     def __from_c__(cls, c_instance: Optional[SecretCtypes.CData]) -> CInstanceType: ...
+    @classmethod
+    def __dump__(cls, instance: CInstanceType) -> Optional[bytes]: ...
+    @classmethod
+    def __load__(cls, data: Optional[bytes]) -> CInstanceType: ...
 
 
 class CCharInstance(CInstanceType, metaclass=MultiMeta):
     encoding: str = ...
     # noinspection PyMissingConstructor
-    def __init__(self, value: str) -> None: ...
+    def __init__(self, value: Union[str, bytes]) -> None: ...
 
 
 class Char(CType, metaclass=MultiMeta):
@@ -215,7 +246,6 @@ class Char(CType, metaclass=MultiMeta):
     __instance_type__: type[CInstanceType] = ...
     __tpname__: str = ...
 
-    def __new__(cls, *args, **kwargs) -> CCharInstance: ...
     @classmethod
     def __detail__(cls, encoding: str, *args) -> type[Char]: ...
     @classmethod
@@ -295,15 +325,17 @@ class Ptr(CType, metaclass=MultiMeta):
     def __to_py__(cls, instance: CInstanceType) -> int: ...
     @classmethod
     def __from_c__(cls, c_instance: Optional[SecretCtypes.CData]) -> CInstanceType: ...
+    @classmethod
+    def __dump__(cls, instance: CInstanceType) -> NoReturn: ...
 
 
 class ArrayInstance(CInstanceType, metaclass=MultiMeta):
     arrtype: type[CType] = ...
     # noinspection PyMissingConstructor
     def __init__(self, *elements: _T) -> None: ...
-    def __iter__(self) -> ArrayInstance: ...
-    def __next__(self) -> _T: ...
+    def __iter__(self) -> Iterator[_T]: ...
     def __len__(self) -> int: ...
+    def tobytes(self, byteorder: Optional[ByteOrder] = ...) -> bytes: ...
 
 
 class Array(CType, metaclass=MultiMeta):
@@ -315,12 +347,37 @@ class Array(CType, metaclass=MultiMeta):
     arrtype: type[CType] = ...
     arrlength: int = ...
 
-    @classmethod
-    def __new__(cls, *args, **kwargs) -> CInstanceType: ...
     @classmethod
     def __detail__(cls, *args) -> type[Array]: ...
     @classmethod
+    def from_bytes(cls, data: Buffer, byteorder: Optional[ByteOrder] = ...) -> ArrayInstance: ...
+    @classmethod
+    def convert(cls, instance: ArrayInstance) -> ArrayInstance: ...
+    @classmethod
     def __to_py__(cls, instance: CInstanceType) -> object: ...
     @classmethod
     def __from_c__(cls, c_instance: Optional[SecretCtypes.CData]) -> CInstanceType: ...
 
+
+
+class StructInstance(CInstanceType, metaclass=MultiMeta):
+    fields: tuple[tuple[str, type[CType]], ...] = ...
+    # noinspection PyMissingConstructor
+    def __init__(self, *values: Any) -> None: ...
+    def __getitem__(self, item: str) -> Any: ...
+
+
+class Struct(CType, metaclass=MultiMeta):
+    __py_origin__: type = ...
+    __c_origin__: type[SecretCtypes.CData] = ...
+    __tpname__: str = ...
+    __instance_type__: type[CInstanceType] = ...
+
+    fields: tuple[tuple[str, type[CType]], ...] = ...
+
+    @classmethod
+    def __detail__(cls, *fields: tuple[str, type[CType]]) -> type[Struct]: ...
+    @classmethod
+    def __to_py__(cls, instance: CInstanceType) -> tuple: ...
+    @classmethod
+    def __from_c__(cls, c_instance: Optional[SecretCtypes.CData]) -> CInstanceType: ...
@@ -1,5 +1,4 @@
-from ._adminfunc import needs_admin
-
+from .._lazy import lazy_attributes as _lazy_attributes
 from .._meta import *
 from .._decorator import Decorator as _Dec
 
@@ -11,6 +10,12 @@ __all__ = [
 ]
 
 
+# the admin helpers import multitools.system and are loaded on first access:
+__getattr__, __dir__ = _lazy_attributes(__name__, globals(), {
+    "needs_admin": ("._adminfunc", "needs_admin"),
+})
+
+
 class Decorator(metaclass=MultiMeta):
     """
     @Decorator
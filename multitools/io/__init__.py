@@ -2,6 +2,7 @@ from ._stream import *
 from ._buffer import *
 import sys
 import _io
+import threading
 
 
 __all__ = [
@@ -33,9 +34,42 @@ __all__ = [
 ]
 
 
-stdout: FileOutput[str] = FileOutput(FileBuffer(1))
-stdin: FileInput[str] = FileInput(FileBuffer(0))
-stderr: FileOutput[str] = FileOutput(FileBuffer(2))
+# the std streams are created on first access, see __getattr__:
+_STD_STREAMS = {
+    "stdout": (FileOutput, 1),
+    "stdin": (FileInput, 0),
+    "stderr": (FileOutput, 2),
+}
+_std_lock = threading.Lock()
+
+stdout: FileOutput[str]
+stdin: FileInput[str]
+stderr: FileOutput[str]
+
+
+def __getattr__(name: str):
+    if name not in _STD_STREAMS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    with _std_lock:
+        if name not in globals():  # another thread may have created it in the meantime
+            stream_type, fileno = _STD_STREAMS[name]
+            globals()[name] = stream_type(FileBuffer(fileno))
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()).union(_STD_STREAMS))
+
+
+def _std(name: str):
+    """
+    Internal function returning the std stream of the given name, creating it if needed.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
 
 # noinspection PyTypeChecker
 py_stdout: _io.TextIOWrapper = sys.stdout
@@ -51,14 +85,14 @@ def print(data: str, *more_data: str, split: str = "", end: str = "\n", encoding
         data += split
         data += dat
     data += end
-    return stdout.write(data, encoding=encoding)
+    return _std("stdout").write(data, encoding=encoding)
 
 
 def printf(data: str, *_format: str, end: str = "\n", encoding: str = None) -> int:
     data += end
-    return stdout.write(data.format(*_format), encoding=encoding)
+    return _std("stdout").write(data.format(*_format), encoding=encoding)
 
 
 def input() -> str:
-    return stdin.readline()
+    return _std("stdin").readline()
 
@@ -1,12 +1,28 @@
 import sys
 
 from .._meta import MultiMeta, AbstractMethodDescriptor as abstractmethod
-from .._type_check import typecheck
+from .._type_check import typecheck, Checker
 
 import sys as _sys
 from os import open as _open, read as _read, write as _write, close as _close
 
 
+__all__ = [
+    "Buffer",
+    "BytesBuffer",
+    "StrBuffer",
+    "FileBuffer",
+]
+
+# The checkers are shared with _stream, and apply the policy of the module calling them.
+# Reads and writes only call them for arguments that aren't of the exact expected type,
+# as calling a checker costs several times the isinstance() it performs.
+_check_size = Checker((int,), "size")
+_check_encoding = Checker((str, type(None)), "encoding")
+_check_bytes = Checker((bytes,), "data")
+_check_str = Checker((str,), "data")
+
+
 class Buffer(metaclass=MultiMeta):
     @abstractmethod
     def read(self, size, **kwargs):
@@ -41,7 +57,8 @@ class BytesBuffer(Buffer, metaclass=MultiMeta):
         self._contents = value
 
     def read(self, size, **kwargs):
-        typecheck(size, (int,), target_name="size")
+        if type(size) is not int:
+            _check_size(size)
         result = b""
         for i in range(size):
             num = len(self._contents) - i
@@ -53,7 +70,8 @@ class BytesBuffer(Buffer, metaclass=MultiMeta):
         return result
 
     def write(self, data, **kwargs):
-        typecheck(data, (bytes,), target_name="data")
+        if type(data) is not bytes:
+            _check_bytes(data)
         self._contents += data
         return len(data)
 
@@ -66,16 +84,18 @@ class StrBuffer(BytesBuffer, metaclass=MultiMeta):
         super().__init__(value=bytes(value, encoding=encoding))
 
     def read(self, size, encoding=None):
-        typecheck(size, (int,), target_name="size")
-        typecheck(encoding, (str, type(None)), target_name="encoding")
+        if type(size) is not int:
+            _check_size(size)
+        _check_encoding(encoding)
         res = super().read(size)
         if encoding is None:
             encoding = self._encoding
         return str(res, encoding=encoding)
 
     def write(self, data, encoding=None):
-        typecheck(data, (str,), target_name="data")
-        typecheck(encoding, (str, type(None)), target_name="encoding")
+        if type(data) is not str:
+            _check_str(data)
+        _check_encoding(encoding)
         if encoding is None:
             encoding = self._encoding
         return super().write(bytes(data, encoding=encoding))
@@ -106,8 +126,9 @@ class FileBuffer(Buffer, metaclass=MultiMeta):
         raise TypeError(f"Expected type Union[int, str], got {type(arg1)} instead.")
 
     def read(self, size, encoding=None):
-        typecheck(size, (int,), target_name="size")
-        typecheck(encoding, (str, type(None)), target_name="encoding")
+        if type(size) is not int:
+            _check_size(size)
+        _check_encoding(encoding)
         if self._open:
             res = _read(self._fileno, size)
             if encoding is None:
@@ -117,8 +138,9 @@ class FileBuffer(Buffer, metaclass=MultiMeta):
         raise SystemError("IO operation on closed file.")
 
     def write(self, data, encoding=None):
-        typecheck(data, (str,), target_name="data")
-        typecheck(encoding, (str, type(None)), target_name="encoding")
+        if type(data) is not str:
+            _check_str(data)
+        _check_encoding(encoding)
         if self._open:
             if encoding is None:
                 encoding = self._encoding
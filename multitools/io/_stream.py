@@ -1,8 +1,25 @@
 from .._meta import MultiMeta, AbstractMethodDescriptor as abstractmethod
 from . import _buffer
+from ._buffer import _check_size, _check_encoding, _check_bytes, _check_str
 from .._type_check import typecheck
 
 
+__all__ = [
+    "Stream",
+    "OStream",
+    "IStream",
+    "TextOutput",
+    "TextInput",
+    "TextIO",
+    "BytesOutput",
+    "BytesInput",
+    "BytesIO",
+    "FileOutput",
+    "FileInput",
+    "FileIO",
+]
+
+
 class Stream(metaclass=MultiMeta):
     @abstractmethod
     def __gethandle__(self):
@@ -38,7 +55,7 @@ class IStream(Stream, metaclass=MultiMeta):
         pass
 
     def read(self, size, **kwargs):
-        typecheck(size, (int,), target_name="size")
+        _check_size(size)
         return self.__read__(size, **kwargs)
 
     def readline(self, **kwargs):
@@ -54,8 +71,8 @@ class TextOutput(OStream, metaclass=MultiMeta):
         return self._handle
 
     def __write__(self, data, encoding=None):
-        typecheck(data, (str,), target_name="data")
-        typecheck(encoding, (str, type(None)), target_name="encoding")
+        _check_str(data)
+        _check_encoding(encoding)
         return self._handle.write(data, encoding=encoding)
 
 
@@ -68,8 +85,8 @@ class TextInput(IStream, metaclass=MultiMeta):
         return self._handle
 
     def __read__(self, size, encoding=None):
-        typecheck(encoding, (str, type(None)), target_name="encoding")
-        typecheck(size, (int,), target_name="size")
+        _check_encoding(encoding)
+        _check_size(size)
         return self._handle.read(size, encoding=encoding)
 
 
@@ -86,7 +103,7 @@ class BytesOutput(OStream, metaclass=MultiMeta):
         return self._handle
 
     def __write__(self, data, **kwargs):
-        typecheck(data, (bytes,), target_name="data")
+        _check_bytes(data)
         return self._handle.write(data, **kwargs)
 
 
@@ -99,7 +116,7 @@ class BytesInput(IStream, metaclass=MultiMeta):
         return self._handle
 
     def __read__(self, size, **kwargs):
-        typecheck(size, (int,), target_name="size")
+        _check_size(size)
         return self._handle.read(size, **kwargs)
 
 
@@ -116,8 +133,8 @@ class FileOutput(OStream, metaclass=MultiMeta):
         return self._handle
 
     def __write__(self, data, encoding=None):
-        typecheck(encoding, (str, type(None)), target_name="encoding")
-        typecheck(data, (str,), target_name="data")
+        _check_encoding(encoding)
+        _check_str(data)
         return self._handle.write(data, encoding=encoding)
 
     fileno = property(lambda self: self._handle.fd)
@@ -133,12 +150,12 @@ class FileInput(IStream, metaclass=MultiMeta):
         return self._handle
 
     def __read__(self, size, encoding=None):
-        typecheck(encoding, (str, type(None)), target_name="encoding")
-        typecheck(size, (int,), target_name="size")
+        _check_encoding(encoding)
+        _check_size(size)
         return self._handle.read(size, encoding=encoding)
 
     def readline(self, encoding=None):
-        typecheck(encoding, (str, type(None)), target_name="encoding")
+        _check_encoding(encoding)
         return self._handle.readline(encoding=encoding)
 
     fileno = property(lambda self: self._handle.fd)
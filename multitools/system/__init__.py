@@ -1,9 +1,9 @@
-from . import _external
-from ._external import Library
+from .._lazy import lazy_attributes as _lazy_attributes
 from . import _gl
 
 __all__ = [
     "Library",
+    "find_library",
     "external",
     "SecretCtypes",
     "is_an_admin",
@@ -11,26 +11,24 @@ __all__ = [
 ]
 
 
-def external(library: str, function: str, flags=0) -> _external.CFuncPtr:
+# the library loader is loaded on first access:
+__getattr__, __dir__ = _lazy_attributes(__name__, globals(), {
+    "Library": ("._external", "Library"),
+    "SecretCtypes": ("._external", "SecretCtypes"),
+    "find_library": ("._ldcache", "find_library"),
+})
+
+
+def external(library: str, function: str, flags=0) -> "SecretCtypes.CFuncPtr":
     """
     Load a function from an external library into memory.
     Returns a _ctypes.CFuncPtr wrapper to the function.
     """
-    lib = Library.load(library, flags=flags)
+    lib = __getattr__("Library").load(library, flags=flags)
     func = lib.getfunc(function, flags=flags)
     return func
 
 
-class SecretCtypes:
-    """
-    Namespace containing some unreachable types of the
-    ctypes module.
-    """
-    CFuncPtr = _external.CFuncPtr
-    PyCFuncPtrType = _external.PyCFuncPtrType
-    CData = _external.CData
-
-
 def is_an_admin() -> bool:
     """
     Return whether the current process is running
@@ -1,8 +1,14 @@
 import _ctypes
 from .._meta import *
-from .._type_check import typecheck
+from .._type_check import typecheck, Checker
 import os
+import sys
 from .._ref import *
+from . import _ldcache
+
+
+_check_name_or_ordinal = Checker((int, bytes, str), "name_or_ordinal")
+_check_flags = Checker((int, bytes), "flags")
 
 
 CData = type(getattr(_ctypes, "_SimpleCData"))
@@ -13,10 +19,40 @@ PyCFuncPtrType = type(_ctypes.CFuncPtr)
 """meta type for C function pointers"""
 
 
+class SecretCtypes:
+    """
+    Namespace containing some unreachable types of the
+    ctypes module.
+    """
+    CFuncPtr = CFuncPtr
+    PyCFuncPtrType = PyCFuncPtrType
+    CData = CData
+
+
+if sys.platform == "win32":
+    _load_library = _ctypes.LoadLibrary
+    _free_library = _ctypes.FreeLibrary
+else:
+    _load_library = _ctypes.dlopen
+    _free_library = _ctypes.dlclose
+
+
 class Library(metaclass=MultiMeta):
     """
     Represents a loaded external library.
     """
+    # dlopen() flags, for platforms other than Windows:
+    RTLD_LAZY = getattr(os, 'RTLD_LAZY', 0)
+    """Resolve symbols when the functions using them are first called."""
+    RTLD_NOW = getattr(os, 'RTLD_NOW', 0)
+    """Resolve all symbols when the library is loaded. This is the default."""
+    RTLD_GLOBAL = getattr(os, 'RTLD_GLOBAL', 0)
+    """Make the symbols of the library available to libraries loaded later."""
+    RTLD_LOCAL = getattr(os, 'RTLD_LOCAL', 0)
+    """Keep the symbols of the library private to it. This is the default."""
+    RTLD_NODELETE = getattr(os, 'RTLD_NODELETE', 0)
+    """Never unload the library, even once freed."""
+
     def __init__(self, handle, name=""):
         """
         Initialize a new already loaded library from it's integer handle.
@@ -37,22 +73,43 @@ class Library(metaclass=MultiMeta):
         """
         Load and initialize a new Library object from the library's on-disk path, with
         optional flags that default to 0.
+        On Windows, flags are LoadLibraryEx() flags. Elsewhere, they are the RTLD_*
+        dlopen() flags, and libraries can also be loaded by soname ('libz.so.1') or
+        short name ('z'), which are resolved through the dynamic loader's cache.
+        Symbols are resolved eagerly unless RTLD_LAZY is given.
         """
         typecheck(path, (str,), target_name="path")
         typecheck(flags, (int, bytes), target_name="flags")
-        if not os.path.exists(path):
-            raise FileNotFoundError(f'No file named "{path}" was found.')
-        return Library(_ctypes.LoadLibrary(path, flags), name=path)
+        if sys.platform == "win32":
+            if not os.path.exists(path):
+                raise FileNotFoundError(f'No file named "{path}" was found.')
+            return Library(_load_library(path, flags), name=path)
+
+        if os.sep in path:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f'No file named "{path}" was found.')
+        else:
+            resolved = _ldcache.find_library(path)
+            if resolved is not None:
+                path = resolved
+            elif '.so' not in path:
+                raise FileNotFoundError(f'No library named "{path}" was found.')
+            # otherwise, let the dynamic loader search its default directories
+        if not flags & (Library.RTLD_LAZY | Library.RTLD_NOW):
+            flags |= Library.RTLD_NOW
+        return Library(_load_library(path, flags), name=path)
 
     def getfunc(self, name_or_ordinal, flags=0):
         """
         Get a function in the library from either a name or an ordinal.
         Returns a callable _ctypes.CFuncPtr object.
         """
-        typecheck(name_or_ordinal, (int, bytes, str), target_name="name_or_ordinal")
-        typecheck(flags, (int, bytes), target_name="flags")
+        _check_name_or_ordinal(name_or_ordinal)
+        _check_flags(flags)
         if self._freed:
             raise AttributeError("Can't reference a function from an unallocated library.")
+        if isinstance(name_or_ordinal, int) and sys.platform != "win32":
+            raise NotImplementedError("Functions can only be referenced by ordinal on Windows.")
 
         class WrapMeta(type(_ctypes.CFuncPtr)):
             def __repr__(cls):
@@ -81,7 +138,7 @@ class Library(metaclass=MultiMeta):
         Once freed, the Library object becomes unusable since
         the library data is no longer in memory.
         """
-        _ctypes.FreeLibrary(self._handle)
+        _free_library(self._handle)
         self._freed = True
 
     name = reference('_name', "", writable=False)
@@ -37,7 +37,18 @@ class CFuncPtr(CData, metaclass=PyCFuncPtrType):
     restype: type = ...
 
 
+class SecretCtypes:
+    CFuncPtr = CFuncPtr
+    PyCFuncPtrType = PyCFuncPtrType
+    CData = CData
+
+
 class Library(metaclass=MultiMeta):
+    RTLD_LAZY: int = ...
+    RTLD_NOW: int = ...
+    RTLD_GLOBAL: int = ...
+    RTLD_LOCAL: int = ...
+    RTLD_NODELETE: int = ...
     name: str = ...
     def __init__(self, handle: int, name: str = ...) -> None: ...
     def free(self) -> None: ...
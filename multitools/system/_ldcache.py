@@ -0,0 +1,216 @@
+import os
+import platform
+import re
+import struct
+import sys
+import threading
+
+
+CACHE_PATH = "/etc/ld.so.cache"
+"""The cache of the dynamic loader, as written by ldconfig."""
+
+_OLD_MAGIC = b"ld.so-1.7.0"
+_NEW_MAGIC = b"glibc-ld.so.cache1.1"
+_OLD_ENTRY = struct.Struct("=iII")
+_NEW_HEADER = "20sIIB3xI12x"
+_NEW_FLAGS_OFFSET = 28
+_NEW_ENTRY = "iIIIQ"
+
+_FLAG_TYPE_MASK = 0x00ff
+_FLAG_ELF_LIBC6 = 0x0003
+_FLAG_ARCH_MASK = 0xff00
+_ARCH_FLAGS = {
+    'x86_64': 0x0300,
+    'amd64': 0x0300,
+    'aarch64': 0x0a00,
+    'arm64': 0x0a00,
+    'ppc64': 0x0500,
+    'ppc64le': 0x0500,
+    's390x': 0x0400,
+    'sparc64': 0x0100,
+    'ia64': 0x0200,
+    'riscv64': 0x1000,
+    'loongarch64': 0x1200,
+}
+"""ldconfig's architecture flags of 64-bit libraries, by machine."""
+
+_SHORT_NAME = re.compile(r"lib(.+?)\.so((?:\.\d+)*)$")
+
+_index = None
+_short_names = None
+_lock = threading.Lock()
+
+
+def _arch_flag():
+    """
+    Internal function returning the architecture flag of the libraries
+    this process can load, or None if it is unknown.
+    """
+    if sys.maxsize <= 2 ** 32:
+        return 0
+    return _ARCH_FLAGS.get(platform.machine().lower())
+
+
+def _string(text, offset):
+    """
+    Internal function reading the null-terminated string at offset in
+    the cache, decoded as latin-1 so that offsets are kept as is.
+    """
+    end = text.find("\x00", offset)
+    value = text[offset:end if end >= 0 else len(text)]
+    if not value.isascii():
+        value = os.fsdecode(value.encode('latin-1'))
+    return value
+
+
+def _read_new(data, start, entries):
+    """
+    Internal function reading a cache in the format used since glibc 2.32,
+    whose string offsets are relative to its header at start.
+    """
+    # the header tells the byteorder of the cache, 2 for little endian, 3 for big:
+    prefix = {2: "<", 3: ">"}.get(data[start + _NEW_FLAGS_OFFSET] & 3, "=")
+    header = struct.Struct(prefix + _NEW_HEADER)
+    entry = struct.Struct(prefix + _NEW_ENTRY)
+    magic, count, strings_length, flags, _ = header.unpack_from(data, start)
+    offset = start + header.size
+    text = data.decode('latin-1')
+    for entry_flags, key, value, _, _ in entry.iter_unpack(data[offset:offset + count * entry.size]):
+        entries.append((entry_flags, _string(text, start + key), _string(text, start + value)))
+
+
+def _read_old(data, entries):
+    """
+    Internal function reading a cache in the format of glibc up to 2.31,
+    whose string offsets are relative to the end of its entries.
+    """
+    count = struct.unpack_from("=I", data, 12)[0]
+    strings = 16 + count * _OLD_ENTRY.size
+    new_start = -(-strings // 8) * 8
+    if data[new_start:new_start + len(_NEW_MAGIC)] == _NEW_MAGIC:
+        # caches written for both formats hold the new one after the old one:
+        _read_new(data, new_start, entries)
+        return
+    text = data.decode('latin-1')
+    for entry_flags, key, value in _OLD_ENTRY.iter_unpack(data[16:strings]):
+        entries.append((entry_flags, _string(text, strings + key), _string(text, strings + value)))
+
+
+def read_cache(path=CACHE_PATH):
+    """
+    Parse a ld.so.cache file and return its (flags, soname, path) entries,
+    in the order of preference of the dynamic loader.
+    Return an empty list if the file doesn't exist or can't be understood.
+    """
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return []
+
+    entries = []
+    try:
+        if data.startswith(_NEW_MAGIC):
+            _read_new(data, 0, entries)
+        elif data.startswith(_OLD_MAGIC):
+            _read_old(data, entries)
+    except (struct.error, IndexError):
+        return []
+    return entries
+
+
+def _version(suffix):
+    return tuple(int(part) for part in suffix.split('.') if part)
+
+
+def _load_index():
+    """
+    Internal function building the soname and short name indexes from
+    the loader's cache, once per process.
+    """
+    global _index, _short_names
+    with _lock:
+        if _index is not None:
+            return
+        arch = _arch_flag()
+        index = {}
+        versions = {}
+        short_names = {}
+        for flags, soname, path in read_cache(CACHE_PATH):
+            if (flags & _FLAG_TYPE_MASK) != _FLAG_ELF_LIBC6:
+                continue
+            if (arch is not None) and (flags & _FLAG_ARCH_MASK) != arch:
+                continue  # built for another architecture
+            if soname in index:
+                continue
+            index[soname] = path
+
+            match = _SHORT_NAME.match(soname)
+            if match is None:
+                continue
+            name, version = match.group(1), _version(match.group(2))
+            if (name not in short_names) or (version > versions[name]):
+                short_names[name] = path
+                versions[name] = version
+        _short_names = short_names
+        _index = index
+
+
+def _search_path(name, short):
+    """
+    Internal function looking for a library in the directories
+    listed by LD_LIBRARY_PATH.
+    """
+    for directory in os.environ.get("LD_LIBRARY_PATH", "").split(os.pathsep):
+        if not directory:
+            continue
+        if not short:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                return path
+            continue
+        try:
+            files = os.listdir(directory)
+        except OSError:
+            continue
+        best = None
+        for file in files:
+            match = _SHORT_NAME.match(file)
+            if (match is not None) and match.group(1) == name:
+                version = _version(match.group(2))
+                if (best is None) or (version > best[0]):
+                    best = (version, file)
+        if best is not None:
+            return os.path.join(directory, best[1])
+    return None
+
+
+def find_library(name):
+    """
+    Return the path of the library of the given soname ('libz.so.1')
+    or short name ('z'), or None if it can't be found.
+
+    The loader's cache is read once into memory, and LD_LIBRARY_PATH
+    is searched for libraries it doesn't know. Unlike
+    ctypes.util.find_library, no subprocess is ever started.
+    """
+    if os.sep in name:
+        return name
+    if _index is None:
+        _load_index()
+
+    short = _SHORT_NAME.match(name) is None
+    path = _short_names.get(name) if short else _index.get(name)
+    if path is None:
+        path = _search_path(name, short)
+    return path
+
+
+def clear_cache():
+    """
+    Forget the index of the loader's cache, so that it is read again
+    by the next lookup.
+    """
+    global _index, _short_names
+    with _lock:
+        _index = _short_names = None
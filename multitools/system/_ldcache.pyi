@@ -0,0 +1,9 @@
+from typing import Optional
+
+
+CACHE_PATH: str = ...
+
+
+def read_cache(path: str = ...) -> list[tuple[int, str, str]]: ...
+def find_library(name: str) -> Optional[str]: ...
+def clear_cache() -> None: ...
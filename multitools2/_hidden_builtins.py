@@ -1,5 +1,9 @@
-
-
 def f(): ...
 FunctionType = type(f)
-del f
\ No newline at end of file
+del f
+
+
+class C:
+    __slots__ = ('a',)
+MemberDescriptorType = type(C.a)
+del C
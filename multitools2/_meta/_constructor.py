@@ -0,0 +1,119 @@
+from . import _data
+
+import copy
+import keyword
+
+
+def _is_attribute_name(name):
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def make_new(qualname, new, defaults, error=None):
+    """
+    Generate the __new__ method of a multitools class, in the spirit of dataclasses.
+    The generated function creates instances through new, or object.__new__ if new
+    is None, and assigns the default values of their fields directly.
+    If error is not None, the generated function raises a TypeError with this message instead.
+    """
+    namespace = {
+        '_object_new': object.__new__,
+        '_new': new,
+        '_setattr': object.__setattr__,
+        '_error': error,
+    }
+    lines = ["def __new__(cls, *args, **kwargs):"]
+    if error is not None:
+        lines.append("    raise TypeError(_error)")
+    else:
+        if new is None:
+            lines.append("    self = _object_new(cls)")
+        else:
+            lines.append("    self = _new(cls, *args, **kwargs)")
+        for index, (name, value) in enumerate(defaults.items()):
+            namespace[f'_default_{index}'] = value
+            if _is_attribute_name(name):
+                lines.append(f"    self.{name} = _default_{index}")
+            else:
+                lines.append(f"    _setattr(self, {name!r}, _default_{index})")
+        lines.append("    return self")
+
+    exec("\n".join(lines), namespace)
+    function = namespace['__new__']
+    function.__qualname__ = f"{qualname}.__new__"
+    return function
+
+
+def make_reduce(qualname, names, dict_names=None):
+    """
+    Generate the __reduce_ex__ method of a multitools class, saving instances as their
+    class and the tuple of the values of their fields, in the order of names.
+    dict_names are the names stored in the __dict__ of instances, or None if they
+    have no __dict__: any other attribute found there is saved as the state of the instance.
+    """
+    namespace = {
+        '_rebuild': rebuild,
+        '_type': type,
+        '_dict_names': frozenset(dict_names or ()),
+    }
+    values = "".join(f"self.{name}, " if _is_attribute_name(name) else f"_getattr(self, {name!r}), " for name in names)
+    if any(not _is_attribute_name(name) for name in names):
+        namespace['_getattr'] = getattr
+    lines = ["def __reduce_ex__(self, protocol):"]
+    if dict_names is not None:
+        lines.append("    state = self.__dict__")
+        lines.append(f"    if len(state) != {len(dict_names)}:  # attributes were added or removed")
+        lines.append(f"        return _rebuild, (_type(self), ({values})), "
+                     "{key: value for key, value in state.items() if key not in _dict_names}")
+    lines.append(f"    return _rebuild, (_type(self), ({values}))")
+
+    exec("\n".join(lines), namespace)
+    function = namespace['__reduce_ex__']
+    function.__qualname__ = f"{qualname}.__reduce_ex__"
+    function.__field_layout__ = tuple(names)
+    return function
+
+
+def rebuild(cls, values):
+    """
+    Create an instance of a multitools class from the values of its fields, as saved by
+    the method generated by make_reduce, without calling __new__ or __init__.
+    """
+    self = object.__new__(cls)
+    data = type.__getattribute__(cls, _data.DATA)
+    if data.dict_layout:
+        self.__dict__.update(zip(data.layout, values))
+    else:
+        for name, value in zip(data.layout, values):
+            object.__setattr__(self, name, value)
+    return self
+
+
+_IMMUTABLE_TYPES = frozenset((type(None), bool, int, float, complex, str, bytes, tuple, frozenset, range, type))
+
+
+def is_immutable(value):
+    """
+    Tell whether a default value can be shared by all instances without being copied.
+    """
+    return type(value) in _IMMUTABLE_TYPES or callable(value)
+
+
+def make_getattr(qualname, defaults, fallback=None):
+    """
+    Generate the __getattr__ method of a slotted multitools class, called when an
+    instance reads a field whose slot is still empty. A copy of the field's default
+    is stored in the slot and returned, so that mutable defaults are only copied for
+    the instances that use them. Other names are passed to fallback, if given.
+    """
+    def __getattr__(self, name):
+        if name in defaults:
+            value = copy.copy(defaults[name])
+            object.__setattr__(self, name, value)
+            return value
+        if fallback is not None:
+            return fallback(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    __getattr__.__qualname__ = f"{qualname}.__getattr__"
+    __getattr__.__lazy_defaults__ = True
+    return __getattr__
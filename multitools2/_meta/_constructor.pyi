@@ -0,0 +1,8 @@
+from typing import Any, Callable, Optional
+
+
+def make_new(qualname: str, new: Optional[Callable[..., Any]], defaults: dict[str, Any], error: Optional[str] = ...) -> Callable[..., Any]: ...
+def is_immutable(value: Any) -> bool: ...
+def make_getattr(qualname: str, defaults: dict[str, Any], fallback: Optional[Callable[[Any, str], Any]] = ...) -> Callable[[Any, str], Any]: ...
+def make_reduce(qualname: str, names: tuple[str, ...], dict_names: Optional[tuple[str, ...]] = ...) -> Callable[[Any, int], tuple[Any, ...]]: ...
+def rebuild(cls: type, values: tuple[Any, ...]) -> Any: ...
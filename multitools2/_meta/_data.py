@@ -1,20 +1,161 @@
-from dataclasses import dataclass
-
 from .. import _misc
-from ._field import FieldWrapper
 
 
-@dataclass
+DATA = "#data"
+"""The name of the class attribute storing the ClsData of multitools classes."""
+
+STATIC = 1
+"""The field is a class attribute, rather than an instance attribute."""
+ABSTRACT = 2
+"""The field is abstract and must be overridden."""
+FUNCTION = 4
+"""The field's value is callable."""
+OWN = 8
+"""The field is defined by the class itself, rather than inherited."""
+
+
 class ClsData(metaclass=_misc.SimpleMeta):
     """
     Internal data structure for storing info about multitools classes
+
+    The fields of the class and of its bases are stored in a compact table:
+    'indexes' maps their names to positions in the parallel 'values' list
+    and 'flags' bytearray. Index maps are shared with the first base when
+    possible, and the number of abstract fields is kept up to date as
+    fields are set, rather than scanned for.
     """
-    name: str
-    abstract: bool
-    field_defs: tuple[str]
-    static_fields: dict[str, FieldWrapper]
-    instance_fields: dict[str, FieldWrapper]
-    bases: tuple[type]
-    abs_locked: bool
-    mro: tuple[type]
+    __slots__ = ('name', 'abstract', 'field_defs', 'bases', 'bases_data', 'abs_locked', 'mro', 'slots', 'layout', 'dict_layout',
+                 'indexes', 'values', 'flags', 'abstract_count')
+
+    _EMPTY = {}
+
+    def __init__(self, name, abstract, field_defs, bases, slots=False):
+        self.name = name
+        self.abstract = abstract
+        self.field_defs = field_defs
+        self.bases = bases
+        self.bases_data = ()  # the data of the multitools classes among the bases
+        self.abs_locked = False
+        self.mro = ()
+        self.slots = slots  # whether instances store their fields in slots rather than in a __dict__
+        self.layout = ()  # the names of the fields of instances, in the order they are pickled in
+        self.dict_layout = True  # whether all of these fields are stored in the __dict__ of instances
+        self.indexes = self._EMPTY
+        self.values = []
+        self.flags = bytearray()
+        self.abstract_count = 0
+
+    def inherit(self, bases_data):
+        """
+        Fill the table with the fields of the bases, the earlier bases
+        overriding the later ones. Fields defined by the class itself are kept.
+        """
+        self.bases_data = bases_data = tuple(bases_data)
+        own = [(name, self.values[index], self.flags[index]) for name, index in self.indexes.items()
+               if index < len(self.values) and self.flags[index] & OWN]
+        self.indexes = self._EMPTY
+        self.values = []
+        self.flags = bytearray()
+        self.abstract_count = 0
+
+        if bases_data:
+            first = bases_data[0]
+            self.indexes = first.indexes
+            self.values = list(first.values)
+            self.flags = bytearray(flag & ~OWN for flag in first.flags)
+            self.abstract_count = first.abstract_count
+            for data in bases_data[1:]:
+                self.update([(name, data.values[index], data.flags[index] & ~OWN)
+                             for name, index in data.indexes.items()
+                             if index < len(data.values) and name not in self])
+        self.update(own)
+        self.abs_locked = (not self.abstract) and self.abstract_count > 0
+
+    def inherit_field(self, name):
+        """
+        Read the field of the given name from the bases again, unless the class
+        defines it itself. Return whether the field was updated.
+        """
+        flags = self.flags
+        index = self.indexes.get(name)
+        if (index is None) or index >= len(self.values):
+            index = None
+        elif flags[index] & OWN:
+            return False
+        for data in self.bases_data:
+            base_index = data.indexes.get(name)
+            if (base_index is not None) and base_index < len(data.values):
+                if index is None:
+                    index = self._add(name)
+                new_flags = data.flags[base_index] & ~OWN
+                if (flags[index] ^ new_flags) & ABSTRACT:
+                    self.abstract_count += 1 if new_flags & ABSTRACT else -1
+                    self.abs_locked = (not self.abstract) and self.abstract_count > 0
+                self.values[index] = data.values[base_index]
+                flags[index] = new_flags
+                return True
+        return False
+
+    def update(self, fields):
+        """
+        Set fields from (name, value, flags) tuples.
+        """
+        for name, value, flags in fields:
+            index = self.indexes.get(name)
+            if (index is None) or (index >= len(self.values)):
+                index = self._add(name)
+            self.abstract_count += bool(flags & ABSTRACT) - bool(self.flags[index] & ABSTRACT)
+            self.values[index] = value
+            self.flags[index] = flags
+        self.abs_locked = (not self.abstract) and self.abstract_count > 0
+
+    def _add(self, name):
+        """
+        Internal method adding a name to the table and returning its index.
+        Index maps are shared along the mro: names are appended to the shared map
+        if no other class did so, and other classes only see the indexes below the
+        length of their own values.
+        """
+        index = len(self.values)
+        indexes = self.indexes
+        if indexes.get(name) != index:  # not already appended by a class declaring the same names
+            if len(indexes) != index:
+                # another class appended other names, take a copy of the names we see:
+                indexes = self.indexes = {key: value for key, value in indexes.items() if value < index}
+            elif indexes is self._EMPTY:
+                indexes = self.indexes = {}
+            indexes[name] = index
+        self.values.append(None)
+        self.flags.append(0)
+        return index
+
+    def __contains__(self, name):
+        index = self.indexes.get(name)
+        return (index is not None) and index < len(self.values)
+
+    def get(self, name, default=None):
+        """
+        Return the value of the field of the given name, or default.
+        """
+        index = self.indexes.get(name)
+        return default if (index is None) or index >= len(self.values) else self.values[index]
+
+    def get_flags(self, name):
+        """
+        Return the flags of the field of the given name, or 0 if there is no such field.
+        """
+        index = self.indexes.get(name)
+        return 0 if (index is None) or index >= len(self.values) else self.flags[index]
+
+    def _select(self, static):
+        count = len(self.values)
+        return {name: self.values[index] for name, index in self.indexes.items()
+                if index < count and bool(self.flags[index] & STATIC) == static}
+
+    static_fields = property(lambda self: self._select(True))
+    """The class attributes, by name."""
+    instance_fields = property(lambda self: self._select(False))
+    """The instance attributes and methods, by name."""
 
+    def __repr__(self):
+        return f"ClsData(name={self.name!r}, abstract={self.abstract}, fields={[name for name in self.indexes if name in self]})"
@@ -18,16 +18,15 @@ class FieldWrapper(metaclass=_misc.SimpleMeta):
         elif isinstance(value, staticmethod):
             self._value = value.__func__
             self._staticmethod = True
+        else:
+            self._value = value
 
-        self._value = value
+        # the value is wrapped once, so that reading it doesn't create new objects:
+        self._wrapped = value
         if callable(self._value):
             self.is_function = True
 
     @property
     def value(self):
-        if self._staticmethod:
-            return staticmethod(self._value)
-        if self._classmethod:
-            return classmethod(self._value)
-        return self._value
+        return self._wrapped
 
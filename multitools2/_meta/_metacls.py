@@ -1,11 +1,16 @@
+from . import _constructor
 from . import _data
 from . import _field
 
 from .. import _hidden_builtins
 
 
-DATA = "#data"
+DATA = _data.DATA
 DICT_VALID = ('__dict__', '__init__', '__new__', '__module__', '__qualname__')
+PICKLE_METHODS = ('__reduce__', '__reduce_ex__', '__getstate__', '__setstate__', '__getnewargs__', '__getnewargs_ex__')
+"""Methods customizing pickling, that disable the generated __reduce_ex__ if a class defines them."""
+REBUILD_KEYS = ('__init__', '__new__', '__slots__', '__getattr__') + PICKLE_METHODS
+"""Methods the generated __new__, __getattr__ and __reduce_ex__ of a class depend on."""
 
 
 def _is_iter(obj):
@@ -50,89 +55,59 @@ class MultiMeta(type):
         return result
 
     @staticmethod
-    def __sort_static_instance(np, field_defs, **kwargs):
+    def __declare(np, field_defs, **kwargs):
         """
-        Internal helper method for sorting variables in class definition.
+        Internal helper method for sorting variables in class definition,
+        returning them as (name, value, flags) tuples.
         """
-        np_res_s = {}
-        np_res_i = {}
+        declared = []
         abstract = kwargs.get('abstract', False)
 
         # treat each variable in class definition:
         for npk, npv in np.items():
-
-            # make the value a field if it is not already the case:
-            field = npv if isinstance(npv, _field.FieldWrapper) else _field.FieldWrapper(npv)
+            flags = _data.OWN
+
+            # unwrap the value if it is a field:
+            static = None
+            if isinstance(npv, _field.FieldWrapper):
+                static = npv.__static__
+                if npv.__abstract__:
+                    flags |= _data.ABSTRACT
+                    # if an abstract field is found, make the entire class abstract:
+                    abstract = True
+                npv = npv.value
 
             # if static is set to be default:
-            if field.__static__ is None:
-                if isinstance(field.value, _hidden_builtins.FunctionType):
-                    field.__static__ = False  # a method must be an instance attribute by default
+            if static is None:
+                if isinstance(npv, _hidden_builtins.FunctionType):
+                    static = False  # a method must be an instance attribute by default
                 else:
-                    field.__static__ = not bool(npk in field_defs)  # a variable must be a static attribute by default
-
-            # if an abstract field is found, make the entire class abstract:
-            if field.__abstract__ and not abstract:
-                abstract = True
-
-            # change values in class data:
-            if field.__static__:
-                np_res_s[npk] = field
-            else:
-                np_res_i[npk] = field
-
-        return np_res_s, np_res_i, abstract
-
-    def __getattr_frombase(cls, name):
-        """
-        Internal helper function for getting an equivalent to super().name
-        """
-        cls_data = type.__getattribute__(cls, DATA)
-
-        mro = list(cls_data.mro)
-        mro.pop(0)
-
-        for entry in mro:
-            try:
-                return getattr(entry, name)
-            except AttributeError:
-                pass
-
-        raise AttributeError(f"'{cls_data.name}' object's bases have no attribute '{name}'.")
+                    static = npk not in field_defs  # a variable must be a static attribute by default
 
-    @classmethod
-    def __scan_bases(mcs, mro, abstract):
-        """
-        Internal helper for scanning the bases of a type.
-        """
-        mro = list(mro)
-        mro.pop(0)
-
-        all_attrs = {}
-
-        for entry in mro:
-            all_attrs = mcs.__scan_type(entry, all_attrs)
+            if static:
+                flags |= _data.STATIC
+            if callable(npv.__func__ if isinstance(npv, (staticmethod, classmethod)) else npv):
+                flags |= _data.FUNCTION
+            declared.append((npk, npv, flags))
 
-        for ak, av in all_attrs.items():
-            if av.__abstract__ and not abstract:
-                return True
-        return False
+        return declared, abstract
 
     @staticmethod
-    def __scan_type(tp, attrdict):
+    def __make_slots(bases, field_defs):
         """
-        Internal helper method for scanning a base of a type.
+        Internal helper returning the __slots__ of a class holding the fields of its whole
+        hierarchy, except the ones its bases already have a slot for.
         """
-        if isinstance(tp, MultiMeta):
-            for fk, fv in tp.__data__.static_fields.items():
-                if fk not in attrdict:
-                    attrdict[fk] = fv
-            return attrdict
-        for ak, av in tp.__dict__.items():
-            fv = _field.FieldWrapper(av)
-            if ak not in attrdict:
-                attrdict[ak] = fv
-        return attrdict
+        names = []
+        slotted = set()
+        for base in reversed(bases):
+            for entry in reversed(base.__mro__):
+                if isinstance(entry, MultiMeta):
+                    names.extend(type.__getattribute__(entry, DATA).field_defs)
+                entry_slots = type.__getattribute__(entry, '__dict__').get('__slots__', ())
+                slotted.update((entry_slots,) if isinstance(entry_slots, str) else entry_slots)
+        names.extend(field_defs)
+        return tuple(name for name in dict.fromkeys(names) if name not in slotted)
 
     def __new__(mcs, *args, **kwargs):
         """
@@ -142,6 +117,9 @@ class MultiMeta(type):
         abstract = kwargs.get('abstract', False)
         if not isinstance(abstract, bool):
             raise TypeError(f"'abstract': Expected type 'bool', got '{type(abstract).__name__}' instead.")
+        slots = kwargs.get('slots', False)
+        if not isinstance(slots, bool):
+            raise TypeError(f"'slots': Expected type 'bool', got '{type(slots).__name__}' instead.")
 
         match (len(args)):
             case 1:  # first overload is (MultiMeta, Optional[bool]) -> MultiMeta
@@ -155,6 +133,8 @@ class MultiMeta(type):
                 cls_data = type.__getattribute__(source, DATA)
                 if cls_data.abstract != abstract:
                     cls_data.abstract = abstract
+                    cls_data.abs_locked = (not abstract) and cls_data.abstract_count > 0
+                    mcs.__build_constructor(source)
                 type.__setattr__(source, DATA, cls_data)
 
                 # return type:
@@ -191,18 +171,26 @@ class MultiMeta(type):
                         raise NameError(f"Illegal field name '{field_name}'.")
 
                 # sort static and instance fields from np:
-                static_fields, instance_fields, abstract = mcs.__sort_static_instance(np, field_defs, abstract=abstract)
+                declared, abstract = mcs.__declare(np, field_defs, abstract=abstract)
 
-                for base in bases:
-                    if isinstance(base, MultiMeta):
-                        static_fields = {**static_fields, **base.__data__.static_fields}
-                        instance_fields = {**instance_fields, **base.instance_fields}
+                # the values of the class' own static fields are stored in its namespace, so that reading
+                # them is as fast as reading attributes of normal classes. So are methods, which are
+                # instance fields not listed in __fields__:
+                new_np = {}
+                for key, value, flags in declared:
+                    if (flags & _data.STATIC) or ((key not in field_defs) and (key not in DICT_VALID)):
+                        new_np[key] = value
+
+                # the class' own fields override the ones of its bases, and earlier bases override later ones:
+                cls_data = _data.ClsData(name, abstract, field_defs, bases, slots=slots)
+                cls_data.update(declared)
+                cls_data.inherit([type.__getattribute__(base, DATA) for base in bases if isinstance(base, MultiMeta)])
 
                 # create the new namespace:
-                new_np = {
-                    DATA: _data.ClsData(name, abstract, field_defs, static_fields, instance_fields, bases, False, ()),
-                    '__doc__': doc,
-                }
+                new_np[DATA] = cls_data
+                new_np['__doc__'] = doc
+                if slots:
+                    new_np['__slots__'] = mcs.__make_slots(bases, field_defs)
 
                 # if needed, propagate __classcell__ to the new class:
                 if '__classcell__' in np:
@@ -211,14 +199,7 @@ class MultiMeta(type):
                 # create new class:
                 cls = type.__new__(mcs, name, bases, new_np)
 
-                cls_mro = mcs.__get_mro(cls, bases)
-                print(cls_mro)
-
-                # update cls.__data__.abs_locked:
-                cls_data = type.__getattribute__(cls, DATA)
-                cls_data.abs_locked = mcs.__scan_bases(cls_mro, abstract)
-                cls_data.mro = cls_mro
-                type.__setattr__(cls, DATA, cls_data)
+                cls_data.mro = mcs.__get_mro(cls, bases)
 
                 # return class:
                 return cls
@@ -234,87 +215,126 @@ class MultiMeta(type):
         if len(args) != 3:
             return  # cls.__init__() has already been called
 
-        base_init = MultiMeta.__getattr_frombase(cls, '__init__')
-        base_new = MultiMeta.__getattr_frombase(cls, '__new__')
-
-        def _init(self, *a, **kw):
-            if base_init is object.__init__:
-                base_init(self)
-            else:
-                base_init(self, *a, **kw)
-
-        # noinspection PyArgumentList
-        def _new(c, *a, **kw):
-            if base_new is object.__new__:
-                return base_new(c)
-            return base_new(c, *a, **kw)
-
-        custom_init = cls.__data__.static_fields['__init__'].value if '__init__' in cls.__data__.static_fields else \
-            _init
-        custom_new = cls.__data__.static_fields['__new__'].value if '__new__' in cls.__data__.static_fields else \
-            _new
-        cls_data = type.__getattribute__(cls, DATA)
-
-        # todo
-
-        # custom_init = cls_data.static_fields['__init__'].value if '__init__' in cls_data.static_fields else base_init
-        # custom_new = cls_data.static_fields['__new__'].value if '__new__' in cls_data.static_fields else base_new
-
-        def __init__(self, *initargs, **initkwargs):
-            print("init", self, initargs, initkwargs)
-            custom_init(self, *initargs, **initkwargs)
-
-        def __new__(_cls, *newargs, **newkwargs):
-            print("new", _cls, newargs, newkwargs)
-
-            field_defs = _cls.__data__.field_defs
-            self = custom_new(_cls, *newargs, **newkwargs)
-            for field_name in field_defs:
-                field = _cls.instance_attrs[field_name] if field_name in _cls.instance_attrs else _field.FieldWrapper(None)
-                setattr(self, field_name, field.value)
-
-            return self
-
         type.__init__(cls, *args, **kwargs)
+        MultiMeta.__build_constructor(cls)
 
-        __init__.__qualname__ = f"{cls.__qualname__}.__init__"
-        __new__.__qualname__ = f"{cls.__qualname__}.__new__"
+    @staticmethod
+    def __find_method(mro, name):
+        """
+        Internal helper returning the user-defined method of the given name along
+        the mro of a class, or None if it is not defined.
+        """
+        for entry in mro:
+            if isinstance(entry, MultiMeta):
+                entry_data = type.__getattribute__(entry, DATA)
+                if name in entry_data:
+                    return entry_data.get(name)
+            elif entry is not object:
+                namespace = type.__getattribute__(entry, '__dict__')
+                if name in namespace:
+                    return namespace[name]
+        return None
 
+    @staticmethod
+    def __build_constructor(cls):
+        """
+        Internal helper generating the __new__ method of a class and installing it along
+        with the resolved __init__, so that instantiation doesn't look anything up.
+        """
         cls_data = type.__getattribute__(cls, DATA)
-        cls_data.static_fields['__init__'] = _field.FieldWrapper(__init__)
-        cls_data.static_fields['__new__'] = _field.FieldWrapper(__new__)
-        type.__setattr__(cls, DATA, cls_data)
-
-        # noinspection PyTypeChecker
-        cls.__init__ = __init__
-        cls.__new__ = __new__
+        error = None
+        if cls_data.abstract:
+            error = f"Cannot instantiate abstract class '{cls_data.name}'."
+        elif cls_data.abs_locked:
+            error = f"Class '{cls_data.name}' missing overrides for one or more abstract fields."
+
+        # the fields of the whole hierarchy, the closest definitions overriding the others:
+        mro = type.__getattribute__(cls, '__mro__')
+        defaults = {}
+        for entry in reversed(mro):
+            if isinstance(entry, MultiMeta):
+                for field_name in type.__getattribute__(entry, DATA).field_defs:
+                    static = cls_data.get_flags(field_name) & _data.STATIC
+                    defaults[field_name] = None if static else cls_data.get(field_name)
+
+        cls_data.layout = tuple(defaults)
+
+        # slotted classes copy mutable defaults lazily, when instances first use them:
+        namespace = type.__getattribute__(cls, '__dict__')
+        lazy_defaults = {}
+        if cls_data.slots:
+            lazy_defaults = {key: value for key, value in defaults.items() if not _constructor.is_immutable(value)}
+            defaults = {key: value for key, value in defaults.items() if key not in lazy_defaults}
+        if lazy_defaults:
+            fallback = MultiMeta.__find_method(mro, '__getattr__')
+            type.__setattr__(cls, '__getattr__', _constructor.make_getattr(cls.__qualname__, lazy_defaults, fallback))
+        elif getattr(namespace.get('__getattr__'), '__lazy_defaults__', False):
+            type.__delattr__(cls, '__getattr__')
+
+        new = MultiMeta.__find_method(mro, '__new__')
+        if (error is None) and (new is None) and (not defaults) and \
+                not any('__new__' in type.__getattribute__(entry, '__dict__') for entry in mro[1:] if entry is not object):
+            # nothing to do when creating instances, leave it to object.__new__:
+            if '__new__' in namespace:
+                type.__delattr__(cls, '__new__')
+        else:
+            type.__setattr__(cls, '__new__', staticmethod(_constructor.make_new(cls.__qualname__, new, defaults, error)))
+        init = MultiMeta.__find_method(mro, '__init__')
+        if init is not None:
+            type.__setattr__(cls, '__init__', init)
+        elif '__init__' in namespace:
+            type.__delattr__(cls, '__init__')
+
+        # instances are pickled as the values of their fields, unless the hierarchy has other
+        # bases than multitools classes, whose instances may not be created by object.__new__:
+        if (error is None) and all(isinstance(entry, MultiMeta) or (entry is object) for entry in mro) and \
+                all(MultiMeta.__find_method(mro, name) is None for name in PICKLE_METHODS):
+            dict_names = None
+            if type.__getattribute__(cls, '__dictoffset__'):
+                dict_names = tuple(name for name in cls_data.layout
+                                   if not isinstance(getattr(cls, name, None), _hidden_builtins.MemberDescriptorType))
+            cls_data.dict_layout = dict_names == cls_data.layout
+            type.__setattr__(cls, '__reduce_ex__', _constructor.make_reduce(cls.__qualname__, cls_data.layout, dict_names))
+        elif hasattr(namespace.get('__reduce_ex__'), '__field_layout__'):
+            type.__delattr__(cls, '__reduce_ex__')
 
-    def __getattr__(cls, item):
+    @staticmethod
+    def __invalidate(cls):
         """
-        Implement getattr(cls, name)
+        Internal helper updating the subclasses of a modified class,
+        and generating the constructors of the class and of its subclasses again.
         """
-        if item in DICT_VALID:
-            # attribute can touch __dict__ so use builtin behaviour:
-            return type.__getattribute__(cls, item)
-
-        # get class data:
-        cls_data = type.__getattribute__(cls, DATA)
+        pending = [cls]
+        while pending:
+            entry = pending.pop()
+            if isinstance(entry, MultiMeta):
+                entry_data = type.__getattribute__(entry, DATA)
+                if entry is not cls:
+                    # fields inherited from the modified class must be read again:
+                    entry_data.inherit(entry_data.bases_data)
+                MultiMeta.__build_constructor(entry)
+            pending.extend(type.__subclasses__(entry))
 
-        # attempt to find the attribute in cls:
-        if item in cls_data.static_fields:
-            res = cls_data.static_fields[item]
-            if isinstance(res, _field.FieldWrapper):
-                return res.value
-            return res
-        # upon failure, search in __mro__ entries for the attribute:
-        mro = list(cls_data.mro)
-        mro.pop(0)  # remove the class itself
-        for entry in mro:
-            try:
-                return getattr(entry, item)
-            except AttributeError:
-                pass
-        raise AttributeError(f"'{cls_data.name}' object has no attribute '{item}'.")
+    @staticmethod
+    def __propagate(cls, key):
+        """
+        Internal helper updating the field of the given name in the tables of the
+        subclasses inheriting it from a modified class. Their constructors are only
+        generated again if they depend on the field.
+        """
+        # subclasses overriding the field stop the propagation. A subclass with several
+        # modified bases is visited once per base, and ends up with the right value:
+        pending = type.__subclasses__(cls)
+        while pending:
+            entry = pending.pop()
+            if isinstance(entry, MultiMeta):
+                entry_data = type.__getattribute__(entry, DATA)
+                abs_locked = entry_data.abs_locked
+                if not entry_data.inherit_field(key):
+                    continue
+                if (entry_data.abs_locked != abs_locked) or (key in entry_data.layout):
+                    MultiMeta.__build_constructor(entry)
+            pending.extend(type.__subclasses__(entry))
 
     def __setattr__(cls, key, value):
         """
@@ -324,42 +344,55 @@ class MultiMeta(type):
             # attribute can touch __dict__:
             if isinstance(value, _field.FieldWrapper):
                 value = value.value
-            return type.__setattr__(cls, key, value)
+            if key in ('__init__', '__new__'):
+                # constructors are generated from the fields:
+                type.__getattribute__(cls, DATA).update([(key, value, _data.OWN | _data.FUNCTION)])
+                MultiMeta.__invalidate(cls)
+            else:
+                type.__setattr__(cls, key, value)
+            return
 
         # get the class data:
         cls_data = type.__getattribute__(cls, DATA)
 
-        # make a field with value if not already done:
-        field = value if isinstance(value, _field.FieldWrapper) else _field.FieldWrapper(value)
-
-        # here, a field defaults to a static one:
-        if field.__static__ is None:
-            field.__static__ = True
-
-        # change value in class data:
-        if field.__static__:
-            cls_data.static_fields[key] = field
-        else:
-            cls_data.instance_fields[key] = field
-
-        # update class data:
-        type.__setattr__(cls, DATA, cls_data)
-
-    def __call__(cls, *args, **kwargs):
-        """
-        Implement cls(*args, **kwargs)
-        """
-        if cls.__data__.abstract:
-            raise TypeError(f"Cannot instantiate abstract class '{cls.__data__.name}'.")
-        if cls.__data__.abs_locked:
-            raise TypeError(f"Class '{cls.__data__.name}' missing overrides for one or more abstract fields.")
-
-        print("called")
-        new_method = getattr(cls, '__new__')
-        init_method = getattr(cls, '__init__')
-        self = new_method(cls, *args, **kwargs)
-        init_method(self, *args, **kwargs)
-        return self
+        # unwrap the value if it is a field. As on class declaration, a value set to one
+        # of the fields of instances changes its default, other values are static:
+        static = None
+        flags = _data.OWN
+        if isinstance(value, _field.FieldWrapper):
+            static = value.__static__
+            if value.__abstract__:
+                flags |= _data.ABSTRACT
+            value = value.value
+        if static is None:
+            static = key not in cls_data.layout
+        if callable(value.__func__ if isinstance(value, (staticmethod, classmethod)) else value):
+            flags |= _data.FUNCTION
+
+        # the slots of instances are member descriptors of the class, which must be kept:
+        namespace = type.__getattribute__(cls, '__dict__')
+        slot = isinstance(namespace.get(key), _hidden_builtins.MemberDescriptorType)
+        if static and slot:
+            raise AttributeError(f"'{key}' is stored in the slots of '{cls_data.name}' instances "
+                                 f"and can't be made a class attribute.")
+        if static:
+            flags |= _data.STATIC
+
+        # change value in class data, and in the class namespace for static fields and methods:
+        abs_locked = cls_data.abs_locked
+        cls_data.update([(key, value, flags)])
+        if static or (key not in cls_data.layout):
+            type.__setattr__(cls, key, value)
+        elif (key in namespace) and not slot:
+            type.__delattr__(cls, key)
+
+        # only fields of instances and a few methods are compiled into the generated methods:
+        if (key in REBUILD_KEYS) or (key in cls_data.layout):
+            MultiMeta.__invalidate(cls)
+            return
+        if cls_data.abs_locked != abs_locked:
+            MultiMeta.__build_constructor(cls)
+        MultiMeta.__propagate(cls, key)
 
     def __repr__(cls):
         """
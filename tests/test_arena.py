@@ -0,0 +1,81 @@
+import ctypes
+
+import pytest
+
+from multitools.external import Arena, Int, Str
+
+
+def test_released_memory_is_reused_zeroed():
+    arena = Arena(64)
+    with arena:
+        values = arena.alloc(ctypes.c_int, 4)
+        values[0] = 7
+        values[3] = 9
+        assert arena.used == 16
+    assert arena.used == 0
+
+    with arena:
+        again = arena.alloc(ctypes.c_int, 4)
+        assert ctypes.addressof(again) == ctypes.addressof(values)
+        assert list(again) == [0, 0, 0, 0]
+
+
+def test_nested_blocks_release_their_own_allocations():
+    arena = Arena(64)
+    with arena:
+        outer = arena.alloc(Int)
+        outer.handle.value = 5
+        with arena:
+            arena.alloc(Int)
+            arena.string("inner")
+        assert arena.used == 4
+        assert outer.value == 5
+
+
+def test_mark_and_rollback():
+    arena = Arena(64)
+    first = arena.string("first")
+    start = arena.mark()
+    arena.alloc(ctypes.c_double, 2)
+    arena.rollback(start)
+    assert arena.mark() == start
+    assert first.value == b"first"
+
+    with pytest.raises(ValueError):
+        arena.rollback((start[0], start[1] + 8))
+    with pytest.raises(TypeError):
+        arena.rollback(3)
+
+
+def test_reset_merges_blocks():
+    arena = Arena(16)
+    cells = [arena.alloc(ctypes.c_longlong) for _ in range(8)]
+    assert arena.size > 16
+    assert all(cell.value == 0 for cell in cells)
+    size = arena.size
+    arena.reset()
+    assert arena.used == 0
+    assert arena.size == size
+    text = arena.string(b"x" * (size - 1))
+    assert text.value == b"x" * (size - 1)
+    assert arena.used == size
+
+
+def test_strings():
+    arena = Arena()
+    with arena:
+        assert arena.string("h\xe9llo", "latin-1").value == b"h\xe9llo"
+        assert arena.string(b"raw").value == b"raw"
+        assert isinstance(arena.string("text"), Str.__instance_type__)
+    with arena:
+        assert arena.string("ab").value == b"ab"  # null-terminated over the longer string
+
+
+def test_invalid_allocations():
+    arena = Arena()
+    with pytest.raises(ValueError):
+        arena.alloc(Int, 0)
+    with pytest.raises(TypeError):
+        arena.alloc(5)
+    with pytest.raises(TypeError):
+        arena.alloc([ctypes.c_int])
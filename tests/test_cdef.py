@@ -0,0 +1,100 @@
+import ctypes.util
+
+import pytest
+
+from multitools.external import Library, Str, Char, Int, Size_t, Double
+from multitools.external._types import Ptr
+from multitools.external import _cdef
+
+
+def _signature(source, typedefs=None):
+    (signature,) = _cdef.signatures(_cdef.parse(source), {} if typedefs is None else typedefs)
+    return signature
+
+
+def test_parse():
+    typedef, proto = _cdef.parse("""
+        #include <string.h>
+        typedef unsigned long long handle_t; /* a comment */
+        static inline unsigned short int count(const char *text, long values[16]); // another
+    """)
+    assert typedef == _cdef.Typedef('handle_t', 'unsigned long long')
+    assert proto == _cdef.Prototype('count', 'unsigned short', ('const char*', 'long*'))
+    assert _cdef.parse("void f(void);") == (_cdef.Prototype('f', 'void', ()),)
+
+
+def test_strings_keep_their_constness():
+    name, restype, argtypes = _signature("char* copy(char* dst, const char* src, char c);")
+    assert name == 'copy'
+    assert restype.__tpname__ == 'char*' and not restype.const
+    dst, src, c = argtypes
+    assert Str in dst.__mro__ and not dst.const
+    assert src is Str and src.const
+    assert c is Char
+    assert _signature("int f(char const* text);")[2][0] is Str
+
+
+def test_restrict_is_ignored():
+    assert _signature("void f(char* restrict dst, const int* __restrict src);") == \
+        _signature("void f(char* dst, const int* src);")
+
+
+def test_pointer_depth():
+    _, restype, (strings, values, data) = _signature("void** f(char** strings, int*** values, void* data);")
+    assert restype is Ptr[Ptr]
+    assert strings is Ptr[_cdef.resolve('char*', {})]
+    assert values is Ptr[Ptr[Ptr[Int]]]
+    assert data is Ptr
+    assert _cdef.resolve('void', {}) is None
+
+
+def test_typedefs():
+    typedefs = {}
+    _, restype, argtypes = _signature("""
+        typedef const char* name_t;
+        typedef name_t* names_t;
+        typedef double real;
+        real f(name_t, names_t, size_t);
+    """, typedefs)
+    assert restype is Double
+    assert argtypes == (Str, Ptr[Str], Size_t)
+    assert typedefs == {'name_t': 'const char*', 'names_t': 'name_t*', 'real': 'double'}
+    assert _signature("name_t g(void);", typedefs)[1] is Str  # typedefs are kept between calls
+
+    with pytest.raises(ValueError):
+        _cdef.resolve('loop', {'loop': 'loop*'})
+    with pytest.raises(ValueError):
+        _cdef.signatures(_cdef.parse("typedef unknown_t other_t;"), {})
+
+
+@pytest.mark.parametrize("source", [
+    "int printf(const char* format, ...);",
+    "int f(struct point p);",
+    "struct point f(int);",
+    "void qsort(void* base, size_t n, size_t size, int (*compare)(const void*, const void*));",
+    "void (*handler(int))(int);",
+    "typedef int (*callback)(int);",
+    "int f(unknown_t value);",
+    "int f(void, int);",
+    "int x;",
+])
+def test_rejected_declarations(source):
+    with pytest.raises(ValueError):
+        _cdef.signatures(_cdef.parse(source), {})
+
+
+def test_opaque_structures_by_pointer():
+    assert _signature("struct file* open_file(const struct file* f);")[1:] == (Ptr, (Ptr,))
+
+
+def test_python_values_are_converted():
+    name = ctypes.util.find_library("c")
+    if name is None:
+        pytest.skip("the C library can't be found")
+    libc = Library.load(name)
+    libc.cdef("int abs(int); size_t strlen(const char*); void* memset(char*, int, size_t);")
+    assert libc.abs(-3).value == 3
+    assert libc.strlen("text").value == 4
+    data = bytearray(b"abc\x00")
+    libc.memset(data, ord("z"), 2)
+    assert data == b"zzc\x00"
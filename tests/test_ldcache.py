@@ -0,0 +1,142 @@
+import os
+import struct
+
+import pytest
+
+from multitools.system import _ldcache
+
+
+LIBC6 = 0x0003
+X86_64 = 0x0300
+AARCH64 = 0x0a00
+
+
+def _strings(entries, base):
+    """
+    Return the string table of entries, and the offsets of their
+    sonames and paths from base.
+    """
+    table = b""
+    offsets = []
+    for _, soname, path in entries:
+        key = base + len(table)
+        table += soname.encode() + b"\x00"
+        value = base + len(table)
+        table += path.encode() + b"\x00"
+        offsets.append((key, value))
+    return table, offsets
+
+
+def _new_cache(entries, prefix="<"):
+    """
+    Return a cache in the glibc 2.32 format, in the byteorder of prefix.
+    """
+    header = struct.Struct(prefix + _ldcache._NEW_HEADER)
+    entry = struct.Struct(prefix + _ldcache._NEW_ENTRY)
+    table, offsets = _strings(entries, header.size + len(entries) * entry.size)
+    data = header.pack(_ldcache._NEW_MAGIC, len(entries), len(table), 3 if prefix == ">" else 2, 0)
+    for (flags, _, _), (key, value) in zip(entries, offsets):
+        data += entry.pack(flags, key, value, 0, 0)
+    return data + table
+
+
+def _old_cache(entries, new_entries=None):
+    """
+    Return a cache in the format of glibc up to 2.31, followed by
+    a cache in the new format if new_entries are given.
+    """
+    header = _ldcache._OLD_MAGIC.ljust(12, b"\x00") + struct.pack("=I", len(entries))
+    strings = len(header) + len(entries) * _ldcache._OLD_ENTRY.size
+    hidden = b""
+    if new_entries is not None:
+        # the new format is hidden at the start of the strings of the old one:
+        hidden = b"\x00" * (-strings % 8) + _new_cache(new_entries)
+    table, offsets = _strings(entries, len(hidden))
+    data = header
+    for (flags, _, _), (key, value) in zip(entries, offsets):
+        data += _ldcache._OLD_ENTRY.pack(flags, key, value)
+    return data + hidden + table
+
+
+ENTRIES = [
+    (LIBC6 | X86_64, "libfoo.so.2", "/lib64/libfoo.so.2"),
+    (LIBC6 | AARCH64, "libfoo.so.3", "/lib/aarch64/libfoo.so.3"),
+    (LIBC6 | X86_64, "libfoo.so.1", "/lib64/libfoo.so.1"),
+    (LIBC6 | X86_64, "libfoo.so.1", "/usr/lib64/libfoo.so.1"),
+    (0x0001 | X86_64, "libbar.so.1", "/lib64/libc5/libbar.so.1"),
+    (LIBC6 | X86_64, "libbar.so.1.10", "/lib64/libbar.so.1.10"),
+    (LIBC6 | X86_64, "libbar.so.1.9", "/lib64/libbar.so.1.9"),
+]
+
+
+def _write(tmp_path, data):
+    path = tmp_path / "ld.so.cache"
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.mark.parametrize("data", [
+    _new_cache(ENTRIES),
+    _new_cache(ENTRIES, ">"),
+    _old_cache(ENTRIES),
+    _old_cache([(LIBC6, "libold.so.1", "/lib/libold.so.1")], ENTRIES),
+], ids=["new", "new big endian", "old", "old and new"])
+def test_read_cache(tmp_path, data):
+    assert _ldcache.read_cache(_write(tmp_path, data)) == ENTRIES
+
+
+def test_invalid_caches(tmp_path):
+    assert _ldcache.read_cache(str(tmp_path / "missing")) == []
+    assert _ldcache.read_cache(_write(tmp_path, b"not a cache")) == []
+    assert _ldcache.read_cache(_write(tmp_path, _new_cache(ENTRIES)[:30])) == []
+    assert _ldcache.read_cache(_write(tmp_path, _old_cache(ENTRIES)[:20])) == []
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """
+    Make the lookups of find_library use a synthetic x86_64 cache,
+    without any LD_LIBRARY_PATH.
+    """
+    monkeypatch.setattr(_ldcache, "CACHE_PATH", _write(tmp_path, _new_cache(ENTRIES)))
+    monkeypatch.setattr(_ldcache, "_arch_flag", lambda: X86_64)
+    monkeypatch.delenv("LD_LIBRARY_PATH", raising=False)
+    _ldcache.clear_cache()
+    yield
+    _ldcache.clear_cache()
+
+
+def test_find_by_soname(cache):
+    assert _ldcache.find_library("libfoo.so.1") == "/lib64/libfoo.so.1"  # first entry wins
+    assert _ldcache.find_library("libfoo.so.3") is None  # built for another architecture
+    assert _ldcache.find_library("libbar.so.1") is None  # not a libc6 library
+    assert _ldcache.find_library("/opt/libfoo.so") == "/opt/libfoo.so"
+
+
+def test_short_names_take_the_highest_version(cache):
+    assert _ldcache.find_library("foo") == "/lib64/libfoo.so.2"
+    assert _ldcache.find_library("bar") == "/lib64/libbar.so.1.10"
+    assert _ldcache.find_library("baz") is None
+
+
+def test_unknown_architecture_keeps_all_entries(cache, monkeypatch):
+    monkeypatch.setattr(_ldcache, "_arch_flag", lambda: None)
+    _ldcache.clear_cache()
+    assert _ldcache.find_library("libfoo.so.3") == "/lib/aarch64/libfoo.so.3"
+    assert _ldcache.find_library("foo") == "/lib/aarch64/libfoo.so.3"
+
+
+def test_ld_library_path_fallback(cache, tmp_path, monkeypatch):
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    for name in ("libbaz.so.1", "libbaz.so.1.2", "libbaz.so.10", "libother.so"):
+        (second / name).touch()
+    monkeypatch.setenv("LD_LIBRARY_PATH", os.pathsep.join(["", str(tmp_path / "missing"), str(first), str(second)]))
+
+    assert _ldcache.find_library("baz") == str(second / "libbaz.so.10")
+    assert _ldcache.find_library("libbaz.so.1") == str(second / "libbaz.so.1")
+    assert _ldcache.find_library("libbaz.so.2") is None
+    assert _ldcache.find_library("foo") == "/lib64/libfoo.so.2"  # the cache comes first
+    (first / "libbaz.so.3").touch()
+    assert _ldcache.find_library("baz") == str(first / "libbaz.so.3")  # directories are searched in order
@@ -0,0 +1,61 @@
+import pytest
+
+from multitools2 import MultiMeta
+from multitools2._meta._field import FieldWrapper
+
+
+def _static(value):
+    wrapper = FieldWrapper(value)
+    wrapper.__static__ = True
+    return wrapper
+
+
+def test_setting_a_field_changes_its_default():
+    class A(metaclass=MultiMeta):
+        __fields__ = ["x"]
+        x = 1
+
+    class B(A):
+        pass
+
+    A.x = 7
+    assert A().x == 7
+    assert B().x == 7
+    assert "x" in A.__data__.instance_fields
+
+    B.x = 3
+    assert A().x == 7
+    assert B().x == 3
+
+
+def test_setting_other_attributes_keeps_them_static():
+    class A(metaclass=MultiMeta):
+        __fields__ = ["x"]
+
+    A.y = 2
+    assert A.y == 2
+    assert "y" in A.__data__.static_fields
+    A.x = _static(5)
+    assert A.x == 5
+
+
+def test_setting_a_slotted_field_keeps_its_slot():
+    class S(metaclass=MultiMeta, slots=True):
+        __fields__ = ["p", "q"]
+        p = 1
+        q = []
+
+    class T(S):
+        pass
+
+    S.p = 9
+    S.q = [1]
+    first, second = S(), S()
+    assert first.p == 9 and T().p == 9
+    assert first.q == [1] and first.q is not second.q
+    first.p = 4
+    assert first.p == 4 and second.p == 9
+
+    with pytest.raises(AttributeError):
+        S.p = _static(0)
+    assert S().p == 9
@@ -0,0 +1,57 @@
+import struct
+
+import pytest
+
+from multitools.external import Int, Short, Double, Struct, Array
+
+
+Point = Struct[('x', Int), ('y', Double)]
+Single = Struct[('a', Int)]
+BigInt = Int[False, 'big']
+
+
+@pytest.mark.parametrize("ctype, values", [
+    (Int, [1, -2, 3]),
+    (BigInt, [1, 2, 2 ** 32 - 1]),
+    (Short[True, 'little'], [-1, 2]),
+    (Double, [0.5, -1.25]),
+    (Point, [(1, 0.5), (-2, 1.5)]),
+    (Single, [(1,), (2,)]),
+    (Array[Int, 1], [(5,), (6,)]),
+    (Array[Int, 3], [(1, 2, 3), (4, 5, 6)]),
+    (Struct[('a', BigInt), ('b', Short[True, 'big'])], [(1, 2), (3, -4)]),
+])
+def test_round_trip(ctype, values):
+    data = ctype.pack(values)
+    assert len(data) == len(values) * ctype.__struct__().size
+    assert ctype.unpack(data) == values
+    assert list(ctype.iter_unpack(data)) == values
+    assert ctype.unpack(data, 0, 1) == values[:1]
+
+
+def test_byteorder():
+    assert BigInt.pack([1]) == b"\x00\x00\x00\x01"
+    assert Int[True, 'little'].pack([1]) == b"\x01\x00\x00\x00"
+    assert BigInt.unpack(b"\x00\x00\x01\x00") == [256]
+
+
+def test_pack_into_buffer():
+    size = Point.__struct__().size
+    buffer = bytearray(2 * size + 3)
+    assert Point.pack([(1, 0.5), (2, 1.5)], buffer, 3) == 2 * size
+    assert Point.unpack(buffer, 3) == [(1, 0.5), (2, 1.5)]
+    assert Single.pack([(7,)], buffer, 3) == 4
+    assert Single.unpack(buffer, 3, 1) == [(7,)]
+
+
+def test_short_buffer():
+    data = Point.pack([(1, 0.5)])
+    with pytest.raises(struct.error):
+        Point.unpack(data[:-1], 0, 1)
+    with pytest.raises(struct.error):
+        Int.unpack(b"\x00\x00", 0, 1)
+
+
+def test_mixed_byteorders():
+    with pytest.raises(TypeError):
+        Struct[('a', BigInt), ('b', Short[True, 'little'])].pack([(1, 2)])
@@ -0,0 +1,78 @@
+import ctypes.util
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from multitools.external import ProcessBoundLibrary, Pointer
+
+
+def _find(name):
+    path = ctypes.util.find_library(name)
+    if path is None:
+        pytest.skip(f"the '{name}' library can't be found")
+    return path
+
+
+@pytest.fixture(scope="module")
+def libm():
+    with ProcessBoundLibrary(_find("m"), "double cos(double); double pow(double, double);", workers=2) as lib:
+        yield lib
+
+
+@pytest.fixture
+def libc():
+    with ProcessBoundLibrary(_find("c"), "size_t strlen(const char*); int abs(int); void abort(void);",
+                             workers=1) as lib:
+        yield lib
+
+
+def test_submit_and_call(libm):
+    future = libm.submit("pow", 2.0, 10.0)
+    assert libm.call("cos", 0.0).value == 1.0
+    assert libm.cos(0.0, affinity="key").value == 1.0
+    assert future.result().value == 1024.0
+    assert libm.workers == 2
+
+
+def test_map(libm):
+    results = libm.map("pow", [(2.0, float(i)) for i in range(100)])
+    assert [result.value for result in results] == [2.0 ** i for i in range(100)]
+    assert libm.map("cos", [(0.0,)] * 3, affinity=1)[-1].value == 1.0
+
+
+def test_text_arguments(libc):
+    assert libc.strlen("h\xe9llo").value == len("h\xe9llo".encode())
+    assert libc.strlen(b"bytes").value == 5
+
+
+def test_invalid_calls(libc):
+    with pytest.raises(NameError):
+        libc.submit("cos", 0.0)
+    with pytest.raises(AttributeError):
+        libc.cos
+    with pytest.raises(TypeError):
+        libc.abs(1, 2)
+    with pytest.raises(TypeError):
+        libc.strlen(Pointer(0))  # addresses can't be passed to the workers
+
+
+def test_crashed_worker_is_restarted(libc):
+    with pytest.raises(BrokenProcessPool):
+        libc.abort()
+    assert libc.abs(-7).value == 7
+
+
+def test_pointer_results_are_rejected():
+    path = _find("c")
+    with pytest.raises(TypeError):
+        ProcessBoundLibrary(path, "void* malloc(size_t);", workers=1)
+    with pytest.raises(TypeError):
+        ProcessBoundLibrary(path, "int* __errno_location(void);", workers=1)
+
+
+def test_closed_library():
+    lib = ProcessBoundLibrary(_find("c"), "int abs(int);", workers=1)
+    lib.close()
+    lib.close()
+    with pytest.raises(RuntimeError):
+        lib.abs(1)
@@ -0,0 +1,63 @@
+import ctypes.util
+
+import pytest
+
+from multitools.external import Library, Str
+from multitools.external._types import _encode
+
+
+@pytest.fixture(scope="module")
+def libc():
+    name = ctypes.util.find_library("c")
+    if name is None:
+        pytest.skip("the C library can't be found")
+    lib = Library.load(name)
+    lib.cdef("size_t strlen(const char*); void* memset(char*, int, size_t); int toupper(char);")
+    return lib
+
+
+def test_cdef_keeps_constness(libc):
+    assert libc.strlen._argtypes[0].const
+    assert not libc.memset._argtypes[0].const
+    assert libc.memset._argtypes[0].__tpname__ == "char*"
+
+
+def test_const_str_is_shared(libc):
+    assert libc.strlen("hello").value == 5
+    assert _encode("hello", Str.encoding) is _encode("hello", Str.encoding)
+
+
+def _memset_args(libc, value, count):
+    _, char, size = libc.memset._argtypes
+    return char(value), size(count)
+
+
+def test_mutable_str_gets_a_copy(libc):
+    encoded = _encode("hello", Str.encoding)
+    libc.memset("hello", *_memset_args(libc, ord("x"), 5))
+    assert encoded == b"hello"
+    assert _encode("hello", Str.encoding) == b"hello"
+
+    data = b"world"
+    libc.memset(data, *_memset_args(libc, ord("x"), 5))
+    assert data == b"world"
+
+
+def test_mutable_str_shares_bytearray(libc):
+    data = bytearray(b"abc\x00")
+    libc.memset(data, *_memset_args(libc, ord("z"), 3))
+    assert data == b"zzz\x00"
+
+
+def test_char_takes_bytearray(libc):
+    assert libc.toupper(bytearray(b"a")).value == ord("A")
+    assert libc.toupper(bytearray(b"\x00")).value == 0
+    assert libc.toupper(b"b").value == ord("B")
+    assert libc.toupper("c").value == ord("C")
+
+
+def test_str_instances():
+    assert Str("text").value == b"text"
+    mutable = Str[Str.encoding, False]
+    assert not mutable.const and Str.const
+    assert mutable("text").value == b"text"
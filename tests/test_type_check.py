@@ -0,0 +1,101 @@
+import pytest
+
+from multitools import _type_check
+from multitools._type_check import (
+    typecheck, typecheck_many, Checker, set_policy, get_policy,
+    check_stats, reset_check_stats, FULL, SAMPLED, OFF,
+)
+from multitools.io import BytesBuffer, BytesIO
+
+
+@pytest.fixture(autouse=True)
+def policy():
+    """
+    Restore the global policy and remove the overrides set by a test.
+    """
+    saved = get_policy()
+    reset_check_stats()
+    yield
+    for module in list(_type_check._policy.overrides):
+        set_policy(None, module=module)
+    set_policy(*saved)
+
+
+def _bad_call():
+    typecheck(1, (str,), target_name="value")
+
+
+def _failures(func, count):
+    failures = 0
+    for _ in range(count):
+        try:
+            func()
+        except TypeError:
+            failures += 1
+    return failures
+
+
+def test_full():
+    with pytest.raises(TypeError, match="'value': Expected type 'str', got 'int' instead."):
+        _bad_call()
+    assert check_stats() == {'performed': 1, 'skipped': 0}
+
+
+def test_off_skips_checks():
+    set_policy(OFF)
+    _bad_call()
+    typecheck_many([1, "a"], (int,), target_name="values")
+    Checker((str,), "value")(1)
+    assert check_stats() == {'performed': 0, 'skipped': 3}
+
+
+def test_sampled_eventually_checks():
+    set_policy(SAMPLED, 10)
+    assert _failures(_bad_call, 30) == 3
+    checker = Checker((str,), "value")
+    assert _failures(lambda: checker(1), 30) == 3
+    assert check_stats() == {'performed': 6, 'skipped': 54}
+
+
+def test_module_overrides():
+    set_policy(OFF)
+    set_policy(FULL, module=__name__)
+    assert get_policy(__name__) == (FULL, _type_check.DEFAULT_SAMPLE_RATE)
+    with pytest.raises(TypeError):
+        _bad_call()
+    with pytest.raises(TypeError):
+        Checker((str,), "value")(1)
+    Checker((str,), "value", module="other")(1)
+
+    set_policy(FULL, module="package")
+    set_policy(OFF, module="package.skipped")
+    assert get_policy("package.module") == get_policy("package")
+    with pytest.raises(TypeError):
+        Checker((str,), "value", module="package.module")(1)
+    Checker((str,), "value", module="package.skipped.module")(1)
+
+    set_policy(None, module=__name__)
+    assert get_policy(__name__) == (OFF, _type_check.DEFAULT_SAMPLE_RATE)
+    _bad_call()
+
+
+def test_shared_checkers_use_the_calling_module():
+    set_policy(OFF, module="multitools.io._buffer")
+    with pytest.raises(TypeError, match="'data': Expected type 'bytes'"):
+        BytesIO(BytesBuffer()).write(1)  # checked in _stream
+    with pytest.raises(TypeError, match="can't concat"):
+        BytesBuffer().write(1)  # the same checker is skipped in _buffer
+    set_policy(OFF, module="multitools.io")
+    with pytest.raises(TypeError, match="can't concat"):
+        BytesIO(BytesBuffer()).write(1)
+
+
+def test_invalid_policies():
+    with pytest.raises(ValueError):
+        set_policy("sometimes")
+    with pytest.raises(ValueError):
+        set_policy(None)
+    with pytest.raises(ValueError):
+        set_policy(SAMPLED, 0)
+    with pytest.raises(TypeError):
+        set_policy(FULL, module=3)
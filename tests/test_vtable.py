@@ -0,0 +1,60 @@
+import ctypes
+import ctypes.util
+
+import pytest
+
+from multitools.external import Library, Int, NULL
+from multitools.errors import NullReferenceError
+
+
+@pytest.fixture(scope="module")
+def libc():
+    name = ctypes.util.find_library("c")
+    if name is None:
+        pytest.skip("the C library can't be found")
+    return Library.load(name)
+
+
+@pytest.fixture(scope="module")
+def table(libc):
+    """
+    A table of function pointers to libc functions, with a NULL entry.
+    """
+    cdll = ctypes.CDLL(ctypes.util.find_library("c"))
+    functions = [ctypes.cast(getattr(cdll, name), ctypes.c_void_p).value for name in ("abs", "labs")]
+    return (ctypes.c_void_p * 3)(*functions, None)
+
+
+def test_bind_vtable(libc, table):
+    vtable = libc.bind_vtable(ctypes.addressof(table), "int abs(int); long labs(long); int missing(int);")
+    assert vtable.address == ctypes.addressof(table)
+    assert list(vtable) == ["abs", "labs", "missing"] and len(vtable) == 3
+    assert vtable.abs(-3).value == 3
+    assert vtable["labs"](-4).value == 4
+    assert vtable.missing is NULL
+    with pytest.raises(NullReferenceError):
+        vtable.missing(1)
+    with pytest.raises(KeyError):
+        vtable["address"]
+
+    vtable = libc.bind_vtable(ctypes.addressof(table), [("first", Int, (Int,))])
+    assert vtable.first(-5).value == 5
+
+
+@pytest.mark.parametrize("layout", [
+    "int address(int);",
+    "int abs(int); int __len__(int);",
+    "int _vtable_names(int);",
+    "int abs(int); long abs(long);",
+    (("__getitem__", Int, (Int,)),),
+])
+def test_conflicting_names(libc, table, layout):
+    with pytest.raises(ValueError):
+        libc.bind_vtable(ctypes.addressof(table), layout)
+
+
+def test_invalid_tables(libc):
+    with pytest.raises(NullReferenceError):
+        libc.bind_vtable(0, "int abs(int);")
+    with pytest.raises(ValueError):
+        libc.bind_vtable(1, ())